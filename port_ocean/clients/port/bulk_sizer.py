@@ -0,0 +1,73 @@
+import time
+
+from loguru import logger
+from starlette import status
+
+# Bulks slower than this are considered too large for the current load of Port
+BULK_TARGET_LATENCY_SECONDS = 5.0
+BULK_LENGTH_DECREASE_FACTOR = 0.5
+BULK_LENGTH_INCREASE_STEP = 2
+BULK_MINIMUM_LENGTH = 1
+# Status codes that indicate Port is overloaded, the bulks are made smaller until they succeed again
+OVERLOAD_STATUS_CODES = frozenset(
+    [
+        status.HTTP_429_TOO_MANY_REQUESTS,
+        status.HTTP_502_BAD_GATEWAY,
+        status.HTTP_503_SERVICE_UNAVAILABLE,
+        status.HTTP_504_GATEWAY_TIMEOUT,
+    ]
+)
+
+
+class AdaptiveBulkSizer:
+    """Tunes the bulk upsert length and size of a single blueprint from the observed responses.
+
+    Bulks that are slower than the target latency or are rejected because Port is overloaded halve the bulk length,
+    while fast full bulks grow it back by a small step up to the configured maximum. The bulks that were sent
+    concurrently before a decrease are slowed down by the same episode, so only the first of them decreases the length.
+    A 413 response means the bulk exceeded the size Port accepts, so the size limit is lowered to half of the rejected
+    bulk and stays there.
+
+    Args:
+        max_length: The maximum number of entities in a bulk.
+        max_size_in_bytes: The maximum size of a bulk request body.
+    """
+
+    def __init__(self, max_length: int, max_size_in_bytes: int) -> None:
+        self.max_length = max_length
+        self.length = max_length
+        self.max_size_in_bytes = max_size_in_bytes
+        self._last_decrease = 0.0
+
+    def record_success(
+        self, bulk_length: int, latency: float, started_at: float
+    ) -> None:
+        if latency > BULK_TARGET_LATENCY_SECONDS:
+            self._decrease(f"took {latency:.2f}s", started_at)
+        elif bulk_length >= self.length:
+            self.length = min(self.max_length, self.length + BULK_LENGTH_INCREASE_STEP)
+
+    def record_error(
+        self, bulk_length: int, bulk_size: int, status_code: int, started_at: float
+    ) -> None:
+        if status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE:
+            self.max_size_in_bytes = max(1, min(self.max_size_in_bytes, bulk_size // 2))
+            self.length = max(BULK_MINIMUM_LENGTH, min(self.length, bulk_length // 2))
+            logger.info(
+                f"Bulk of {bulk_length} entities ({bulk_size} bytes) was too large, limiting bulks to "
+                f"{self.length} entities and {self.max_size_in_bytes} bytes"
+            )
+        elif status_code in OVERLOAD_STATUS_CODES:
+            self._decrease(f"failed with status {status_code}", started_at)
+
+    def _decrease(self, reason: str, started_at: float) -> None:
+        # Bulks that were sent before the last decrease were sent with the previous length, only the first counts
+        if started_at < self._last_decrease:
+            return
+        self._last_decrease = time.monotonic()
+        self.length = max(
+            BULK_MINIMUM_LENGTH, int(self.length * BULK_LENGTH_DECREASE_FACTOR)
+        )
+        logger.info(
+            f"Bulk upsert {reason}, decreasing the bulk length to {self.length}"
+        )
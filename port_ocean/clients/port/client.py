@@ -13,6 +13,7 @@ from port_ocean.clients.port.utils import (
     handle_port_status_code,
     get_internal_http_client,
 )
+from port_ocean.config.settings import PortConcurrencySettings
 from port_ocean.exceptions.clients import KafkaCredentialsNotFound
 from typing import Any
 
@@ -32,6 +33,7 @@ class PortClient(
         integration_identifier: str,
         integration_type: str,
         integration_version: str,
+        concurrency_settings: PortConcurrencySettings | None = None,
     ):
         self.api_url = f"{base_url}/v1"
         self.client = get_internal_http_client(self)
@@ -44,7 +46,7 @@ class PortClient(
             integration_type,
             integration_version,
         )
-        EntityClientMixin.__init__(self, self.auth, self.client)
+        EntityClientMixin.__init__(self, self.auth, self.client, concurrency_settings)
         IntegrationClientMixin.__init__(
             self, integration_identifier, integration_version, self.auth, self.client
         )
@@ -0,0 +1,200 @@
+import asyncio
+import time
+from collections import deque
+from types import TracebackType
+from typing import Type
+
+import httpx
+from loguru import logger
+from starlette import status
+
+from port_ocean.config.settings import PortConcurrencySettings
+from port_ocean.context.ocean import ocean
+from port_ocean.helpers.metric.metric import MetricPhase, MetricType
+
+# The lowest observed latency slowly drifts towards the recent latencies, so a lasting change in Port's latency
+# isn't mistaken for load forever
+BASELINE_LATENCY_DRIFT = 0.01
+
+
+def is_overload_status(status_code: int) -> bool:
+    return (
+        status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        or status_code >= status.HTTP_500_INTERNAL_SERVER_ERROR
+    )
+
+
+class ConcurrencySlot:
+    """A single request sent to Port under the concurrency limiter.
+
+    The time the slot is held is the latency of the request, and the status recorded with `record_response` tells the
+    limiter whether Port is overloaded. The latency of a slot that doesn't `measure_latency`, e.g. of a search that is
+    slower than the upserts by nature, isn't compared with the baseline latency, only its status is.
+    """
+
+    def __init__(
+        self, limiter: "AdaptiveConcurrencyLimiter", measure_latency: bool = True
+    ) -> None:
+        self._limiter = limiter
+        self._measure_latency = measure_latency
+        self._start = 0.0
+        self.status_code: int | None = None
+
+    def record_response(self, response: httpx.Response) -> None:
+        self.status_code = response.status_code
+
+    async def __aenter__(self) -> "ConcurrencySlot":
+        await self._limiter._acquire()
+        self._start = time.monotonic()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._limiter._release(
+            self._start, self.status_code, exc, self._measure_latency
+        )
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limits the number of concurrent requests to Port, adapting the limit with AIMD.
+
+    While the latency of the requests stays within `latency_tolerance` of the lowest observed latency and the limit
+    is in use, the limit grows additively by about one per limit's worth of requests. Slower requests shrink it by
+    the same step. A rate limit, a server error or a timeout multiplies it by `backoff_factor`, once for all the
+    requests that were already in flight when it happened.
+    When the limiter isn't enabled the limit stays at `initial_limit`, like a semaphore.
+
+    The current limit and the time spent waiting for a slot are reported as metrics.
+
+    Usage:
+    ```python
+        async with limiter.acquire() as slot:
+            response = await client.post(...)
+            slot.record_response(response)
+    ```
+    """
+
+    def __init__(self, settings: PortConcurrencySettings) -> None:
+        self.enabled = settings.enabled
+        self.min_limit = settings.min_limit
+        self.max_limit = max(settings.min_limit, settings.max_limit)
+        self.latency_tolerance = settings.latency_tolerance
+        self.backoff_factor = settings.backoff_factor
+        self._limit = float(
+            min(self.max_limit, max(self.min_limit, settings.initial_limit))
+        )
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._baseline_latency: float | None = None
+        self._last_decrease = 0.0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self, measure_latency: bool = True) -> ConcurrencySlot:
+        return ConcurrencySlot(self, measure_latency)
+
+    async def _acquire(self) -> None:
+        if not self._waiters and self._in_flight < self.limit:
+            self._in_flight += 1
+            self._report_wait(0)
+            return
+
+        start = time.monotonic()
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just before the cancellation, pass it on
+                self._in_flight -= 1
+                self._wake_waiters()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
+        self._report_wait(time.monotonic() - start)
+
+    def _release(
+        self,
+        start: float,
+        status_code: int | None,
+        exc: BaseException | None,
+        measure_latency: bool = True,
+    ) -> None:
+        self._in_flight -= 1
+        if self.enabled:
+            self._adapt(
+                start, time.monotonic() - start, status_code, exc, measure_latency
+            )
+        self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+    def _adapt(
+        self,
+        start: float,
+        latency: float,
+        status_code: int | None,
+        exc: BaseException | None,
+        measure_latency: bool = True,
+    ) -> None:
+        if isinstance(exc, httpx.TimeoutException) or (
+            status_code is not None and is_overload_status(status_code)
+        ):
+            # Requests that were sent before the last decrease saw the previous limit, only the first of them counts
+            if start >= self._last_decrease:
+                self._set_limit(self._limit * self.backoff_factor)
+                self._last_decrease = time.monotonic()
+                logger.info(
+                    f"Port is overloaded (status: {status_code}, error: {type(exc).__name__ if exc else None}), "
+                    f"decreasing the concurrency limit to {self.limit}"
+                )
+            return
+        if exc is not None or not measure_latency:
+            return
+
+        if self._baseline_latency is None or latency < self._baseline_latency:
+            self._baseline_latency = latency
+        else:
+            self._baseline_latency += (
+                latency - self._baseline_latency
+            ) * BASELINE_LATENCY_DRIFT
+
+        step = 1 / self._limit
+        if latency > self._baseline_latency * self.latency_tolerance:
+            self._set_limit(self._limit - step)
+        elif self._in_flight + 1 >= self.limit:
+            # The limit only grows while it is in use, otherwise nothing was learned about a higher limit
+            self._set_limit(self._limit + step)
+
+    def _set_limit(self, limit: float) -> None:
+        self._limit = min(self.max_limit, max(self.min_limit, limit))
+        if ocean.initialized:
+            ocean.metrics.set_metric(
+                name=MetricType.PORT_CONCURRENCY_LIMIT_NAME,
+                labels=[ocean.metrics.current_resource_kind(), MetricPhase.LOAD],
+                value=self.limit,
+            )
+
+    def _report_wait(self, waited_seconds: float) -> None:
+        if ocean.initialized:
+            ocean.metrics.inc_metric(
+                name=MetricType.PORT_CONCURRENCY_WAIT_NAME,
+                labels=[ocean.metrics.current_resource_kind(), MetricPhase.LOAD],
+                value=waited_seconds,
+            )
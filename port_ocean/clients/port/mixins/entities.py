@@ -1,17 +1,18 @@
 import asyncio
-from typing import Any, Literal
+import time
+from contextlib import nullcontext
+from typing import Any, AsyncIterator, Literal
 from urllib.parse import quote_plus
-import json
 
 import httpx
 from loguru import logger
 from port_ocean.context.ocean import ocean
 from port_ocean.clients.port.authentication import PortAuthentication
+from port_ocean.clients.port.bulk_sizer import AdaptiveBulkSizer
+from port_ocean.clients.port.concurrency_limiter import AdaptiveConcurrencyLimiter
 from port_ocean.clients.port.types import RequestOptions, UserAgentType
-from port_ocean.clients.port.utils import (
-    handle_port_status_code,
-    PORT_HTTP_MAX_CONNECTIONS_LIMIT,
-)
+from port_ocean.config.settings import PortConcurrencySettings
+from port_ocean.clients.port.utils import handle_port_status_code
 from port_ocean.core.models import (
     BulkUpsertResponse,
     Entity,
@@ -19,23 +20,39 @@ from port_ocean.core.models import (
 )
 from starlette import status
 
+from port_ocean.core.utils.entity_keys import EntityKey, make_entity_key
+from port_ocean.core.utils.entity_serialization import dumps, serialize_entity
 from port_ocean.helpers.metric.metric import MetricPhase, MetricType
 
 ENTITIES_BULK_SAMPLES_SIZE = 10
 ENTITIES_BULK_ESTIMATED_SIZE_MULTIPLIER = 1.5
 ENTITIES_BULK_MINIMUM_BATCH_SIZE = 1
+ENTITIES_BULK_BODY_PREFIX = b'{"entities":['
+ENTITIES_BULK_BODY_SUFFIX = b"]}"
+# Bulk deletions rejected with these statuses, because bulk deletion isn't available or the request is too large, are
+# deleted entity by entity instead
+BULK_DELETE_FALLBACK_STATUS_CODES = (
+    status.HTTP_404_NOT_FOUND,
+    status.HTTP_405_METHOD_NOT_ALLOWED,
+    status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+)
 
 
 class EntityClientMixin:
-    def __init__(self, auth: PortAuthentication, client: httpx.AsyncClient):
+    def __init__(
+        self,
+        auth: PortAuthentication,
+        client: httpx.AsyncClient,
+        concurrency_settings: PortConcurrencySettings | None = None,
+    ):
         self.auth = auth
         self.client = client
-        # Semaphore is used to limit the number of concurrent requests to port, to avoid overloading it.
-        # The number of concurrent requests is set to 90% of the max connections limit, to leave some room for other
-        # requests that are not related to entities.
-        self.semaphore = asyncio.Semaphore(
-            round(0.5 * PORT_HTTP_MAX_CONNECTIONS_LIMIT)
-        )  # 50% of the max connections limit in order to avoid overloading port
+        # Limits the number of concurrent entity requests to port to avoid overloading it. By default the limit is
+        # fixed to 50% of the max connections limit, leaving room for requests that are not related to entities
+        self.concurrency_limiter = AdaptiveConcurrencyLimiter(
+            concurrency_settings or PortConcurrencySettings()
+        )
+        self._bulk_sizers: dict[str, AdaptiveBulkSizer] = {}
 
     def calculate_entities_batch_size(self, entities: list[Entity]) -> int:
         """
@@ -54,24 +71,45 @@ class EntityClientMixin:
         SAMPLE_SIZE = min(ENTITIES_BULK_SAMPLES_SIZE, len(entities))
         sample_entities = entities[:SAMPLE_SIZE]
         average_entity_size = (
-            sum(
-                len(json.dumps(entity.dict(exclude_unset=True, by_alias=True)).encode())
-                for entity in sample_entities
-            )
+            sum(len(serialize_entity(entity)) for entity in sample_entities)
+            / SAMPLE_SIZE
+        )
+
+        return self._calculate_batch_size(average_entity_size)
+
+    def calculate_entities_delete_batch_size(self, entities: list[Entity]) -> int:
+        """
+        Calculate the batch size of a bulk delete, the same way as for upserts but based on the identifiers
+        that are sent in the request instead of the whole entities.
+
+        Args:
+            entities: List of entities to calculate batch size for
+
+        Returns:
+            int: The optimal batch size to use
+        """
+        if not entities:
+            return ENTITIES_BULK_MINIMUM_BATCH_SIZE
+
+        SAMPLE_SIZE = min(ENTITIES_BULK_SAMPLES_SIZE, len(entities))
+        average_identifier_size = (
+            sum(len(dumps(entity.identifier)) for entity in entities[:SAMPLE_SIZE])
             / SAMPLE_SIZE
         )
+        return self._calculate_batch_size(average_identifier_size)
 
+    @staticmethod
+    def _calculate_batch_size(average_item_size: float) -> int:
         # Use a conservative estimate to ensure we stay under the limit
-        estimated_entity_size = int(
-            average_entity_size * ENTITIES_BULK_ESTIMATED_SIZE_MULTIPLIER
+        estimated_item_size = max(
+            1, int(average_item_size * ENTITIES_BULK_ESTIMATED_SIZE_MULTIPLIER)
         )
-        max_entities_per_batch = min(
+        max_items_per_batch = min(
             ocean.config.upsert_entities_batch_max_length,
-            ocean.config.upsert_entities_batch_max_size_in_bytes
-            // estimated_entity_size,
+            ocean.config.upsert_entities_batch_max_size_in_bytes // estimated_item_size,
         )
 
-        return max(ENTITIES_BULK_MINIMUM_BATCH_SIZE, max_entities_per_batch)
+        return max(ENTITIES_BULK_MINIMUM_BATCH_SIZE, max_items_per_batch)
 
     async def upsert_entity(
         self,
@@ -101,14 +139,17 @@ class EntityClientMixin:
         :return: [False] will be returned if upsert failed because of unmet dependency
         """
         validation_only = request_options["validation_only"]
-        async with self.semaphore:
+        async with self.concurrency_limiter.acquire() as slot:
             logger.debug(
                 f"{'Validating' if validation_only else 'Upserting'} entity: {entity.identifier} of blueprint: {entity.blueprint}"
             )
-            headers = await self.auth.headers(user_agent_type)
+            headers = {
+                **await self.auth.headers(user_agent_type),
+                "Content-Type": "application/json",
+            }
             response = await self.client.post(
                 f"{self.auth.api_url}/blueprints/{entity.blueprint}/entities",
-                json=entity.dict(exclude_unset=True, by_alias=True),
+                content=serialize_entity(entity),
                 headers=headers,
                 params={
                     "upsert": "true",
@@ -120,6 +161,7 @@ class EntityClientMixin:
                 },
                 extensions={"retryable": True},
             )
+            slot.record_response(response)
         if response.is_error:
             logger.error(
                 f"Error {'Validating' if validation_only else 'Upserting'} "
@@ -175,6 +217,7 @@ class EntityClientMixin:
         request_options: RequestOptions,
         user_agent_type: UserAgentType | None = None,
         should_raise: bool = True,
+        serialized_entities: list[bytes] | None = None,
     ) -> list[tuple[bool | None, Entity]] | httpx.HTTPStatusError:
         """
         This function upserts a list of entities into Port.
@@ -193,25 +236,29 @@ class EntityClientMixin:
         :param request_options: A dictionary specifying how to upsert the entity
         :param user_agent_type: a UserAgentType specifying who is preforming the action
         :param should_raise: A boolean specifying whether the error should be raised or handled silently
+        :param serialized_entities: The entities already serialized by `serialize_entity`, sent as is
         :return: A list of tuples where each tuple contains:
             - First value: True if entity was created successfully, False if there was an error, None if there was an error and the entity use search identifier
             - Second value: The original entity (if failed) or the reduced entity with updated identifier (if successful)
         :return: httpx.HTTPStatusError if there was an HTTP error and should_raise is False
         """
         validation_only = request_options["validation_only"]
-        async with self.semaphore:
+        if serialized_entities is None:
+            serialized_entities = [serialize_entity(entity) for entity in entities]
+        body = self._build_bulk_body(serialized_entities)
+        bulk_sizer = self._get_bulk_sizer(blueprint)
+        async with self.concurrency_limiter.acquire() as slot:
             logger.debug(
                 f"{'Validating' if validation_only else 'Upserting'} {len(entities)} of blueprint: {blueprint}"
             )
-            headers = await self.auth.headers(user_agent_type)
+            headers = {
+                **await self.auth.headers(user_agent_type),
+                "Content-Type": "application/json",
+            }
+            start = time.monotonic()
             response = await self.client.post(
                 f"{self.auth.api_url}/blueprints/{blueprint}/entities/bulk",
-                json={
-                    "entities": [
-                        entity.dict(exclude_unset=True, by_alias=True)
-                        for entity in entities
-                    ]
-                },
+                content=body,
                 headers=headers,
                 params={
                     "upsert": "true",
@@ -223,23 +270,77 @@ class EntityClientMixin:
                 },
                 extensions={"retryable": True},
             )
+            slot.record_response(response)
+            latency = time.monotonic() - start
         if response.is_error:
             logger.error(
                 f"Error {'Validating' if validation_only else 'Upserting'} "
                 f"{len(entities)} entities of "
                 f"blueprint: {blueprint}"
             )
+            bulk_sizer.record_error(
+                len(entities), len(body), response.status_code, start
+            )
             handle_port_status_code(response, should_raise)
             return httpx.HTTPStatusError(
                 f"HTTP {response.status_code}",
                 request=response.request,
                 response=response,
             )
+        bulk_sizer.record_success(len(entities), latency, start)
         handle_port_status_code(response, should_raise)
         result = response.json()
 
         return self._parse_upsert_entities_batch_response(entities, result)
 
+    @staticmethod
+    def _build_bulk_body(serialized_entities: list[bytes]) -> bytes:
+        return (
+            ENTITIES_BULK_BODY_PREFIX
+            + b",".join(serialized_entities)
+            + ENTITIES_BULK_BODY_SUFFIX
+        )
+
+    def _get_bulk_sizer(self, blueprint: str) -> AdaptiveBulkSizer:
+        if blueprint not in self._bulk_sizers:
+            self._bulk_sizers[blueprint] = AdaptiveBulkSizer(
+                ocean.config.upsert_entities_batch_max_length,
+                ocean.config.upsert_entities_batch_max_size_in_bytes,
+            )
+        return self._bulk_sizers[blueprint]
+
+    @staticmethod
+    def _split_to_bulks(
+        entities: list[Entity],
+        serialized_entities: list[bytes],
+        bulk_sizer: AdaptiveBulkSizer,
+    ) -> list[tuple[list[Entity], list[bytes]]]:
+        """Split the entities into bulks by their exact serialized size and the current bulk length of the blueprint"""
+        empty_body_size = len(ENTITIES_BULK_BODY_PREFIX) + len(
+            ENTITIES_BULK_BODY_SUFFIX
+        )
+        bulks: list[tuple[list[Entity], list[bytes]]] = []
+        current_entities: list[Entity] = []
+        current_serialized: list[bytes] = []
+        current_size = empty_body_size
+        for entity, serialized in zip(entities, serialized_entities):
+            # Every entity but the first is preceded by a comma
+            entity_size = len(serialized) + 1
+            if current_entities and (
+                len(current_entities) >= bulk_sizer.length
+                or current_size + entity_size > bulk_sizer.max_size_in_bytes
+            ):
+                bulks.append((current_entities, current_serialized))
+                current_entities = []
+                current_serialized = []
+                current_size = empty_body_size
+            current_entities.append(entity)
+            current_serialized.append(serialized)
+            current_size += entity_size
+        if current_entities:
+            bulks.append((current_entities, current_serialized))
+        return bulks
+
     def _parse_upsert_entities_batch_response(
         self,
         entities: list[Entity],
@@ -339,8 +440,10 @@ class EntityClientMixin:
     ) -> list[tuple[bool, Entity]]:
         """
         This function upserts a list of entities into Port in batches.
-        The batch size is calculated based on both the number of entities and their size.
-        Batches are processed in parallel using asyncio.gather, with concurrency controlled by the semaphore.
+        The batches are bounded by the exact serialized size of the entities and by the bulk length of the blueprint,
+        which is tuned from the latency and errors of the previous bulks.
+        Batches are processed in parallel using asyncio.gather, with concurrency controlled by the concurrency limiter.
+        A batch that is rejected as too large is split in halves until it is accepted.
 
         :param entities: A list of Entities to be upserted
         :param request_options: A dictionary specifying how to upsert the entity
@@ -353,63 +456,99 @@ class EntityClientMixin:
         entities_results: list[tuple[bool, Entity]] = []
         blueprint = entities[0].blueprint
 
-        bulk_size = self.calculate_entities_batch_size(entities)
-        bulks = [
-            entities[i : i + bulk_size] for i in range(0, len(entities), bulk_size)
-        ]
+        # The entities are serialized once for this call, the same bytes are used to size the bulks and as the request body
+        serialized_entities = [serialize_entity(entity) for entity in entities]
+        bulks = self._split_to_bulks(
+            entities, serialized_entities, self._get_bulk_sizer(blueprint)
+        )
 
         bulk_results = await asyncio.gather(
             *(
-                self.upsert_entities_bulk(
+                self._upsert_bulk_adaptively(
                     blueprint,
                     bulk,
+                    serialized_bulk,
                     request_options,
                     user_agent_type,
-                    should_raise=should_raise,
+                    should_raise,
                 )
-                for bulk in bulks
+                for bulk, serialized_bulk in bulks
             ),
             return_exceptions=True,
         )
 
-        for bulk, bulk_result in zip(bulks, bulk_results):
-            if isinstance(bulk_result, httpx.HTTPStatusError) or isinstance(
-                bulk_result, Exception
-            ):
+        for (bulk, _), bulk_result in zip(bulks, bulk_results):
+            if isinstance(bulk_result, Exception):
                 if should_raise:
                     raise bulk_result
-                # If should_raise is False, retry batch in sequential order as a fallback only for 413 errors
-                if (
-                    isinstance(bulk_result, httpx.HTTPStatusError)
-                    and bulk_result.response.status_code == 413
-                ):
-                    individual_upsert_results = (
-                        await self._upsert_entities_batch_individually(
-                            bulk, request_options, user_agent_type, should_raise
-                        )
+                # Mark all the entities in the bulk as failed
+                for entity in bulk:
+                    failed_result: tuple[bool, Entity] = (
+                        False,
+                        self._reduce_entity(entity),
                     )
-                    entities_results.extend(individual_upsert_results)
-                else:
-                    # For other errors, mark all entities in the batch as failed
-                    for entity in bulk:
-                        failed_result: tuple[bool, Entity] = (
-                            False,
-                            self._reduce_entity(entity),
-                        )
-                        entities_results.append(failed_result)
+                    entities_results.append(failed_result)
             elif isinstance(bulk_result, list):
-                for status, entity in bulk_result:
-                    if (
-                        status is not None
-                    ):  # when using the search identifier we might not have an actual identifier
-                        bulk_result_tuple: tuple[bool, Entity] = (
-                            bool(status),
-                            entity,
-                        )
-                        entities_results.append(bulk_result_tuple)
+                entities_results.extend(bulk_result)
 
         return entities_results
 
+    async def _upsert_bulk_adaptively(
+        self,
+        blueprint: str,
+        entities: list[Entity],
+        serialized_entities: list[bytes],
+        request_options: RequestOptions,
+        user_agent_type: UserAgentType | None,
+        should_raise: bool,
+    ) -> list[tuple[bool, Entity]]:
+        """Upsert a bulk, splitting it in halves when Port rejects it as too large"""
+        bulk_result = await self.upsert_entities_bulk(
+            blueprint,
+            entities,
+            request_options,
+            user_agent_type,
+            should_raise=should_raise,
+            serialized_entities=serialized_entities,
+        )
+        if isinstance(bulk_result, httpx.HTTPStatusError):
+            if (
+                bulk_result.response.status_code
+                != status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+            ):
+                return [(False, self._reduce_entity(entity)) for entity in entities]
+            if len(entities) == 1:
+                return await self._upsert_entities_batch_individually(
+                    entities, request_options, user_agent_type, should_raise
+                )
+            middle = len(entities) // 2
+            first_half, second_half = await asyncio.gather(
+                self._upsert_bulk_adaptively(
+                    blueprint,
+                    entities[:middle],
+                    serialized_entities[:middle],
+                    request_options,
+                    user_agent_type,
+                    should_raise,
+                ),
+                self._upsert_bulk_adaptively(
+                    blueprint,
+                    entities[middle:],
+                    serialized_entities[middle:],
+                    request_options,
+                    user_agent_type,
+                    should_raise,
+                ),
+            )
+            return first_half + second_half
+
+        # when using the search identifier we might not have an actual identifier
+        return [
+            (bool(status), entity)
+            for status, entity in bulk_result
+            if status is not None
+        ]
+
     async def delete_entity(
         self,
         entity: Entity,
@@ -417,7 +556,7 @@ class EntityClientMixin:
         user_agent_type: UserAgentType | None = None,
         should_raise: bool = True,
     ) -> None:
-        async with self.semaphore:
+        async with self.concurrency_limiter.acquire() as slot:
             logger.info(
                 f"Delete entity: {entity.identifier} of blueprint: {entity.blueprint}"
             )
@@ -430,6 +569,7 @@ class EntityClientMixin:
                     ).lower()
                 },
             )
+            slot.record_response(response)
 
             if response.is_error:
                 if response.status_code == 404:
@@ -446,14 +586,90 @@ class EntityClientMixin:
 
             handle_port_status_code(response, should_raise)
 
-    async def batch_delete_entities(
+    async def delete_entities_bulk(
         self,
+        blueprint: str,
         entities: list[Entity],
         request_options: RequestOptions,
         user_agent_type: UserAgentType | None = None,
         should_raise: bool = True,
-    ) -> None:
-        await asyncio.gather(
+    ) -> list[tuple[bool, Entity]] | httpx.HTTPStatusError:
+        """
+        This function deletes a list of entities of a single blueprint from Port in a single request.
+
+        :param blueprint: The blueprint of the entities to be deleted
+        :param entities: A list of Entities to be deleted
+        :param request_options: A dictionary specifying how to delete the entities
+        :param user_agent_type: a UserAgentType specifying who is preforming the action
+        :param should_raise: A boolean specifying whether the error should be raised or handled silently
+        :return: A list of tuples where each tuple contains whether the entity was deleted and the entity
+        :return: httpx.HTTPStatusError if there was an HTTP error and should_raise is False
+        """
+        async with self.concurrency_limiter.acquire() as slot:
+            logger.info(f"Deleting {len(entities)} entities of blueprint: {blueprint}")
+            response = await self.client.request(
+                "DELETE",
+                f"{self.auth.api_url}/blueprints/{blueprint}/bulk/entities",
+                json={"entities": [entity.identifier for entity in entities]},
+                headers=await self.auth.headers(user_agent_type),
+                params={
+                    "delete_dependents": str(
+                        request_options["delete_dependent_entities"]
+                    ).lower()
+                },
+                extensions={"retryable": True},
+            )
+            slot.record_response(response)
+        if response.is_error:
+            logger.error(
+                f"Error deleting {len(entities)} entities of blueprint: {blueprint}"
+            )
+            # The entities of a bulk that was rejected because bulk deletion isn't available or the request is too
+            # large are deleted one by one by the caller, so the error isn't raised
+            if response.status_code not in BULK_DELETE_FALLBACK_STATUS_CODES:
+                handle_port_status_code(response, should_raise)
+            return httpx.HTTPStatusError(
+                f"HTTP {response.status_code}",
+                request=response.request,
+                response=response,
+            )
+        return self._parse_delete_entities_bulk_response(entities, response.json())
+
+    @staticmethod
+    def _parse_delete_entities_bulk_response(
+        entities: list[Entity], result: Any
+    ) -> list[tuple[bool, Entity]]:
+        failed_entities = (
+            result.get("failedEntities", []) if isinstance(result, dict) else None
+        )
+        if (
+            not isinstance(result, dict)
+            or result.get("ok") is not True
+            or not isinstance(failed_entities, list)
+        ):
+            # A response that doesn't confirm the deletion doesn't count any of the entities as deleted
+            logger.warning(
+                f"Unexpected response to the deletion of {len(entities)} entities, treating them as not deleted"
+            )
+            return [(False, entity) for entity in entities]
+
+        failed_identifiers = set()
+        for failed in failed_entities:
+            failed_identifiers.add(
+                failed.get("identifier") if isinstance(failed, dict) else failed
+            )
+        return [
+            (entity.identifier not in failed_identifiers, entity) for entity in entities
+        ]
+
+    async def _delete_entities_batch_individually(
+        self,
+        entities: list[Entity],
+        request_options: RequestOptions,
+        user_agent_type: UserAgentType | None = None,
+        should_raise: bool = True,
+    ) -> list[tuple[bool, Entity]]:
+        results = await asyncio.gather(
             *(
                 self.delete_entity(
                     entity,
@@ -465,14 +681,82 @@ class EntityClientMixin:
             ),
             return_exceptions=True,
         )
+        return [
+            (not isinstance(result, Exception), entity)
+            for entity, result in zip(entities, results)
+        ]
 
-    async def search_entities(
+    async def batch_delete_entities(
         self,
-        user_agent_type: UserAgentType,
-        query: dict[Any, Any] | None = None,
-        parameters_to_include: list[str] | None = None,
-    ) -> list[Entity]:
-        default_query = {
+        entities: list[Entity],
+        request_options: RequestOptions,
+        user_agent_type: UserAgentType | None = None,
+        should_raise: bool = True,
+    ) -> list[tuple[bool, Entity]]:
+        """
+        This function deletes a list of entities from Port in bulk requests.
+        The entities are grouped by blueprint and split into batches by the size of their identifiers, the
+        batches are deleted in parallel with concurrency controlled by the concurrency limiter.
+        Batches rejected because bulk deletion isn't available or the request is too large are deleted entity by
+        entity instead.
+        The errors of the requests are never raised from here, the entities of a batch that failed are returned as not
+        deleted.
+
+        :param entities: A list of Entities to be deleted
+        :param request_options: A dictionary specifying how to delete the entities
+        :param user_agent_type: a UserAgentType specifying who is preforming the action
+        :param should_raise: Whether the errors of the requests are raised inside each request, e.g. to be logged
+        :return: A list of tuples where each tuple contains whether the entity was deleted and the entity
+        """
+        entities_by_blueprint: dict[str, list[Entity]] = {}
+        for entity in entities:
+            entities_by_blueprint.setdefault(entity.blueprint, []).append(entity)
+
+        batches: list[tuple[str, list[Entity]]] = []
+        for blueprint, blueprint_entities in entities_by_blueprint.items():
+            batch_size = self.calculate_entities_delete_batch_size(blueprint_entities)
+            batches.extend(
+                (blueprint, blueprint_entities[i : i + batch_size])
+                for i in range(0, len(blueprint_entities), batch_size)
+            )
+
+        batch_results = await asyncio.gather(
+            *(
+                self.delete_entities_bulk(
+                    blueprint,
+                    batch,
+                    request_options,
+                    user_agent_type,
+                    should_raise=should_raise,
+                )
+                for blueprint, batch in batches
+            ),
+            return_exceptions=True,
+        )
+
+        entities_results: list[tuple[bool, Entity]] = []
+        for (_, batch), batch_result in zip(batches, batch_results):
+            if isinstance(batch_result, list):
+                entities_results.extend(batch_result)
+            elif (
+                isinstance(batch_result, httpx.HTTPStatusError)
+                and batch_result.response.status_code
+                in BULK_DELETE_FALLBACK_STATUS_CODES
+            ):
+                entities_results.extend(
+                    await self._delete_entities_batch_individually(
+                        batch, request_options, user_agent_type, should_raise
+                    )
+                )
+            else:
+                entities_results.extend((False, entity) for entity in batch)
+
+        return entities_results
+
+    def _get_integration_entities_query(
+        self, user_agent_type: UserAgentType
+    ) -> dict[str, Any]:
+        return {
             "combinator": "and",
             "rules": [
                 {
@@ -488,24 +772,96 @@ class EntityClientMixin:
             ],
         }
 
+    async def _search_raw_entities(
+        self,
+        user_agent_type: UserAgentType,
+        query: dict[Any, Any] | None = None,
+        parameters_to_include: list[str] | None = None,
+        limit_concurrency: bool = False,
+    ) -> list[dict[str, Any]]:
+        default_query = self._get_integration_entities_query(user_agent_type)
+
         if query is None:
             query = default_query
         elif query.get("rules"):
             query["rules"].append(default_query)
 
         logger.info(f"Searching entities with query {query}")
-        response = await self.client.post(
-            f"{self.auth.api_url}/entities/search",
-            json=query,
-            headers=await self.auth.headers(user_agent_type),
-            params={
-                "exclude_calculated_properties": "true",
-                "include": parameters_to_include or ["blueprint", "identifier"],
-            },
-            extensions={"retryable": True},
-        )
+        # A search is slower than the upserts the limiter's latency baseline is learned from, only its status counts
+        async with (
+            self.concurrency_limiter.acquire(measure_latency=False)
+            if limit_concurrency
+            else nullcontext()
+        ) as slot:
+            response = await self.client.post(
+                f"{self.auth.api_url}/entities/search",
+                json=query,
+                headers=await self.auth.headers(user_agent_type),
+                params={
+                    "exclude_calculated_properties": "true",
+                    "include": parameters_to_include or ["blueprint", "identifier"],
+                },
+                extensions={"retryable": True},
+            )
+            if slot is not None:
+                slot.record_response(response)
         handle_port_status_code(response)
-        return [Entity.parse_obj(result) for result in response.json()["entities"]]
+        return response.json()["entities"]
+
+    async def search_entities(
+        self,
+        user_agent_type: UserAgentType,
+        query: dict[Any, Any] | None = None,
+        parameters_to_include: list[str] | None = None,
+        limit_concurrency: bool = False,
+    ) -> list[Entity]:
+        """
+        :param limit_concurrency: Whether the search takes a slot of the concurrency limiter, for searches that run
+            alongside the upserts of a resync
+        """
+        return [
+            Entity.parse_obj(result)
+            for result in await self._search_raw_entities(
+                user_agent_type, query, parameters_to_include, limit_concurrency
+            )
+        ]
+
+    async def search_entities_keys(
+        self, user_agent_type: UserAgentType, blueprints: list[str]
+    ) -> AsyncIterator[list[EntityKey]]:
+        """
+        Stream the (blueprint, identifier) keys of the integration entities, a page per blueprint.
+        The keys are read directly from the response, so the entities are never parsed into models and only a
+        single page of the response is held in memory at a time.
+        The last page holds the entities of all the other blueprints, so entities of blueprints that are no longer
+        mapped (or whose blueprint is calculated dynamically) are still returned.
+
+        :param user_agent_type: The user agent whose entities are searched
+        :param blueprints: The blueprints to search separately
+        """
+        other_blueprints_rules = (
+            [{"property": "$blueprint", "operator": "notIn", "value": blueprints}]
+            if blueprints
+            else []
+        )
+        queries = [
+            {
+                "combinator": "and",
+                "rules": [
+                    {"property": "$blueprint", "operator": "=", "value": blueprint}
+                ],
+            }
+            for blueprint in blueprints
+        ] + [{"combinator": "and", "rules": other_blueprints_rules}]
+
+        for query in queries:
+            results = await self._search_raw_entities(
+                user_agent_type, query if query["rules"] else None
+            )
+            yield [
+                make_entity_key(result["blueprint"], result["identifier"])
+                for result in results
+            ]
 
     async def search_batch_entities(
         self, user_agent_type: UserAgentType, entities_to_search: list[Entity]
@@ -72,10 +72,95 @@ class MetricsSettings(BaseOceanModel, extra=Extra.allow):
     webhook_url: str | None = Field(default=None)
 
 
+class ResyncPipelineSettings(BaseOceanModel, extra=Extra.allow):
+    # When enabled, fetching, transforming and loading the batches of a resource overlap
+    enabled: bool = Field(default=False)
+    # The maximum number of batches waiting between two stages before the previous stage waits
+    queue_max_size: int = Field(default=2, ge=1)
+    transform_concurrency: int = Field(default=1, ge=1)
+    load_concurrency: int = Field(default=2, ge=1)
+
+
+class PortConcurrencySettings(BaseOceanModel, extra=Extra.allow):
+    # When enabled, the number of concurrent entity requests to Port grows while their latency stays flat and shrinks
+    # on rate limits and server errors, otherwise it stays at the initial limit
+    enabled: bool = Field(default=False)
+    initial_limit: int = Field(default=50, ge=1)
+    min_limit: int = Field(default=1, ge=1)
+    # Requests above the size of the Port HTTP client connection pool wait for a free connection
+    max_limit: int = Field(default=100, ge=1)
+    # A request slower than this multiple of the lowest observed latency is a sign that Port is loaded
+    latency_tolerance: float = Field(default=2.0, gt=1)
+    # The factor the limit is multiplied by on a rate limit or a server error
+    backoff_factor: float = Field(default=0.5, gt=0, lt=1)
+
+
+class ResyncWorkersSettings(BaseOceanModel, extra=Extra.allow):
+    # When enabled in multi_process mode, the resources of a resync are processed by a pool of worker processes that
+    # are forked once per resync, instead of a new process per resource. The pool has max_concurrent_resources workers
+    enabled: bool = Field(default=False)
+    # The number of resources after which a worker is replaced by a new one
+    max_tasks_per_worker: int = Field(default=10, ge=1)
+    # A worker using more memory than this after a resource is replaced by a new one, 0 disables the limit
+    max_worker_memory_mb: int = Field(default=0, ge=0)
+
+
+class ResourceMemorySettings(BaseOceanModel, extra=Extra.allow):
+    # The memory a resource subprocess may use in multi_process mode, the subprocess is killed past it. 0 disables the
+    # limit, the memory of the subprocesses is still sampled and reported in the metrics. In a resync worker, only the
+    # memory added since the resource started is counted
+    max_rss_mb: int = Field(default=0, ge=0)
+    # The ratio of the limit after which a warning is logged
+    warn_ratio: float = Field(default=0.8, gt=0, le=1)
+    # The interval between samples of the memory of a subprocess
+    sample_interval_seconds: float = Field(default=1.0, gt=0)
+
+
+class LiveEventsBatchSettings(BaseOceanModel, extra=Extra.allow):
+    # The maximum number of webhook events processed as a batch. The results of a batch are parsed together, and the
+    # entities are upserted and deleted in bulk, once per entity with its last update. 1 disables the batching
+    max_size: int = Field(default=1, ge=1)
+    # The time after the first event of a batch during which the following events are added to the batch
+    max_wait_seconds: float = Field(default=0.5, ge=0)
+
+
+class LiveEventsQueueSettings(BaseOceanModel, extra=Extra.allow):
+    # When enabled, the webhook events are kept in a queue on disk until they are processed, so the events that
+    # weren't processed when the integration stopped are processed once it starts again.
+    # Only the trace id, payload and headers of an event are kept, so an event processed after a restart has no
+    # original request, and a processor that verifies a signature over the raw request body rejects it.
+    # The events are committed in order, so a durable queue requires a single event worker (event_workers_count=1)
+    durable: bool = Field(default=False)
+    # The directory the queues of the webhook paths are kept in
+    directory: str = Field(default=".ocean_live_events_queue")
+    # The number of events of a webhook path waiting to be processed after which new events are rejected with a 429
+    # response, so the sender retries them later. 0 doesn't limit the queue
+    max_size: int = Field(default=0, ge=0)
+    # The size after which a durable queue starts a new segment file, the segments are deleted once processed
+    segment_max_mb: int = Field(default=64, ge=1)
+    # The number of processed events between the checkpoints of a durable queue. The events processed since the last
+    # checkpoint are processed again after a crash
+    checkpoint_interval: int = Field(default=100, ge=1)
+
+
+class EntityFingerprintsSettings(BaseOceanModel, extra=Extra.allow):
+    # When enabled, entities that didn't change since they were last synced skip the Port search and upsert
+    enabled: bool = Field(default=False)
+    # The directory the fingerprints are kept in between resyncs
+    directory: str = Field(default=".ocean_entity_fingerprints")
+    # The time after which an unchanged entity is compared with Port again
+    ttl_seconds: int = Field(default=24 * 60 * 60, ge=0)
+
+
 class IntegrationConfiguration(BaseOceanSettings, extra=Extra.allow):
     _integration_config_model: BaseModel | None = None
 
     allow_environment_variables_jq_access: bool = True
+    # Evaluates the mapping of a whole batch of raw results in a single JQ program instead of per field
+    jq_batch_evaluation: bool = False
+    # The number of worker processes that evaluate the batch JQ programs, 0 evaluates them in the integration process.
+    # Setting it implies the batch evaluation of the mappings
+    jq_transform_workers: int = Field(default=0, ge=0)
     initialize_port_resources: bool = True
     scheduled_resync_interval: int | None = None
     client_timeout: int = 60
@@ -98,6 +183,18 @@ class IntegrationConfiguration(BaseOceanSettings, extra=Extra.allow):
         default_factory=lambda: MetricsSettings(enabled=False, webhook_url=None)
     )
     max_event_processing_seconds: float = 90.0
+    # The number of workers processing the webhook events of each path. Events with the same ordering key, as returned
+    # by the webhook processors, are processed in order by the same worker
+    event_workers_count: int = Field(default=1, ge=1)
+    # The age after which the port app config is fetched again for a webhook event, 0 fetches it for every event.
+    # A resync, e.g. after the config changed, fetches it again regardless
+    live_events_port_app_config_max_age_seconds: float = Field(default=0, ge=0)
+    live_events_batch: LiveEventsBatchSettings = Field(
+        default_factory=LiveEventsBatchSettings
+    )
+    live_events_queue: LiveEventsQueueSettings = Field(
+        default_factory=LiveEventsQueueSettings
+    )
     max_wait_seconds_before_shutdown: float = 5.0
     caching_storage_mode: Optional[CachingStorageMode] = Field(
         default=CachingStorageMode.disk
@@ -106,6 +203,25 @@ class IntegrationConfiguration(BaseOceanSettings, extra=Extra.allow):
         default=ProcessExecutionMode.multi_process
     )
 
+    # The maximum number of resources that are processed at the same time during a resync
+    max_concurrent_resources: int = Field(default=1, ge=1)
+    # The maximum number of resync functions of a single kind that are iterated at the same time, 1 iterates them one
+    # after the other
+    max_concurrent_resync_generators: int = Field(default=1, ge=1)
+    resync_pipeline: ResyncPipelineSettings = Field(
+        default_factory=ResyncPipelineSettings
+    )
+    entity_fingerprints: EntityFingerprintsSettings = Field(
+        default_factory=EntityFingerprintsSettings
+    )
+    port_concurrency: PortConcurrencySettings = Field(
+        default_factory=PortConcurrencySettings
+    )
+    resync_workers: ResyncWorkersSettings = Field(default_factory=ResyncWorkersSettings)
+    resource_memory: ResourceMemorySettings = Field(
+        default_factory=ResourceMemorySettings
+    )
+
     upsert_entities_batch_max_length: int = 20
     upsert_entities_batch_max_size_in_bytes: int = 1024 * 1024
 
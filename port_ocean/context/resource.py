@@ -13,6 +13,7 @@ if TYPE_CHECKING:
     from port_ocean.core.handlers.port_app_config.models import (
         ResourceConfig,
     )
+    from port_ocean.core.utils.entity_fingerprints import EntityFingerprintStore
 
 
 @dataclass
@@ -24,6 +25,7 @@ class ResourceContext:
 
     resource_config: "ResourceConfig"
     index: int
+    entity_fingerprints: "EntityFingerprintStore | None" = None
 
     @property
     def kind(self) -> str:
@@ -4,6 +4,7 @@ from port_ocean.clients.port.types import UserAgentType
 from port_ocean.core.handlers.base import BaseHandler
 from port_ocean.core.models import Entity
 from port_ocean.core.ocean_types import EntityDiff
+from port_ocean.core.utils.entity_keys import EntityKey
 
 
 class BaseEntitiesStateApplier(BaseHandler):
@@ -35,15 +36,41 @@ class BaseEntitiesStateApplier(BaseHandler):
         self,
         entities: EntityDiff,
         user_agent: UserAgentType,
+        entity_deletion_threshold: float | None = None,
     ) -> None:
         """Delete the specified entity differences from the state.
 
         Args:
             entities (EntityDiff): The differences to be deleted.
             user_agent (UserAgentType): The user agent responsible for the deletion.
+            entity_deletion_threshold (float | None): The maximal rate of entities that may be deleted.
         """
         pass
 
+    async def delete_diff_by_keys(
+        self,
+        entities_at_port_keys: set[EntityKey],
+        generated_entities: list[Entity],
+        user_agent: UserAgentType,
+        entity_deletion_threshold: float | None = None,
+    ) -> None:
+        """Delete the entities that exist in the state but weren't generated, given only the keys of the state.
+
+        Args:
+            entities_at_port_keys (set[EntityKey]): The keys of the entities in the state.
+            generated_entities (list[Entity]): The entities that were generated and should be kept.
+            user_agent (UserAgentType): The user agent responsible for the deletion.
+            entity_deletion_threshold (float | None): The maximal rate of entities that may be deleted.
+        """
+        await self.delete_diff(
+            {
+                "before": [key.to_entity() for key in entities_at_port_keys],
+                "after": generated_entities,
+            },
+            user_agent,
+            entity_deletion_threshold,
+        )
+
     @abstractmethod
     async def upsert(
         self, entities: list[Entity], user_agent_type: UserAgentType
@@ -8,13 +8,19 @@ from port_ocean.core.handlers.entities_state_applier.base import (
 from port_ocean.core.handlers.entities_state_applier.port.get_related_entities import (
     get_related_entities,
 )
+from port_ocean.core.handlers.entities_state_applier.port.safe_delete import (
+    SafeDeletePlan,
+    SafeDeleteReason,
+    plan_safe_delete,
+)
 from port_ocean.context.ocean import ocean
 from port_ocean.helpers.metric.metric import MetricType, MetricPhase
 from port_ocean.helpers.metric.utils import TimeMetric
 from port_ocean.core.models import Entity
 from port_ocean.core.ocean_types import EntityDiff
+from port_ocean.core.utils.entity_keys import EntityKey, get_entities_keys
 from port_ocean.core.utils.entity_topological_sorter import EntityTopologicalSorter
-from port_ocean.core.utils.utils import is_same_entity, get_port_diff
+from port_ocean.core.utils.utils import get_port_diff
 
 
 class HttpEntitiesStateApplier(BaseEntitiesStateApplier):
@@ -25,6 +31,25 @@ class HttpEntitiesStateApplier(BaseEntitiesStateApplier):
     through HTTP requests.
     """
 
+    async def plan_safe_delete(
+        self,
+        entities_to_delete: list[Entity],
+        entities_to_protect: list[Entity],
+    ) -> SafeDeletePlan:
+        """Dry run of the safe delete, returns the planned deletions with their reasons without deleting anything.
+
+        Only the blueprints of the protected entities are fetched from Port, to resolve their relation targets.
+        """
+        related_entities = await get_related_entities(
+            entities_to_protect, self.context.port_client
+        )
+        return plan_safe_delete(
+            entities_to_delete,
+            entities_to_protect,
+            related_entities,
+            event.port_app_config.create_missing_related_entities,
+        )
+
     @TimeMetric(MetricPhase.DELETE)
     async def _safe_delete(
         self,
@@ -35,32 +60,15 @@ class HttpEntitiesStateApplier(BaseEntitiesStateApplier):
         if not entities_to_delete:
             return
 
-        related_entities = await get_related_entities(
-            entities_to_protect, self.context.port_client
-        )
-
-        allowed_entities_to_delete = []
+        plan = await self.plan_safe_delete(entities_to_delete, entities_to_protect)
+        for entity, reason in plan.skipped:
+            if reason == SafeDeleteReason.PROTECTED_RELATION:
+                logger.info(
+                    f"Skipping entity {(entity.identifier, entity.blueprint)} because it is "
+                    f"related to created entities and create_missing_related_entities is enabled"
+                )
 
-        for entity_to_delete in entities_to_delete:
-            is_part_of_related = any(
-                is_same_entity(entity, entity_to_delete) for entity in related_entities
-            )
-            is_part_of_created = any(
-                is_same_entity(entity, entity_to_delete)
-                for entity in entities_to_protect
-            )
-            if is_part_of_related:
-                if event.port_app_config.create_missing_related_entities:
-                    logger.info(
-                        f"Skipping entity {(entity_to_delete.identifier, entity_to_delete.blueprint)} because it is "
-                        f"related to created entities and create_missing_related_entities is enabled"
-                    )
-                else:
-                    allowed_entities_to_delete.append(entity_to_delete)
-            elif not is_part_of_created:
-                allowed_entities_to_delete.append(entity_to_delete)
-
-        await self.delete(allowed_entities_to_delete, user_agent_type)
+        await self.delete(plan.entities_to_delete, user_agent_type)
 
     async def apply_diff(
         self,
@@ -77,32 +85,30 @@ class HttpEntitiesStateApplier(BaseEntitiesStateApplier):
 
         await self._safe_delete(diff.deleted, modified_entities, user_agent_type)
 
-    async def delete_diff(
+    async def _delete_by_threshold(
         self,
-        entities: EntityDiff,
+        deleted_entities: list[Entity],
+        kept_entities: list[Entity],
+        total_entities: int,
         user_agent_type: UserAgentType,
-        entity_deletion_threshold: float | None = None,
+        entity_deletion_threshold: float | None,
     ) -> None:
-        diff = get_port_diff(entities["before"], entities["after"])
-
-        if not diff.deleted:
+        if not deleted_entities:
             return
 
-        kept_entities = diff.created + diff.modified
-
         logger.info(
-            f"Determining entities to delete ({len(diff.deleted)}/{len(kept_entities)})",
-            deleting_entities=len(diff.deleted),
+            f"Determining entities to delete ({len(deleted_entities)}/{len(kept_entities)})",
+            deleting_entities=len(deleted_entities),
             keeping_entities=len(kept_entities),
             entity_deletion_threshold=entity_deletion_threshold,
         )
 
-        deletion_rate = len(diff.deleted) / len(entities["before"])
+        deletion_rate = len(deleted_entities) / total_entities
         if (
             entity_deletion_threshold is not None
             and deletion_rate <= entity_deletion_threshold
         ):
-            await self._safe_delete(diff.deleted, kept_entities, user_agent_type)
+            await self._safe_delete(deleted_entities, kept_entities, user_agent_type)
             ocean.metrics.inc_metric(
                 name=MetricType.OBJECT_COUNT_NAME,
                 labels=[
@@ -110,16 +116,53 @@ class HttpEntitiesStateApplier(BaseEntitiesStateApplier):
                     MetricPhase.DELETE,
                     MetricPhase.DeletionResult.DELETED,
                 ],
-                value=len(diff.deleted),
+                value=len(deleted_entities),
             )
         else:
             logger.info(
                 f"Skipping deletion of entities with deletion rate {deletion_rate}",
                 deletion_rate=deletion_rate,
-                deleting_entities=len(diff.deleted),
-                total_entities=len(entities),
+                deleting_entities=len(deleted_entities),
+                total_entities=total_entities,
             )
 
+    async def delete_diff(
+        self,
+        entities: EntityDiff,
+        user_agent_type: UserAgentType,
+        entity_deletion_threshold: float | None = None,
+    ) -> None:
+        diff = get_port_diff(entities["before"], entities["after"])
+        await self._delete_by_threshold(
+            diff.deleted,
+            diff.created + diff.modified,
+            len(entities["before"]),
+            user_agent_type,
+            entity_deletion_threshold,
+        )
+
+    async def delete_diff_by_keys(
+        self,
+        entities_at_port_keys: set[EntityKey],
+        generated_entities: list[Entity],
+        user_agent_type: UserAgentType,
+        entity_deletion_threshold: float | None = None,
+    ) -> None:
+        generated_keys = get_entities_keys(generated_entities)
+        # Only the entities that are about to be deleted are built from their keys
+        deleted_entities = [
+            key.to_entity()
+            for key in entities_at_port_keys
+            if key not in generated_keys
+        ]
+        await self._delete_by_threshold(
+            deleted_entities,
+            generated_entities,
+            len(entities_at_port_keys),
+            user_agent_type,
+            entity_deletion_threshold,
+        )
+
     async def upsert(
         self, entities: list[Entity], user_agent_type: UserAgentType
     ) -> list[Entity]:
@@ -153,13 +196,12 @@ class HttpEntitiesStateApplier(BaseEntitiesStateApplier):
                 should_raise=False,
             )
         else:
-            ordered_deleted_entities = (
-                EntityTopologicalSorter.order_by_entities_dependencies(entities)
-            )
-
-            for entity in ordered_deleted_entities:
-                await self.context.port_client.delete_entity(
-                    entity,
+            # The entities of each wave don't depend on each other, so they are deleted together
+            for wave in EntityTopologicalSorter.order_by_entities_dependencies_in_waves(
+                entities
+            ):
+                await self.context.port_client.batch_delete_entities(
+                    wave,
                     event.port_app_config.get_port_request_options(),
                     user_agent_type,
                     should_raise=False,
@@ -1,6 +1,5 @@
 import asyncio
 from collections import defaultdict
-from itertools import groupby
 
 from port_ocean.clients.port.client import PortClient
 from port_ocean.core.models import Entity
@@ -10,27 +9,19 @@ async def get_related_entities(
     entities: list[Entity], port_client: PortClient
 ) -> list[Entity]:
     entities_with_relations = [entity for entity in entities if entity.relations]
-    blueprint_identifier_to_entity = dict(
-        groupby(
-            entities_with_relations,
-            key=lambda x: x.blueprint,
-        )
-    )
     blueprints = await asyncio.gather(
         *(
             port_client.get_blueprint(blueprint_identifier)
-            for blueprint_identifier in blueprint_identifier_to_entity.keys()
+            for blueprint_identifier in {
+                entity.blueprint for entity in entities_with_relations
+            }
         )
     )
+    blueprints_by_identifier = {
+        blueprint.identifier: blueprint for blueprint in blueprints
+    }
     entity_to_blueprint = [
-        (
-            entity,
-            next(
-                blueprint
-                for blueprint in blueprints
-                if blueprint.identifier == entity.blueprint
-            ),
-        )
+        (entity, blueprints_by_identifier[entity.blueprint])
         for entity in entities_with_relations
     ]
 
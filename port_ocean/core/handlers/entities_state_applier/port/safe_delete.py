@@ -0,0 +1,69 @@
+from dataclasses import dataclass, field
+from enum import StrEnum
+
+from port_ocean.core.models import Entity
+from port_ocean.core.utils.entity_keys import EntityKey, get_entity_key
+
+
+class SafeDeleteReason(StrEnum):
+    # The entity isn't kept by the sync and can be deleted
+    NOT_KEPT = "not_kept"
+    # The entity is a relation target of a kept entity, but missing related entities aren't created so it's deleted
+    RELATED_TO_KEPT = "related_to_kept"
+    # The entity is kept by the sync
+    KEPT = "kept"
+    # The entity is a relation target of a kept entity and missing related entities are created
+    PROTECTED_RELATION = "protected_relation"
+
+
+@dataclass
+class SafeDeletePlan:
+    to_delete: list[tuple[Entity, SafeDeleteReason]] = field(default_factory=list)
+    skipped: list[tuple[Entity, SafeDeleteReason]] = field(default_factory=list)
+
+    @property
+    def entities_to_delete(self) -> list[Entity]:
+        return [entity for entity, _ in self.to_delete]
+
+
+def _get_keys(entities: list[Entity]) -> set[EntityKey]:
+    # Entities with a search identifier can't match an entity to delete, and their identifier isn't hashable
+    return {
+        get_entity_key(entity)
+        for entity in entities
+        if not entity.is_using_search_identifier
+    }
+
+
+def plan_safe_delete(
+    entities_to_delete: list[Entity],
+    entities_to_protect: list[Entity],
+    related_entities: list[Entity],
+    create_missing_related_entities: bool,
+) -> SafeDeletePlan:
+    """
+    Decide which entities can be deleted without breaking the entities that are kept.
+    The protected and related entities are indexed by key once, so the plan is linear in the number of entities.
+
+    :param entities_to_delete: The entities that are candidates for deletion
+    :param entities_to_protect: The entities that are kept by the sync
+    :param related_entities: The relation targets of the kept entities
+    :param create_missing_related_entities: Whether missing related entities are created by Port
+    :return: The entities to delete and the skipped entities, each with the reason it was planned that way
+    """
+    protected_keys = _get_keys(entities_to_protect)
+    related_keys = _get_keys(related_entities)
+
+    plan = SafeDeletePlan()
+    for entity in entities_to_delete:
+        key = get_entity_key(entity)
+        if key in related_keys:
+            if create_missing_related_entities:
+                plan.skipped.append((entity, SafeDeleteReason.PROTECTED_RELATION))
+            else:
+                plan.to_delete.append((entity, SafeDeleteReason.RELATED_TO_KEPT))
+        elif key in protected_keys:
+            plan.skipped.append((entity, SafeDeleteReason.KEPT))
+        else:
+            plan.to_delete.append((entity, SafeDeleteReason.NOT_KEPT))
+    return plan
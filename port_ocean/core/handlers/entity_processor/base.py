@@ -2,7 +2,10 @@ from abc import abstractmethod
 
 from loguru import logger
 from port_ocean.core.handlers.base import BaseHandler
-from port_ocean.core.handlers.port_app_config.models import ResourceConfig
+from port_ocean.core.handlers.port_app_config.models import (
+    PortAppConfig,
+    ResourceConfig,
+)
 from port_ocean.core.ocean_types import (
     RAW_ITEM,
     CalculationResult,
@@ -53,3 +56,11 @@ class BaseEntityProcessor(BaseHandler):
             return await self._parse_items(
                 mapping, raw_data, parse_all, send_raw_data_examples_amount
             )
+
+    def warm_up(self, port_app_config: PortAppConfig) -> None:
+        """Prepare the processor for the mappings of a newly loaded port app config.
+
+        Args:
+            port_app_config (PortAppConfig): The newly loaded port app config.
+        """
+        pass
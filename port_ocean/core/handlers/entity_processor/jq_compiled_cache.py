@@ -0,0 +1,54 @@
+from functools import lru_cache
+from typing import Any
+
+import jq  # type: ignore
+
+DEFAULT_MAX_SIZE = 4096
+ENV_ACCESS_DISABLED_PREFIX = "def env: {}; {} as $ENV | "
+
+
+class CompiledJQCache:
+    """A bounded LRU cache of compiled JQ programs.
+
+    Programs are keyed by the pattern itself and whether environment variables access is allowed, so a lookup only
+    hashes the pattern string, whose hash Python caches, and the `def env` prefix isn't part of the key.
+    The lookups count the hits and misses without reporting them, so the callers can report them once per batch.
+    The cache is kept at the module level, so processes forked after it was warmed (e.g. the resync processes in
+    `multi_process` mode and the JQ process pool workers) inherit the compiled programs.
+
+    Args:
+        max_size: The maximum number of compiled programs kept, the least recently used is evicted first.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self.max_size = max_size
+        self.get = lru_cache(maxsize=max_size)(self._compile)
+
+    def __len__(self) -> int:
+        return self.get.cache_info().currsize
+
+    @property
+    def hits(self) -> int:
+        return self.get.cache_info().hits
+
+    @property
+    def misses(self) -> int:
+        return self.get.cache_info().misses
+
+    @staticmethod
+    def _compile(pattern: str, allow_environment_variables_jq_access: bool) -> Any:
+        """
+        Get the compiled program of a pattern, compiling and caching it when missing.
+
+        :raises ValueError: If the pattern can't be compiled, the failure isn't cached
+        """
+        program = pattern.strip()
+        if not allow_environment_variables_jq_access:
+            program = ENV_ACCESS_DISABLED_PREFIX + program
+        return jq.compile(program)
+
+    def clear(self) -> None:
+        self.get.cache_clear()
+
+
+compiled_jq_cache = CompiledJQCache()
@@ -1,13 +1,17 @@
 import asyncio
+import json
 from asyncio import Task
 from dataclasses import dataclass, field
-from functools import lru_cache
 from typing import Any, Optional
-import jq  # type: ignore
 from loguru import logger
 
 from port_ocean.context.ocean import ocean
 from port_ocean.core.handlers.entity_processor.base import BaseEntityProcessor
+from port_ocean.core.handlers.entity_processor.jq_compiled_cache import (
+    compiled_jq_cache,
+)
+from port_ocean.core.handlers.entity_processor.jq_process_pool import JQProcessPool
+from port_ocean.core.handlers.port_app_config.models import PortAppConfig
 from port_ocean.core.handlers.port_app_config.models import ResourceConfig
 from port_ocean.core.models import Entity
 from port_ocean.core.ocean_types import (
@@ -20,6 +24,7 @@ from port_ocean.core.utils.utils import (
     zip_and_sum,
 )
 from port_ocean.exceptions.core import EntityProcessorException
+from port_ocean.helpers.metric.metric import MetricPhase, MetricType
 from port_ocean.utils.queue_utils import process_in_queue
 
 
@@ -44,11 +49,30 @@ class JQEntityProcessor(BaseEntityProcessor):
     searching for data in dictionaries, and transforming data based on object mappings.
     """
 
-    @lru_cache
+    _process_pool: JQProcessPool | None = None
+
     def _compile(self, pattern: str) -> Any:
-        if not ocean.config.allow_environment_variables_jq_access:
-            pattern = "def env: {}; {} as $ENV | " + pattern
-        return jq.compile(pattern)
+        return compiled_jq_cache.get(
+            pattern, bool(ocean.config.allow_environment_variables_jq_access)
+        )
+
+    @staticmethod
+    def _report_compiled_cache_metrics(hits: int, misses: int) -> None:
+        """Report the compiled JQ cache lookups made since the cache had `hits` hits and `misses` misses"""
+        for cache_result, count in (
+            (MetricPhase.CacheResult.HIT, compiled_jq_cache.hits - hits),
+            (MetricPhase.CacheResult.MISS, compiled_jq_cache.misses - misses),
+        ):
+            if count > 0:
+                ocean.metrics.inc_metric(
+                    name=MetricType.JQ_COMPILED_CACHE_NAME,
+                    labels=[
+                        ocean.metrics.current_resource_kind(),
+                        MetricPhase.TRANSFORM,
+                        cache_result,
+                    ],
+                    value=count,
+                )
 
     @staticmethod
     def _stop_iterator_handler(func: Any) -> Any:
@@ -224,6 +248,204 @@ class JQEntityProcessor(BaseEntityProcessor):
             )
         return entities, errors
 
+    @staticmethod
+    def _build_batch_field_expression(pattern: str) -> str:
+        """
+        Wrap a field pattern so it behaves like `_search`, taking its first output and evaluating to null when the
+        pattern fails or has no output. The pattern is closed on a new line so trailing comments don't swallow it.
+        """
+        return f"(try ([limit(1; ({pattern}\n))] | .[0]) catch null)"
+
+    @classmethod
+    def _build_batch_object_expression(cls, obj: Any) -> str:
+        """Build a JQ expression that constructs the mapped object in the same shape as `_search_as_object`"""
+        if isinstance(obj, dict):
+            fields = ", ".join(
+                f"{json.dumps(key)}: {cls._build_batch_object_expression(value)}"
+                for key, value in obj.items()
+            )
+            return f"{{{fields}}}"
+        if isinstance(obj, list):
+            if not all(isinstance(item, dict) for item in obj):
+                raise EntityProcessorException(
+                    f"Batch evaluation supports only lists of objects in the mapping, got: {obj}"
+                )
+            items = ", ".join(cls._build_batch_object_expression(item) for item in obj)
+            return f"[{items}]"
+        if isinstance(obj, str):
+            return cls._build_batch_field_expression(obj)
+        return "null"
+
+    @classmethod
+    def _build_batch_program(
+        cls,
+        raw_entity_mappings: dict[str, Any],
+        selector_query: str,
+        parse_all: bool,
+    ) -> str:
+        """
+        Build a single JQ program that maps an array of raw results into an array of `{selector, entity}` objects.
+        The entity is only calculated when the selector is a boolean and either passed or `parse_all` is set.
+        """
+        selector = cls._build_batch_field_expression(selector_query)
+        entity = cls._build_batch_object_expression(raw_entity_mappings)
+        should_map = "true" if parse_all else "$__ocean_selector"
+        return (
+            f"map({selector} as $__ocean_selector | {{"
+            f'"selector": $__ocean_selector, '
+            f'"entity": (if ($__ocean_selector | type) == "boolean" and ({should_map}) '
+            f"then {entity} else null end)}})"
+        )
+
+    @classmethod
+    def _build_batch_items_program(cls, items_to_parse: str) -> str:
+        return f"map({cls._build_batch_field_expression(items_to_parse)})"
+
+    def _get_process_pool(self, workers: int) -> JQProcessPool:
+        if self._process_pool is None or self._process_pool.workers != workers:
+            if self._process_pool is not None:
+                self._process_pool.shutdown()
+            self._process_pool = JQProcessPool(workers)
+        return self._process_pool
+
+    async def _search_batch(self, data: list[Any], program: str) -> Any:
+        """
+        Evaluate a JQ program over a whole batch in a single executor call,
+        or split between the JQ worker processes when they are configured
+        """
+        workers = ocean.config.jq_transform_workers
+        if workers > 0:
+            allow_environment_variables_jq_access = bool(
+                ocean.config.allow_environment_variables_jq_access
+            )
+            return await self._get_process_pool(workers).evaluate(
+                program, data, allow_environment_variables_jq_access
+            )
+
+        loop = asyncio.get_event_loop()
+        compiled_program = self._compile(program)
+        return await loop.run_in_executor(
+            None,
+            self._stop_iterator_handler(
+                lambda: compiled_program.input_value(data).first()
+            ),
+        )
+
+    @classmethod
+    def _collect_misconfigurations(
+        cls,
+        obj: dict[str, Any],
+        mapped_object: dict[str, Any],
+        misconfigurations: dict[str, str],
+    ) -> None:
+        """Collect the mapping fields that evaluated to null, the same way `_search_as_object` does"""
+        for key, value in obj.items():
+            mapped_value = mapped_object.get(key)
+            if isinstance(value, list):
+                for item, mapped_item in zip(value, mapped_value or []):
+                    cls._collect_misconfigurations(
+                        item, mapped_item or {}, misconfigurations
+                    )
+            elif isinstance(value, dict):
+                cls._collect_misconfigurations(
+                    value, mapped_value or {}, misconfigurations
+                )
+            elif mapped_value is None:
+                misconfigurations[key] = value
+
+    async def _expand_batch_items(
+        self, raw_results: list[RAW_ITEM], items_to_parse: str | None
+    ) -> list[dict[str, Any]]:
+        if not items_to_parse:
+            return list(raw_results)
+
+        items_per_result = await self._search_batch(
+            raw_results, self._build_batch_items_program(items_to_parse)
+        )
+        raw_data: list[dict[str, Any]] = []
+        for data, items in zip(raw_results, items_per_result):
+            if not isinstance(items, list):
+                logger.warning(
+                    f"Failed to parse items for JQ expression {items_to_parse}, Expected list but got {type(items)}."
+                    f" Skipping..."
+                )
+                continue
+            raw_data.extend({"item": item, **data} for item in items)
+        return raw_data
+
+    async def _calculate_entities_batch(
+        self,
+        raw_results: list[RAW_ITEM],
+        raw_entity_mappings: dict[str, Any],
+        items_to_parse: str | None,
+        selector_query: str,
+        parse_all: bool = False,
+    ) -> tuple[list[MappedEntity], list[Exception]]:
+        """
+        Calculate the entities of a whole batch using a single JQ program.
+        Raw results whose selector isn't a boolean are evaluated per field so their errors are reported as usual,
+        and the whole batch is evaluated per field if the batch program can't be built or evaluated.
+        """
+        if not raw_results:
+            return [], []
+
+        try:
+            raw_data = await self._expand_batch_items(raw_results, items_to_parse)
+            program = self._build_batch_program(
+                raw_entity_mappings, selector_query, parse_all
+            )
+            mapped_results = await self._search_batch(raw_data, program) or []
+        except Exception as exc:
+            logger.debug(
+                f"Batch evaluation of the mapping failed, falling back to per field evaluation. Error: {exc}"
+            )
+            return zip_and_sum(
+                await process_in_queue(
+                    raw_results,
+                    self._calculate_entity,
+                    raw_entity_mappings,
+                    items_to_parse,
+                    selector_query,
+                    parse_all,
+                )
+            )
+
+        entities: list[MappedEntity] = []
+        per_field_raw_data: list[dict[str, Any]] = []
+        for data, mapped_result in zip(raw_data, mapped_results):
+            should_run = mapped_result["selector"]
+            if not isinstance(should_run, bool):
+                per_field_raw_data.append(data)
+            elif parse_all or should_run:
+                misconfigurations: dict[str, str] = {}
+                self._collect_misconfigurations(
+                    raw_entity_mappings, mapped_result["entity"], misconfigurations
+                )
+                entities.append(
+                    MappedEntity(
+                        mapped_result["entity"],
+                        did_entity_pass_selector=should_run,
+                        raw_data=data if should_run else None,
+                        misconfigurations=misconfigurations,
+                    )
+                )
+            else:
+                entities.append(MappedEntity())
+
+        per_field_entities, errors = await gather_and_split_errors_from_results(
+            [
+                self._get_mapped_entity(
+                    data, raw_entity_mappings, selector_query, parse_all
+                )
+                for data in per_field_raw_data
+            ]
+        )
+        if errors:
+            logger.error(
+                f"Failed to calculate entities with {len(errors)} errors. errors: {errors}"
+            )
+        return entities + per_field_entities, errors
+
     @staticmethod
     async def _send_examples(data: list[dict[str, Any]], kind: str) -> None:
         try:
@@ -248,16 +470,28 @@ class JQEntityProcessor(BaseEntityProcessor):
             exclude_unset=True
         )
         logger.info(f"Parsing {len(raw_results)} raw results into entities")
-        calculated_entities_results, errors = zip_and_sum(
-            await process_in_queue(
+        # The cache lookups are counted by the cache and reported once per batch, as there is one per mapped field
+        cache_hits, cache_misses = compiled_jq_cache.hits, compiled_jq_cache.misses
+        if ocean.config.jq_batch_evaluation or ocean.config.jq_transform_workers > 0:
+            calculated_entities_results, errors = await self._calculate_entities_batch(
                 raw_results,
-                self._calculate_entity,
                 raw_entity_mappings,
                 mapping.port.items_to_parse,
                 mapping.selector.query,
                 parse_all,
             )
-        )
+        else:
+            calculated_entities_results, errors = zip_and_sum(
+                await process_in_queue(
+                    raw_results,
+                    self._calculate_entity,
+                    raw_entity_mappings,
+                    mapping.port.items_to_parse,
+                    mapping.selector.query,
+                    parse_all,
+                )
+            )
+        self._report_compiled_cache_metrics(cache_hits, cache_misses)
         logger.debug(
             f"Finished parsing raw results into entities with {len(errors)} errors. errors: {errors}"
         )
@@ -311,3 +545,59 @@ class JQEntityProcessor(BaseEntityProcessor):
             errors,
             misonfigured_entity_keys=entity_misconfigurations,
         )
+
+    @classmethod
+    def _get_mapping_patterns(cls, obj: Any) -> list[str]:
+        if isinstance(obj, dict):
+            return [
+                pattern
+                for value in obj.values()
+                for pattern in cls._get_mapping_patterns(value)
+            ]
+        if isinstance(obj, list):
+            return [
+                pattern for item in obj for pattern in cls._get_mapping_patterns(item)
+            ]
+        return [obj] if isinstance(obj, str) else []
+
+    def _get_resource_programs(self, resource: ResourceConfig) -> list[str]:
+        raw_entity_mappings: dict[str, Any] = resource.port.entity.mappings.dict(
+            exclude_unset=True
+        )
+        programs = [resource.selector.query]
+        if resource.port.items_to_parse:
+            programs.append(resource.port.items_to_parse)
+        programs.extend(self._get_mapping_patterns(raw_entity_mappings))
+
+        if ocean.config.jq_batch_evaluation or ocean.config.jq_transform_workers > 0:
+            if resource.port.items_to_parse:
+                programs.append(
+                    self._build_batch_items_program(resource.port.items_to_parse)
+                )
+            try:
+                programs.extend(
+                    self._build_batch_program(
+                        raw_entity_mappings, resource.selector.query, parse_all
+                    )
+                    for parse_all in (False, True)
+                )
+            except EntityProcessorException:
+                pass
+        return programs
+
+    def warm_up(self, port_app_config: PortAppConfig) -> None:
+        """Compile the JQ programs of all the mapped resources ahead of the resync"""
+        compiled_programs = 0
+        for resource in port_app_config.resources:
+            for program in self._get_resource_programs(resource):
+                try:
+                    self._compile(program)
+                    compiled_programs += 1
+                except Exception as exc:
+                    logger.debug(
+                        f"Failed to compile JQ program '{program}' of kind {resource.kind}, Error: {exc}"
+                    )
+        logger.info(
+            f"Warmed up the compiled JQ cache with {compiled_programs} programs",
+            cache_size=len(compiled_jq_cache),
+        )
@@ -0,0 +1,101 @@
+import asyncio
+import json
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from loguru import logger
+
+from port_ocean.core.handlers.entity_processor.jq_compiled_cache import (
+    compiled_jq_cache,
+)
+
+# Chunks smaller than this cost more in inter process communication than they save in evaluation time
+MIN_CHUNK_SIZE = 100
+
+
+def _evaluate_chunk(
+    program: str, allow_environment_variables_jq_access: bool, chunk: str
+) -> str:
+    """
+    Runs inside the pool workers, each worker keeps its own copy of the compiled programs cache,
+    starting from the programs that were compiled before the worker was forked.
+    The chunk and the result are passed as JSON text so they are cheap to pickle and jq can parse them directly.
+    """
+    compiled_program = compiled_jq_cache.get(
+        program, allow_environment_variables_jq_access
+    )
+    return compiled_program.input_text(chunk).text()
+
+
+class JQProcessPool:
+    """Evaluates batch JQ programs in a pool of long-lived worker processes.
+
+    JQ evaluation holds the GIL, so running it in the default thread executor keeps the transformation on a single
+    core. The pool splits a batch into chunks and evaluates them in parallel worker processes instead.
+
+    The pool belongs to the process that created it, a forked process (e.g. a resource resync in `multi_process`
+    mode) creates its own pool on first use.
+
+    Args:
+        workers: The number of worker processes.
+    """
+
+    def __init__(self, workers: int) -> None:
+        self.workers = workers
+        self._executor: ProcessPoolExecutor | None = None
+        self._owner_pid: int | None = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None or self._owner_pid != os.getpid():
+            logger.info(f"Starting JQ process pool with {self.workers} workers")
+            # Forking keeps the workers independent of the integration entrypoint, the same way the resync
+            # processes are started
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("fork"),
+            )
+            self._owner_pid = os.getpid()
+        return self._executor
+
+    def _split_to_chunks(self, data: list[Any]) -> list[list[Any]]:
+        chunk_size = max(MIN_CHUNK_SIZE, math.ceil(len(data) / self.workers))
+        return [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
+
+    async def evaluate(
+        self,
+        program: str,
+        data: list[Any],
+        allow_environment_variables_jq_access: bool,
+    ) -> list[Any]:
+        """
+        Evaluate a program that maps an array into an array of the same length (e.g. `map(...)`) over the data.
+
+        :param program: The JQ program to evaluate on every chunk of the data
+        :param data: The batch to evaluate the program over
+        :param allow_environment_variables_jq_access: Whether the program may access the environment variables
+        :return: The concatenated results of all the chunks
+        """
+        loop = asyncio.get_event_loop()
+        executor = self._get_executor()
+        results = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    executor,
+                    _evaluate_chunk,
+                    program,
+                    allow_environment_variables_jq_access,
+                    json.dumps(chunk, separators=(",", ":")),
+                )
+                for chunk in self._split_to_chunks(data)
+            )
+        )
+        return [item for result in results for item in json.loads(result)]
+
+    def shutdown(self) -> None:
+        if self._executor is not None and self._owner_pid == os.getpid():
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+        self._owner_pid = None
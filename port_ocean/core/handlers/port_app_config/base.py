@@ -1,3 +1,5 @@
+import asyncio
+import time
 from abc import abstractmethod
 from typing import Type, Any
 
@@ -8,6 +10,7 @@ from port_ocean.context.event import event
 from port_ocean.context.ocean import PortOceanContext
 from port_ocean.core.handlers.base import BaseHandler
 from port_ocean.core.handlers.port_app_config.models import PortAppConfig
+from port_ocean.helpers.metric.metric import MetricType
 from port_ocean.utils.misc import get_time
 
 
@@ -27,15 +30,22 @@ class PortAppConfigCache:
 
     @port_app_config.setter
     def port_app_config(self, value: PortAppConfig) -> None:
-        self._retrieval_time = get_time()
+        self.set_port_app_config(value, get_time(seconds_precision=False))
+
+    def set_port_app_config(self, value: PortAppConfig, retrieval_time: float) -> None:
+        self._retrieval_time = retrieval_time
         self._port_app_config = value
 
     @property
     def is_cache_invalid(self) -> bool:
-        return (
-            not self._port_app_config
-            or self._retrieval_time + self._cache_ttl < get_time()
-        )
+        return not self._port_app_config or self.age_seconds > self._cache_ttl
+
+    @property
+    def age_seconds(self) -> float:
+        return get_time(seconds_precision=False) - self._retrieval_time
+
+    def was_retrieved_since(self, timestamp: float) -> bool:
+        return self._port_app_config is not None and self._retrieval_time > timestamp
 
 
 class BasePortAppConfig(BaseHandler):
@@ -55,28 +65,66 @@ class BasePortAppConfig(BaseHandler):
         self._app_config_cache = PortAppConfigCache(
             self.context.config.port.port_app_config_cache_ttl
         )
+        self._fetch_lock = asyncio.Lock()
 
     @abstractmethod
     async def _get_port_app_config(self) -> dict[str, Any]:
         pass
 
-    async def get_port_app_config(self, use_cache: bool = True) -> PortAppConfig:
+    def _warm_up_entity_processor(self, port_app_config: PortAppConfig) -> None:
+        try:
+            self.context.integration.entity_processor.warm_up(port_app_config)
+        except Exception as exc:
+            logger.warning(f"Failed to warm up the entity processor: {exc}")
+
+    def _should_fetch_port_app_config(
+        self, use_cache: bool, max_age_seconds: float | None
+    ) -> bool:
+        if not use_cache or self._app_config_cache.is_cache_invalid:
+            return True
+        return (
+            max_age_seconds is not None
+            and self._app_config_cache.age_seconds >= max_age_seconds
+        )
+
+    async def _fetch_port_app_config(self) -> None:
+        # The config is as fresh as the start of the fetch, as it may have changed while it was fetched
+        fetch_started_at = get_time(seconds_precision=False)
+        start = time.monotonic()
+        raw_config = await self._get_port_app_config()
+        self.context.metrics.set_metric(
+            name=MetricType.PORT_APP_CONFIG_FETCH_DURATION_NAME,
+            labels=[self.context.metrics.current_resource_kind()],
+            value=time.monotonic() - start,
+        )
+        try:
+            port_app_config = self.CONFIG_CLASS.parse_obj(raw_config)
+        except ValidationError as e:
+            logger.error(f"Invalid port app config found: {str(e)}")
+            logger.warning(f"Invalid port app config: {raw_config}")
+            raise
+        self._app_config_cache.set_port_app_config(port_app_config, fetch_started_at)
+        self._warm_up_entity_processor(port_app_config)
+
+    async def get_port_app_config(
+        self, use_cache: bool = True, max_age_seconds: float | None = None
+    ) -> PortAppConfig:
         """
         Retrieve and parse the port application configuration.
 
+        Concurrent calls share a single fetch, a call waiting for another call's fetch uses its result when that fetch
+        started after the call was made.
+
         :param use_cache: Determines whether to use the cached port-app-config if it exists, or to fetch it regardless
+        :param max_age_seconds: The age after which the cached port-app-config is fetched again, when shorter than the
+            cache TTL
         :return: The parsed port application configuration.
         """
-        if not use_cache or self._app_config_cache.is_cache_invalid:
-            raw_config = await self._get_port_app_config()
-            try:
-                self._app_config_cache.port_app_config = self.CONFIG_CLASS.parse_obj(
-                    raw_config
-                )
-            except ValidationError as e:
-                logger.error(f"Invalid port app config found: {str(e)}")
-                logger.warning(f"Invalid port app config: {raw_config}")
-                raise
+        if self._should_fetch_port_app_config(use_cache, max_age_seconds):
+            requested_at = get_time(seconds_precision=False)
+            async with self._fetch_lock:
+                if not self._app_config_cache.was_retrieved_since(requested_at):
+                    await self._fetch_port_app_config()
 
         event.port_app_config = self._app_config_cache.port_app_config
         return self._app_config_cache.port_app_config
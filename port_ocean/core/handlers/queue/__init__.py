@@ -1,4 +1,5 @@
 from .abstract_queue import AbstractQueue
+from .disk_queue import DiskQueue
 from .local_queue import LocalQueue
 
-__all__ = ["AbstractQueue", "LocalQueue"]
+__all__ = ["AbstractQueue", "DiskQueue", "LocalQueue"]
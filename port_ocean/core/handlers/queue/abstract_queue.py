@@ -9,7 +9,7 @@ class AbstractQueue(ABC, Generic[T]):
 
     @abstractmethod
     async def put(self, item: T) -> None:
-        """Put an item into the queue"""
+        """Put an item into the queue, raises QueueFullException when the queue is full"""
         pass
 
     @abstractmethod
@@ -26,3 +26,13 @@ class AbstractQueue(ABC, Generic[T]):
     async def commit(self) -> None:
         """Mark item as processed"""
         pass
+
+    @property
+    def depth(self) -> int:
+        """The number of items that were put and not committed yet, 0 when the queue doesn't track it"""
+        return 0
+
+    @property
+    def lag_seconds(self) -> float:
+        """The time since the oldest item that wasn't committed yet was put, 0 when the queue doesn't track it"""
+        return 0.0
@@ -0,0 +1,304 @@
+import asyncio
+import mmap
+import os
+import struct
+import time
+import zlib
+from collections import deque
+from pathlib import Path
+from typing import BinaryIO, Callable, TypeVar
+
+from loguru import logger
+
+from port_ocean.exceptions.core import QueueFullException
+
+from .abstract_queue import AbstractQueue
+
+T = TypeVar("T")
+
+# Each record is the length and the crc32 of its payload and the time it was put, followed by the payload
+RECORD_HEADER = struct.Struct("<IId")
+SEGMENT_SUFFIX = ".log"
+CHECKPOINT_FILE_NAME = "checkpoint"
+
+
+class DiskQueue(AbstractQueue[T]):
+    """A queue that keeps its items on disk, so they survive a restart of the integration.
+
+    The items are appended to a log split into segment files, and read back from memory maps of the segments.
+    Every item has an offset, its position in the log. The offset of the items that were committed is written to a
+    checkpoint file every `checkpoint_interval` commits and whenever all the items were committed, and the segments
+    that only hold committed items are deleted then. When the queue is opened again, the items after the checkpoint
+    are read again, so an item is processed at least once.
+
+    The items are committed in the order they were gotten, so the queue must have a single consumer that commits each
+    item once it finished processing it. An item committed out of order would count an earlier item that is still
+    being processed as committed, and it would be lost if the integration crashes.
+
+    Args:
+        directory: The directory of the segments and the checkpoint of the queue.
+        serialize: Serializes an item to bytes.
+        deserialize: Deserializes an item from its bytes.
+        max_size: The number of items that weren't committed yet after which `put` raises QueueFullException,
+            0 doesn't limit the queue.
+        segment_max_bytes: The size after which a new segment is started.
+        checkpoint_interval: The number of commits between checkpoints.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        serialize: Callable[[T], bytes],
+        deserialize: Callable[[bytes], T],
+        max_size: int = 0,
+        segment_max_bytes: int = 64 * 1024 * 1024,
+        checkpoint_interval: int = 100,
+    ) -> None:
+        self.directory = Path(directory)
+        self._serialize = serialize
+        self._deserialize = deserialize
+        self._max_size = max_size
+        self._segment_max_bytes = segment_max_bytes
+        self._checkpoint_interval = checkpoint_interval
+
+        # The first offset and the size of each segment, oldest first
+        self._segments: list[int] = []
+        self._segment_sizes: list[int] = []
+        # The put times of the items that weren't committed yet, oldest first
+        self._put_times: deque[float] = deque()
+        self._end_offset = 0
+        self._committed_offset = 0
+        self._checkpointed_offset = 0
+        self._read_offset = 0
+        self._read_segment = 0
+        self._read_position = 0
+        self._read_map: mmap.mmap | None = None
+        self._items_available = asyncio.Event()
+        self._all_committed = asyncio.Event()
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._recover()
+        self._writer: BinaryIO = open(self._segment_path(self._segments[-1]), "ab")
+        if self.depth:
+            logger.info(
+                f"Replaying {self.depth} items of the queue in {self.directory}"
+            )
+            self._items_available.set()
+        else:
+            self._all_committed.set()
+
+    def _segment_path(self, first_offset: int) -> Path:
+        return self.directory / f"{first_offset:020d}{SEGMENT_SUFFIX}"
+
+    @property
+    def _checkpoint_path(self) -> Path:
+        return self.directory / CHECKPOINT_FILE_NAME
+
+    def _read_checkpoint(self) -> int:
+        try:
+            return int(self._checkpoint_path.read_text())
+        except FileNotFoundError:
+            return 0
+        except (ValueError, OSError) as e:
+            logger.warning(
+                f"Failed to read the checkpoint of the queue in {self.directory}, replaying all its items: {e}"
+            )
+            return 0
+
+    def _recover(self) -> None:
+        """Scan the segments for the items that weren't committed, truncating a record that was only partly written"""
+        self._committed_offset = self._read_checkpoint()
+        segments = sorted(
+            int(path.stem) for path in self.directory.glob(f"*{SEGMENT_SUFFIX}")
+        )
+        for index, first_offset in enumerate(segments):
+            if (
+                index + 1 < len(segments)
+                and segments[index + 1] <= self._committed_offset
+            ):
+                self._segment_path(first_offset).unlink()
+                continue
+            self._recover_segment(first_offset)
+
+        if not self._segments:
+            self._segments.append(self._committed_offset)
+            self._segment_sizes.append(0)
+            self._end_offset = self._committed_offset
+            self._segment_path(self._committed_offset).touch()
+
+        # The checkpoint can't be ahead of the items that were written, or behind the oldest segment
+        self._committed_offset = min(
+            max(self._committed_offset, self._segments[0]), self._end_offset
+        )
+        self._checkpointed_offset = self._committed_offset
+        self._seek_read_offset(self._committed_offset)
+
+    def _recover_segment(self, first_offset: int) -> None:
+        path = self._segment_path(first_offset)
+        offset = first_offset
+        position = 0
+        with open(path, "rb") as f:
+            content = f.read()
+        while position + RECORD_HEADER.size <= len(content):
+            length, crc, put_time = RECORD_HEADER.unpack_from(content, position)
+            payload_start = position + RECORD_HEADER.size
+            payload = content[payload_start : payload_start + length]
+            if len(payload) < length or zlib.crc32(payload) != crc:
+                break
+            if offset >= self._committed_offset:
+                self._put_times.append(put_time)
+            position = payload_start + length
+            offset += 1
+
+        if position < len(content):
+            logger.warning(
+                f"Truncating a partly written record at the end of the queue segment {path}"
+            )
+            os.truncate(path, position)
+        self._segments.append(first_offset)
+        self._segment_sizes.append(position)
+        self._end_offset = offset
+
+    def _seek_read_offset(self, offset: int) -> None:
+        """Move the reading position to the record of an offset, counting the records from the start of its segment"""
+        self._read_segment = 0
+        while (
+            self._read_segment + 1 < len(self._segments)
+            and self._segments[self._read_segment + 1] <= offset
+        ):
+            self._read_segment += 1
+        self._read_offset = self._segments[self._read_segment]
+        self._read_position = 0
+        with open(self._segment_path(self._read_offset), "rb") as f:
+            while (
+                self._read_offset < offset
+                and self._read_position < self._segment_sizes[self._read_segment]
+            ):
+                length, _, _ = RECORD_HEADER.unpack(f.read(RECORD_HEADER.size))
+                f.seek(length, os.SEEK_CUR)
+                self._read_position += RECORD_HEADER.size + length
+                self._read_offset += 1
+
+    async def put(self, item: T) -> None:
+        if self._max_size and self.depth >= self._max_size:
+            raise QueueFullException(f"The queue is full with {self.depth} items")
+        payload = self._serialize(item)
+        record_size = RECORD_HEADER.size + len(payload)
+        if (
+            self._segment_sizes[-1]
+            and self._segment_sizes[-1] + record_size > self._segment_max_bytes
+        ):
+            self._start_segment()
+
+        put_time = time.time()
+        self._writer.write(
+            RECORD_HEADER.pack(len(payload), zlib.crc32(payload), put_time) + payload
+        )
+        # The records are read from memory maps of the segment files, so they are written through to the file
+        self._writer.flush()
+        self._segment_sizes[-1] += record_size
+        self._end_offset += 1
+        self._put_times.append(put_time)
+        self._all_committed.clear()
+        self._items_available.set()
+
+    def _start_segment(self) -> None:
+        self._writer.close()
+        self._segments.append(self._end_offset)
+        self._segment_sizes.append(0)
+        self._writer = open(self._segment_path(self._end_offset), "ab")
+
+    async def get(self) -> T:
+        # The item is read without awaiting once it is available, so a get that is cancelled never loses an item
+        while self._read_offset >= self._end_offset:
+            self._items_available.clear()
+            await self._items_available.wait()
+        return self._read_next()
+
+    def _read_next(self) -> T:
+        while self._read_position >= self._segment_sizes[self._read_segment]:
+            self._close_read_map()
+            self._read_segment += 1
+            self._read_offset = self._segments[self._read_segment]
+            self._read_position = 0
+
+        length, _, _ = RECORD_HEADER.unpack_from(
+            self._get_read_map(self._read_position + RECORD_HEADER.size),
+            self._read_position,
+        )
+        payload_start = self._read_position + RECORD_HEADER.size
+        read_map = self._get_read_map(payload_start + length)
+        payload = read_map[payload_start : payload_start + length]
+        self._read_position = payload_start + length
+        self._read_offset += 1
+        return self._deserialize(payload)
+
+    def _get_read_map(self, size: int) -> mmap.mmap:
+        """Get a memory map of the segment being read that covers at least `size` bytes"""
+        if self._read_map is None or len(self._read_map) < size:
+            self._close_read_map()
+            with open(
+                self._segment_path(self._segments[self._read_segment]), "rb"
+            ) as f:
+                self._read_map = mmap.mmap(
+                    f.fileno(),
+                    self._segment_sizes[self._read_segment],
+                    access=mmap.ACCESS_READ,
+                )
+        return self._read_map
+
+    def _close_read_map(self) -> None:
+        if self._read_map is not None:
+            self._read_map.close()
+            self._read_map = None
+
+    async def commit(self) -> None:
+        if self._committed_offset >= self._read_offset:
+            raise ValueError("commit() called more times than items were gotten")
+        self._committed_offset += 1
+        self._put_times.popleft()
+        if not self.depth:
+            self._checkpoint()
+            self._all_committed.set()
+        elif (
+            self._committed_offset - self._checkpointed_offset
+            >= self._checkpoint_interval
+        ):
+            self._checkpoint()
+
+    def _checkpoint(self) -> None:
+        """Write the offset of the committed items, and delete the segments that only hold committed items"""
+        if self._committed_offset == self._checkpointed_offset:
+            return
+        temporary_path = self._checkpoint_path.with_suffix(".tmp")
+        with open(temporary_path, "w") as f:
+            f.write(str(self._committed_offset))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary_path, self._checkpoint_path)
+        self._checkpointed_offset = self._committed_offset
+
+        while len(self._segments) > 1 and self._segments[1] <= self._committed_offset:
+            # The items of the segment were committed, so they were already read and the reader is at its end or
+            # in a later segment
+            self._segment_path(self._segments.pop(0)).unlink()
+            self._segment_sizes.pop(0)
+            if self._read_segment:
+                self._read_segment -= 1
+            else:
+                self._close_read_map()
+                self._read_position = 0
+
+    async def teardown(self) -> None:
+        try:
+            await self._all_committed.wait()
+        finally:
+            self._checkpoint()
+
+    @property
+    def depth(self) -> int:
+        return self._end_offset - self._committed_offset
+
+    @property
+    def lag_seconds(self) -> float:
+        return time.time() - self._put_times[0] if self._put_times else 0.0
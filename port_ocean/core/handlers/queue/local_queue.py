@@ -1,19 +1,34 @@
 import asyncio
+import time
+from collections import deque
 from typing import TypeVar
 
+from port_ocean.exceptions.core import QueueFullException
+
 from .abstract_queue import AbstractQueue
 
 T = TypeVar("T")
 
 
 class LocalQueue(AbstractQueue[T]):
-    """Implementation of Queue using asyncio.Queue"""
+    """Implementation of Queue using asyncio.Queue
+
+    Args:
+        max_size: The number of items that weren't committed yet after which `put` raises QueueFullException,
+            0 doesn't limit the queue.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, max_size: int = 0) -> None:
         self._queue: asyncio.Queue[T] = asyncio.Queue()
+        self._max_size = max_size
+        # The put times of the items that weren't committed yet, oldest first
+        self._put_times: deque[float] = deque()
 
     async def put(self, item: T) -> None:
+        if self._max_size and self.depth >= self._max_size:
+            raise QueueFullException(f"The queue is full with {self.depth} items")
         await self._queue.put(item)
+        self._put_times.append(time.time())
 
     async def get(self) -> T:
         return await self._queue.get()
@@ -23,3 +38,12 @@ class LocalQueue(AbstractQueue[T]):
 
     async def commit(self) -> None:
         self._queue.task_done()
+        self._put_times.popleft()
+
+    @property
+    def depth(self) -> int:
+        return len(self._put_times)
+
+    @property
+    def lag_seconds(self) -> float:
+        return time.time() - self._put_times[0] if self._put_times else 0.0
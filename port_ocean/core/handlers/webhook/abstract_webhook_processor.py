@@ -83,6 +83,14 @@ class AbstractWebhookProcessor(ABC):
         )
         return delay
 
+    async def get_ordering_key(self, event: WebhookEvent) -> str | None:
+        """
+        Get the key of the entity the event is about, e.g. a repository ID or an issue key.
+        Events with the same key are processed in order, while events with different keys may be processed in
+        parallel. Events without a key are processed in order with each other. Override if needed
+        """
+        return None
+
     async def before_processing(self) -> None:
         """Hook to run before processing the event"""
         pass
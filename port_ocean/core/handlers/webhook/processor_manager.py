@@ -1,8 +1,14 @@
-from typing import Dict, Type, Set
+from pathlib import Path
+from typing import Any, Dict, Type, Set
+from urllib.parse import quote
 from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
 from loguru import logger
 import asyncio
+import json
+import zlib
 
+from port_ocean.config.settings import LiveEventsBatchSettings, LiveEventsQueueSettings
 from port_ocean.context.ocean import ocean
 from port_ocean.context.event import EventType, event_context
 from port_ocean.core.handlers.port_app_config.models import ResourceConfig
@@ -14,7 +20,13 @@ from port_ocean.context.event import event
 
 from .abstract_webhook_processor import AbstractWebhookProcessor
 from port_ocean.utils.signal import SignalHandler
-from port_ocean.core.handlers.queue import AbstractQueue, LocalQueue
+from port_ocean.core.handlers.queue import AbstractQueue, DiskQueue, LocalQueue
+from port_ocean.core.utils.entity_serialization import dumps
+from port_ocean.exceptions.core import QueueFullException
+from port_ocean.helpers.metric.metric import MetricType
+
+# The time a sender is asked to wait before retrying an event that was rejected because the queue is full
+QUEUE_FULL_RETRY_AFTER_SECONDS = 5
 
 
 class LiveEventsProcessorManager(LiveEventsMixin, EventsMixin):
@@ -26,6 +38,10 @@ class LiveEventsProcessorManager(LiveEventsMixin, EventsMixin):
         signal_handler: SignalHandler,
         max_event_processing_seconds: float,
         max_wait_seconds_before_shutdown: float,
+        event_workers_count: int = 1,
+        port_app_config_max_age_seconds: float = 0,
+        events_batch: LiveEventsBatchSettings | None = None,
+        events_queue: LiveEventsQueueSettings | None = None,
     ) -> None:
         self._router = router
         self._processors_classes: Dict[str, list[Type[AbstractWebhookProcessor]]] = {}
@@ -33,6 +49,16 @@ class LiveEventsProcessorManager(LiveEventsMixin, EventsMixin):
         self._webhook_processor_tasks: Set[asyncio.Task[None]] = set()
         self._max_event_processing_seconds = max_event_processing_seconds
         self._max_wait_seconds_before_shutdown = max_wait_seconds_before_shutdown
+        self._event_workers_count = max(1, event_workers_count)
+        self._port_app_config_max_age_seconds = port_app_config_max_age_seconds
+        self._events_batch = events_batch or LiveEventsBatchSettings()
+        self._events_queue = events_queue or LiveEventsQueueSettings()
+        if self._events_queue.durable and self._event_workers_count > 1:
+            # A durable queue checkpoints the events in the order they were taken from it, so an event committed by
+            # one worker could checkpoint an event another worker is still processing
+            raise ValueError(
+                "A durable live events queue requires a single event worker, set event_workers_count to 1"
+            )
         signal_handler.register(self.shutdown)
 
     async def start_processing_event_messages(self) -> None:
@@ -73,55 +99,175 @@ class LiveEventsProcessorManager(LiveEventsMixin, EventsMixin):
         )
         return created_processors
 
+    async def _get_ordering_key(
+        self, webhook_event: WebhookEvent, path: str
+    ) -> str | None:
+        """Get the ordering key of an event from the first processor of the path that returns one"""
+        for processor_class in self._processors_classes[path]:
+            try:
+                key = await processor_class(webhook_event).get_ordering_key(
+                    webhook_event
+                )
+            except Exception as e:
+                logger.exception(
+                    f"Error getting the ordering key of a webhook event for {path}: {str(e)}"
+                )
+                continue
+            if key is not None:
+                return key
+        return None
+
+    def _get_partition_index(self, key: str | None) -> int:
+        if key is None:
+            return 0
+        return zlib.crc32(key.encode()) % self._event_workers_count
+
     async def process_queue(self, path: str) -> None:
-        """Process events for a specific path in order"""
+        """Process events for a specific path.
+
+        With a single worker the events are processed in order. Otherwise the events are dispatched to the workers
+        by their ordering key, so events with the same key are processed in order by the same worker, while events
+        with different keys are processed in parallel. A worker holds at most one event it didn't start yet, so the
+        events stay in the queue of the path until a worker is ready for them and the dispatcher stops taking events
+        when the worker of the next one is busy.
+        """
+        if self._event_workers_count == 1:
+            await self._process_events(path, self._event_queues[path])
+            return
+
+        partitions: list[asyncio.Queue[WebhookEvent]] = [
+            asyncio.Queue(maxsize=1) for _ in range(self._event_workers_count)
+        ]
+        workers = [
+            asyncio.create_task(self._process_events(path, partition))
+            for partition in partitions
+        ]
+        try:
+            while True:
+                webhook_event = await self._event_queues[path].get()
+                key = await self._get_ordering_key(webhook_event, path)
+                await partitions[self._get_partition_index(key)].put(webhook_event)
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _get_webhook_events(
+        self,
+        queue: "AbstractQueue[WebhookEvent] | asyncio.Queue[WebhookEvent]",
+        webhook_events: list[WebhookEvent],
+    ) -> None:
+        """
+        Get the next events of a queue into `webhook_events`. Once an event arrived, the following events that arrive
+        within the batch window are added to it, up to the batch max size.
+        """
+        webhook_events.append(await queue.get())
+        deadline = (
+            asyncio.get_running_loop().time() + self._events_batch.max_wait_seconds
+        )
+        while len(webhook_events) < self._events_batch.max_size:
+            remaining_seconds = deadline - asyncio.get_running_loop().time()
+            if remaining_seconds <= 0:
+                break
+            try:
+                webhook_events.append(
+                    await asyncio.wait_for(queue.get(), remaining_seconds)
+                )
+            except asyncio.TimeoutError:
+                break
+
+    async def _process_webhook_event(
+        self,
+        webhook_event: WebhookEvent,
+        path: str,
+        processors: list[AbstractWebhookProcessor],
+    ) -> list[WebhookEventRawResults]:
+        """Process an event with its matching processors, which are added to `processors`, and return their results"""
+        matching_processors_with_resource = await self._extract_matching_processors(
+            webhook_event, path
+        )
+        processors.extend(
+            processor for _, processor in matching_processors_with_resource
+        )
+        webhook_event_raw_results_for_all_resources = await asyncio.gather(
+            *(
+                self._process_single_event(processor, path, resource)
+                for resource, processor in matching_processors_with_resource
+            ),
+            return_exceptions=True,
+        )
+        return [
+            result
+            for result in webhook_event_raw_results_for_all_resources
+            if isinstance(result, WebhookEventRawResults)
+        ]
+
+    async def _process_events(
+        self,
+        path: str,
+        queue: "AbstractQueue[WebhookEvent] | asyncio.Queue[WebhookEvent]",
+    ) -> None:
+        """
+        Process the events of a queue in order, committing each of them to the queue of the path.
+        The events that arrive together are processed as a batch, and their results are exported together.
+        The events of a batch that was cancelled, e.g. on shutdown, aren't committed, so a durable queue replays them.
+        """
         while True:
-            matching_processors_with_resource: list[
-                tuple[ResourceConfig, AbstractWebhookProcessor]
-            ] = []
-            webhook_event: WebhookEvent | None = None
+            processors: list[AbstractWebhookProcessor] = []
+            cancelled = False
+            webhook_events: list[WebhookEvent] = []
             try:
-                queue = self._event_queues[path]
-                webhook_event = await queue.get()
+                await self._get_webhook_events(queue, webhook_events)
                 with logger.contextualize(
-                    webhook_path=path, trace_id=webhook_event.trace_id
+                    webhook_path=path,
+                    trace_id=",".join(
+                        webhook_event.trace_id for webhook_event in webhook_events
+                    ),
                 ):
                     async with event_context(
                         EventType.HTTP_REQUEST,
                         trigger_type="machine",
                     ):
-                        # This forces the Processor manager to fetch the latest port app config for each event
+                        # The port app config is fetched again once it is older than the max age, which is 0 by
+                        # default so the latest port app config is used for each batch of events
                         await ocean.integration.port_app_config_handler.get_port_app_config(
-                            use_cache=False
-                        )
-                        matching_processors_with_resource = (
-                            await self._extract_matching_processors(webhook_event, path)
+                            max_age_seconds=self._port_app_config_max_age_seconds
                         )
-                        webhook_event_raw_results_for_all_resources = await asyncio.gather(
-                            *(
-                                self._process_single_event(processor, path, resource)
-                                for resource, processor in matching_processors_with_resource
-                            ),
-                            return_exceptions=True,
-                        )
-
-                        successful_raw_results: list[WebhookEventRawResults] = [
-                            result
-                            for result in webhook_event_raw_results_for_all_resources
-                            if isinstance(result, WebhookEventRawResults)
-                        ]
-
-                        if successful_raw_results:
+                        events_raw_results: list[list[WebhookEventRawResults]] = []
+                        for webhook_event in webhook_events:
+                            with logger.contextualize(trace_id=webhook_event.trace_id):
+                                if len(webhook_events) == 1:
+                                    raw_results = await self._process_webhook_event(
+                                        webhook_event, path, processors
+                                    )
+                                else:
+                                    # An event of a batch that fails doesn't fail the other events
+                                    try:
+                                        raw_results = await self._process_webhook_event(
+                                            webhook_event, path, processors
+                                        )
+                                    except Exception as e:
+                                        logger.exception(
+                                            f"Unexpected error in queue processor for {path}: {str(e)}"
+                                        )
+                                        continue
+                                if raw_results:
+                                    events_raw_results.append(raw_results)
+
+                        if events_raw_results:
                             logger.info(
                                 "Exporting raw event results to entities",
-                                webhook_event_raw_results_for_all_resources_length=len(
-                                    successful_raw_results
+                                webhook_event_raw_results_for_all_resources_length=sum(
+                                    len(raw_results)
+                                    for raw_results in events_raw_results
                                 ),
+                                webhook_events_count=len(events_raw_results),
                             )
-                            await self.sync_raw_results(successful_raw_results)
+                            await self.sync_events_raw_results(events_raw_results)
             except asyncio.CancelledError:
+                cancelled = True
                 logger.info(f"Queue processor for {path} is shutting down")
-                for _, processor in matching_processors_with_resource:
+                for processor in processors:
                     await processor.cancel()
                     self._timestamp_event_error(processor.event)
                 break
@@ -129,13 +275,15 @@ class LiveEventsProcessorManager(LiveEventsMixin, EventsMixin):
                 logger.exception(
                     f"Unexpected error in queue processor for {path}: {str(e)}"
                 )
-                for _, processor in matching_processors_with_resource:
+                for processor in processors:
                     self._timestamp_event_error(processor.event)
             finally:
-                if webhook_event:
-                    await self._event_queues[path].commit()
-                    # Prevents committing empty events for cases where we shutdown while processing
-                    webhook_event = None
+                # The events are only committed once their results were exported or failed to be
+                if not cancelled:
+                    for _ in webhook_events:
+                        await self._event_queues[path].commit()
+                    if webhook_events:
+                        self._report_queue_metrics(path)
 
     def _timestamp_event_error(self, event: WebhookEvent) -> None:
         """Timestamp an event as having an error"""
@@ -236,21 +384,50 @@ class LiveEventsProcessorManager(LiveEventsMixin, EventsMixin):
 
         if path not in self._processors_classes:
             self._processors_classes[path] = []
-            self._event_queues[path] = LocalQueue()
+            self._event_queues[path] = self._create_queue(path)
             self._register_route(path)
 
         self._processors_classes[path].append(processor)
 
+    def _create_queue(self, path: str) -> AbstractQueue[WebhookEvent]:
+        if not self._events_queue.durable:
+            return LocalQueue(max_size=self._events_queue.max_size)
+        return DiskQueue(
+            Path(self._events_queue.directory) / quote(path, safe=""),
+            serialize=lambda webhook_event: dumps(webhook_event.to_dict()),
+            deserialize=lambda data: WebhookEvent.from_dict(json.loads(data)),
+            max_size=self._events_queue.max_size,
+            segment_max_bytes=self._events_queue.segment_max_mb * 1024 * 1024,
+            checkpoint_interval=self._events_queue.checkpoint_interval,
+        )
+
+    def _report_queue_metrics(self, path: str) -> None:
+        queue = self._event_queues[path]
+        ocean.metrics.set_metric(
+            MetricType.LIVE_EVENTS_QUEUE_DEPTH_NAME, [path], queue.depth
+        )
+        ocean.metrics.set_metric(
+            MetricType.LIVE_EVENTS_QUEUE_LAG_NAME, [path], queue.lag_seconds
+        )
+
     def _register_route(self, path: str) -> None:
         """Register a route for a specific path"""
 
-        async def handle_webhook(request: Request) -> Dict[str, str]:
+        async def handle_webhook(request: Request) -> Any:
             """Handle incoming webhook requests for a specific path."""
             try:
                 webhook_event = await WebhookEvent.from_request(request)
-                webhook_event.set_timestamp(LiveEventTimestamp.AddedToQueue)
                 await self._event_queues[path].put(webhook_event)
+                webhook_event.set_timestamp(LiveEventTimestamp.AddedToQueue)
+                self._report_queue_metrics(path)
                 return {"status": "ok"}
+            except QueueFullException as e:
+                logger.warning(f"Rejecting a webhook event for {path}: {str(e)}")
+                return JSONResponse(
+                    status_code=429,
+                    content={"status": "error", "message": str(e)},
+                    headers={"Retry-After": str(QUEUE_FULL_RETRY_AFTER_SECONDS)},
+                )
             except Exception as e:
                 logger.exception(f"Error processing webhook: {str(e)}")
                 return {"status": "error", "message": str(e)}
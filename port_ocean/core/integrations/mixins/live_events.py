@@ -1,10 +1,25 @@
+from typing import Hashable
+
 from loguru import logger
 from port_ocean.clients.port.types import UserAgentType
+from port_ocean.core.handlers.port_app_config.models import ResourceConfig
 from port_ocean.core.handlers.webhook.webhook_event import WebhookEventRawResults
 from port_ocean.core.integrations.mixins.handler import HandlerMixin
 from port_ocean.core.models import Entity
+from port_ocean.core.ocean_types import RAW_ITEM
+from port_ocean.core.utils.entity_keys import get_comparable_entity_key, get_entity_key
 from port_ocean.context.ocean import ocean
 
+# The number of entities listed in the logs of an event, the rest of them are only counted
+LOGGED_ENTITIES_LIMIT = 10
+
+
+def _format_entities(entities: list[Entity]) -> str:
+    formatted = ', '.join(f'{entity.blueprint}/{entity.identifier}' for entity in entities[:LOGGED_ENTITIES_LIMIT])
+    if len(entities) > LOGGED_ENTITIES_LIMIT:
+        formatted += f' and {len(entities) - LOGGED_ENTITIES_LIMIT} more'
+    return formatted
+
 
 
 class LiveEventsMixin(HandlerMixin):
@@ -22,36 +37,101 @@ class LiveEventsMixin(HandlerMixin):
             await self._delete_entities(entities_to_delete)
 
 
-    async def _parse_raw_event_results_to_entities(self, webhook_events_raw_result: list[WebhookEventRawResults]) -> tuple[list[Entity], list[Entity]]:
-        """Parse the webhook event raw results and return a list of entities.
+    async def sync_events_raw_results(self, events_raw_results: list[list[WebhookEventRawResults]]) -> None:
+        """Process the raw results of a batch of webhook events and export them, as if the events were exported one after the other.
+
+        The raw results of the batch are parsed together, and each entity is upserted or deleted once with the last
+        change the events made to it, through the bulk APIs.
 
         Args:
-            webhook_events_raw_result: List of WebhookEventRawResults objects to process
+            events_raw_results: The raw results of each of the webhook events, in the order of the events
         """
+        if len(events_raw_results) == 1:
+            await self.sync_raw_results(events_raw_results[0])
+            return
+
+        entities, entities_not_passed, entities_to_delete = await self._parse_raw_event_results(
+            [raw_result for event_raw_results in events_raw_results for raw_result in event_raw_results]
+        )
+        upserted_keys = {self._get_coalescing_key(entity) for entity in entities}
+        if any(self._get_coalescing_key(entity) in upserted_keys for entity in entities_not_passed + entities_to_delete):
+            # An entity is both upserted and removed by the batch, so the order of the events decides what applies to it
+            changes = await self._get_changes_in_events_order(events_raw_results)
+        else:
+            changes = {self._get_coalescing_key(entity): (False, entity) for entity in entities_not_passed + entities_to_delete}
+            changes.update((self._get_coalescing_key(entity), (True, entity)) for entity in entities)
+
+        entities_to_upsert = [entity for is_upsert, entity in changes.values() if is_upsert]
+        entities_to_remove = [entity for is_upsert, entity in changes.values() if not is_upsert]
+        logger.info(f"Coalesced the results of {len(events_raw_results)} webhook events into {len(entities_to_upsert)} entities to upsert and {len(entities_to_remove)} entities to remove")
+        if entities_to_upsert:
+            await self.entities_state_applier.upsert(entities_to_upsert, UserAgentType.exporter)
+        if entities_to_remove:
+            await self._delete_entities(entities_to_remove)
+
+    async def _get_changes_in_events_order(self, events_raw_results: list[list[WebhookEventRawResults]]) -> dict[Hashable, tuple[bool, Entity]]:
+        """Get the last change of each entity, parsing the events one after the other"""
+        changes: dict[Hashable, tuple[bool, Entity]] = {}
+        for event_raw_results in events_raw_results:
+            entities, entities_to_remove = await self._parse_raw_event_results_to_entities(event_raw_results)
+            changes.update((self._get_coalescing_key(entity), (False, entity)) for entity in entities_to_remove)
+            changes.update((self._get_coalescing_key(entity), (True, entity)) for entity in entities)
+        return changes
+
+    @staticmethod
+    def _get_coalescing_key(entity: Entity) -> Hashable:
+        # Entities with a search identifier can't be matched with each other before they are upserted, so they are never coalesced
+        if entity.is_using_search_identifier:
+            return id(entity)
+        return get_entity_key(entity)
+
+    async def _parse_raw_event_results(self, webhook_events_raw_result: list[WebhookEventRawResults]) -> tuple[list[Entity], list[Entity], list[Entity]]:
+        """Parse the webhook event raw results, with a single parse of the updated and of the deleted raw results of each resource.
+
+        Returns:
+            The entities that passed the selector, the entities that didn't pass it and the entities to delete.
+        """
+        updated_raw_results: dict[int, tuple[ResourceConfig, list[RAW_ITEM]]] = {}
+        deleted_raw_results: dict[int, tuple[ResourceConfig, list[RAW_ITEM]]] = {}
+        for webhook_event_raw_result in webhook_events_raw_result:
+            resource = webhook_event_raw_result.resource
+            updated_raw_results.setdefault(id(resource), (resource, []))[1].extend(webhook_event_raw_result.updated_raw_results)
+            deleted_raw_results.setdefault(id(resource), (resource, []))[1].extend(webhook_event_raw_result.deleted_raw_results)
+
         entities: list[Entity] = []
         entities_not_passed: list[Entity] = []
         entities_to_delete: list[Entity] = []
-        for webhook_event_raw_result in webhook_events_raw_result:
-            for raw_item in webhook_event_raw_result.updated_raw_results:
+        for resource, raw_items in updated_raw_results.values():
+            if raw_items:
                 calaculation_results = await self.entity_processor.parse_items(
-                    webhook_event_raw_result.resource, [raw_item], parse_all=True, send_raw_data_examples_amount=0
+                    resource, raw_items, parse_all=True, send_raw_data_examples_amount=0
                 )
                 entities.extend(calaculation_results.entity_selector_diff.passed)
                 entities_not_passed.extend(calaculation_results.entity_selector_diff.failed)
 
-            for raw_item in webhook_event_raw_result.deleted_raw_results:
+        for resource, raw_items in deleted_raw_results.values():
+            if raw_items:
                 deletion_results = await self.entity_processor.parse_items(
-                    webhook_event_raw_result.resource, [raw_item], parse_all=True, send_raw_data_examples_amount=0
+                    resource, raw_items, parse_all=True, send_raw_data_examples_amount=0
                 )
                 entities_to_delete.extend(deletion_results.entity_selector_diff.passed)
+        return entities, entities_not_passed, entities_to_delete
+
+    async def _parse_raw_event_results_to_entities(self, webhook_events_raw_result: list[WebhookEventRawResults]) -> tuple[list[Entity], list[Entity]]:
+        """Parse the webhook event raw results and return a list of entities.
 
-        entities_to_remove = []
-        for entity in entities_to_delete + entities_not_passed:
-            if (entity.blueprint, entity.identifier) not in [(entity.blueprint, entity.identifier) for entity in entities]:
-                entities_to_remove.append(entity)
+        Args:
+            webhook_events_raw_result: List of WebhookEventRawResults objects to process
+        """
+        entities, entities_not_passed, entities_to_delete = await self._parse_raw_event_results(webhook_events_raw_result)
 
-        logger.info(f"Found {len(entities_to_remove)} entities to remove {', '.join(f'{entity.blueprint}/{entity.identifier}' for entity in entities_to_remove)}")
-        logger.info(f"Found {len(entities)} entities to upsert {', '.join(f'{entity.blueprint}/{entity.identifier}' for entity in entities)}")
+        upserted_keys = {get_comparable_entity_key(entity) for entity in entities}
+        entities_to_remove = [
+            entity for entity in entities_to_delete + entities_not_passed if get_comparable_entity_key(entity) not in upserted_keys
+        ]
+
+        logger.info(f"Found {len(entities_to_remove)} entities to remove {_format_entities(entities_to_remove)}")
+        logger.info(f"Found {len(entities)} entities to upsert {_format_entities(entities)}")
         return entities, entities_to_remove
 
     async def _does_entity_exists(self, entity: Entity) -> bool:
@@ -85,6 +165,23 @@ class LiveEventsMixin(HandlerMixin):
         return len(entities_at_port) > 0
 
     async def _delete_entities(self, entities: list[Entity]) -> None:
+        if len(entities) == 1:
+            if await self._does_entity_exists(entities[0]):
+                await self.entities_state_applier.delete(entities, UserAgentType.exporter)
+            return
+
+        # The entities that exist in Port are found with a single search and deleted in bulk, entities with a search
+        # identifier can't be matched with the search results and are still checked one by one
+        entities_with_key = [entity for entity in entities if not entity.is_using_search_identifier]
+        existing_keys = set()
+        if entities_with_key:
+            existing_keys = {
+                get_entity_key(entity)
+                for entity in await ocean.port_client.search_batch_entities(UserAgentType.exporter, entities_with_key)
+            }
+        entities_to_delete = [entity for entity in entities_with_key if get_entity_key(entity) in existing_keys]
         for entity in entities:
-            if await self._does_entity_exists(entity):
-                await self.entities_state_applier.delete([entity], UserAgentType.exporter)
+            if entity.is_using_search_identifier and await self._does_entity_exists(entity):
+                entities_to_delete.append(entity)
+        if entities_to_delete:
+            await self.entities_state_applier.delete(entities_to_delete, UserAgentType.exporter)
@@ -0,0 +1,83 @@
+import asyncio
+import multiprocessing
+from contextlib import asynccontextmanager, suppress
+from typing import AsyncIterator
+
+from loguru import logger
+
+from port_ocean.config.settings import ResourceMemorySettings
+from port_ocean.context.ocean import ocean
+from port_ocean.helpers.metric.metric import MetricPhase, MetricType
+from port_ocean.utils.memory import get_rss_bytes
+
+
+class SubprocessMemoryWatchdog:
+    """Watches the memory of the subprocess processing a resource, from the parent process.
+
+    The resident set size of the subprocess is sampled every `sample_interval_seconds` and reported in the
+    subprocess_rss_bytes and subprocess_peak_rss_bytes metrics of the kind. A warning is logged once the subprocess
+    passes `warn_ratio` of `max_rss_mb`, and the subprocess is killed once it passes `max_rss_mb`, before it takes
+    down the whole integration.
+
+    A long-lived worker of the resync worker pool still holds the memory of the tasks it ran before, so it is watched
+    from a baseline, the resident set size it had when the task started, and only the memory the task added is
+    reported and compared with the limit.
+
+    The peak is reported as it is sampled, so it is part of the sync metrics the subprocess reports for its kind.
+    """
+
+    def __init__(self, kind: str, settings: ResourceMemorySettings) -> None:
+        self.kind = kind
+        self.settings = settings
+        self.max_rss_bytes = settings.max_rss_mb * 1024 * 1024
+        self.peak_rss_bytes = 0
+        self.limit_exceeded = False
+        self._warned = False
+        self._baseline_rss_bytes = 0
+
+    @asynccontextmanager
+    async def watch(
+        self, process: multiprocessing.Process, baseline_rss_bytes: int = 0
+    ) -> AsyncIterator[None]:
+        self._baseline_rss_bytes = baseline_rss_bytes
+        task = asyncio.create_task(self._watch(process))
+        try:
+            yield
+        finally:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+    async def _watch(self, process: multiprocessing.Process) -> None:
+        while process.is_alive() and not self.limit_exceeded:
+            self.sample(process)
+            await asyncio.sleep(self.settings.sample_interval_seconds)
+
+    def sample(self, process: multiprocessing.Process) -> None:
+        rss = get_rss_bytes(process.pid)
+        if rss is None:
+            return
+        rss = max(0, rss - self._baseline_rss_bytes)
+        self.peak_rss_bytes = max(self.peak_rss_bytes, rss)
+        if ocean.initialized:
+            labels = [self.kind, MetricPhase.RESYNC]
+            ocean.metrics.set_metric(MetricType.SUBPROCESS_RSS_NAME, labels, rss)
+            ocean.metrics.set_metric(
+                MetricType.SUBPROCESS_PEAK_RSS_NAME, labels, self.peak_rss_bytes
+            )
+
+        if not self.max_rss_bytes:
+            return
+        if rss > self.max_rss_bytes:
+            logger.error(
+                f"Subprocess {process.pid} of {self.kind} uses {rss // (1024 * 1024)}MB of memory, "
+                f"more than the limit of {self.settings.max_rss_mb}MB, killing it"
+            )
+            self.limit_exceeded = True
+            process.kill()
+        elif not self._warned and rss > self.max_rss_bytes * self.settings.warn_ratio:
+            logger.warning(
+                f"Subprocess {process.pid} of {self.kind} uses {rss // (1024 * 1024)}MB of memory, "
+                f"close to the limit of {self.settings.max_rss_mb}MB"
+            )
+            self._warned = True
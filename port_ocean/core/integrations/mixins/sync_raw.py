@@ -1,9 +1,12 @@
 import asyncio
+import time
 import uuid
+from collections import defaultdict
 from graphlib import CycleError
 import inspect
 import typing
-from typing import Callable, Awaitable, Any
+from contextlib import aclosing
+from typing import AsyncGenerator, AsyncIterator, Callable, Awaitable, Any
 import multiprocessing
 import httpx
 from loguru import logger
@@ -15,6 +18,8 @@ from port_ocean.context.resource import resource_context
 from port_ocean.context import resource
 from port_ocean.core.handlers.port_app_config.models import ResourceConfig
 from port_ocean.core.integrations.mixins import HandlerMixin, EventsMixin
+from port_ocean.core.integrations.mixins.memory_watchdog import SubprocessMemoryWatchdog
+from port_ocean.core.integrations.mixins.worker_pool import ProcessWorkerPool
 from port_ocean.core.integrations.mixins.utils import (
     ProcessWrapper,
     clear_http_client_context,
@@ -32,13 +37,33 @@ from port_ocean.core.ocean_types import (
     RAW_ITEM,
     CalculationResult,
 )
+from port_ocean.core.utils.entities_lookup import PortEntitiesLookup
+from port_ocean.core.utils.entity_fingerprints import EntityFingerprintStore
+from port_ocean.core.utils.entity_keys import EntityKey, get_entities_keys, get_entity_key
+from port_ocean.core.utils.entity_serialization import pack_entity, unpack_entity
+from port_ocean.core.utils.resources_scheduler import ResourcesScheduler, get_resource_static_blueprint
 from port_ocean.core.utils.utils import resolve_entities_diff, zip_and_sum, gather_and_split_errors_from_results
-from port_ocean.exceptions.core import IntegrationSubProcessFailedException, OceanAbortException
+from port_ocean.exceptions.context import ResourceContextNotFoundError
+from port_ocean.exceptions.core import (
+    IntegrationSubProcessFailedException,
+    IntegrationSubProcessMemoryLimitExceededException,
+    OceanAbortException,
+)
 from port_ocean.helpers.metric.metric import MetricResourceKind, SyncState, MetricType, MetricPhase
 from port_ocean.helpers.metric.utils import TimeMetric, TimeMetricWithResourceKind
-from port_ocean.utils.ipc import FileIPC
+from port_ocean.utils.async_iterators import stream_async_iterators_isolated
+from port_ocean.utils.ipc import PipeIPC
+from port_ocean.utils.queue_utils import StageQueue
 
 SEND_RAW_DATA_EXAMPLES_AMOUNT = 5
+# The messages a resource subprocess sends back to the parent process
+SUBPROCESS_PASSED_ENTITIES = "passed_entities"
+SUBPROCESS_TOPOLOGICAL_ENTITIES = "topological_entities"
+SUBPROCESS_ERRORS = "errors"
+SUBPROCESS_COMPLETED = "completed"
+SUBPROCESS_ENTITIES_CHUNK_SIZE = 1000
+# The waves of failed entities after this one share a single label in the retry wave metrics, bounding their labels
+MAX_LABELED_RETRY_WAVE = 10
 
 
 class SyncRawMixin(HandlerMixin, EventsMixin):
@@ -54,6 +79,10 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
     def __init__(self) -> None:
         HandlerMixin.__init__(self)
         EventsMixin.__init__(self)
+        self._port_entities_lookup = PortEntitiesLookup()
+        # The last processing duration of each resource, used to start the longest resources first
+        self._resources_durations: dict[str, float] = {}
+        self._worker_pool: ProcessWorkerPool | None = None
 
     async def _on_resync(self, kind: str) -> RAW_RESULT:
         raise NotImplementedError("on_resync must be implemented")
@@ -181,18 +210,17 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
         if len(entities) <= MIN_ENTITIES_TO_MAP:
             return entities
 
-        BATCH_SIZE = 50
-        entities_at_port_with_properties = []
-
-        # Process entities in batches
-        for start_index in range(0, len(entities), BATCH_SIZE):
-            entities_batch = entities[start_index:start_index + BATCH_SIZE]
-            batch_results = await self._fetch_entities_batch_from_port(
+        # Batches are searched concurrently, and identifiers already being searched by another batch of the same
+        # blueprint and mapped fields are awaited instead of searched again
+        entities_at_port_with_properties = await self._port_entities_lookup.fetch(
+            entities,
+            (entities[0].blueprint, tuple(self._get_entities_search_parameters(resource))),
+            lambda entities_batch: self._fetch_entities_batch_from_port(
                 entities_batch,
                 resource,
                 user_agent_type
             )
-            entities_at_port_with_properties.extend(batch_results)
+        )
 
         logger.info("Got entities from port with properties and relations", port_entities=len(entities_at_port_with_properties))
 
@@ -210,18 +238,23 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
         query = self._construct_search_query_for_entities(entities_batch)
         return await ocean.port_client.search_entities(
             user_agent_type,
-            parameters_to_include=["blueprint", "identifier"] + (
-                ["title"] if resource.port.entity.mappings.title != None else []
-            ) + (
-                ["team"] if resource.port.entity.mappings.team != None else []
-            ) + [
-                f"properties.{prop}" for prop in resource.port.entity.mappings.properties
-            ] + [
-                f"relations.{relation}" for relation in resource.port.entity.mappings.relations
-            ],
-            query=query
+            parameters_to_include=self._get_entities_search_parameters(resource),
+            query=query,
+            limit_concurrency=True,
         )
 
+    @staticmethod
+    def _get_entities_search_parameters(resource: ResourceConfig) -> list[str]:
+        return ["blueprint", "identifier"] + (
+            ["title"] if resource.port.entity.mappings.title != None else []
+        ) + (
+            ["team"] if resource.port.entity.mappings.team != None else []
+        ) + [
+            f"properties.{prop}" for prop in resource.port.entity.mappings.properties
+        ] + [
+            f"relations.{relation}" for relation in resource.port.entity.mappings.relations
+        ]
+
     async def _register_resource_raw(
         self,
         resource: ResourceConfig,
@@ -229,6 +262,20 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
         user_agent_type: UserAgentType,
         parse_all: bool = False,
         send_raw_data_examples_amount: int = 0
+    ) -> CalculationResult:
+        calculation_result = await self._transform_resource_raw(
+            resource, results, parse_all, send_raw_data_examples_amount
+        )
+        return await self._load_resource_calculation_result(
+            resource, calculation_result, user_agent_type
+        )
+
+    async def _transform_resource_raw(
+        self,
+        resource: ResourceConfig,
+        results: list[dict[Any, Any]],
+        parse_all: bool = False,
+        send_raw_data_examples_amount: int = 0
     ) -> CalculationResult:
         objects_diff = await self._calculate_raw(
             [(resource, results)], parse_all, send_raw_data_examples_amount
@@ -239,23 +286,39 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
             labels=[ocean.metrics.current_resource_kind(), MetricPhase.TRANSFORM, MetricPhase.TransformResult.FAILED],
             value=len(objects_diff[0].entity_selector_diff.failed)
         )
+        return objects_diff[0]
 
+    async def _load_resource_calculation_result(
+        self,
+        resource: ResourceConfig,
+        calculation_result: CalculationResult,
+        user_agent_type: UserAgentType,
+    ) -> CalculationResult:
         modified_objects = []
 
         if event.event_type == EventType.RESYNC:
             try:
+                entity_fingerprints = self._get_entity_fingerprints()
+                entities_to_compare = calculation_result.entity_selector_diff.passed
+                if entity_fingerprints is not None:
+                    entities_to_compare, unchanged_entities = entity_fingerprints.split_unchanged(entities_to_compare)
+                    if unchanged_entities:
+                        logger.info("Skipping entities that didn't change since they were last synced",
+                            unchanged_entities=len(unchanged_entities))
+
                 changed_entities = await self._map_entities_compared_with_port(
-                    objects_diff[0].entity_selector_diff.passed,
+                    entities_to_compare,
                     resource,
                     user_agent_type
                 )
+                upserted_entities = []
                 if changed_entities:
                     logger.info("Upserting changed entities", changed_entities=len(changed_entities),
-                        total_entities=len(objects_diff[0].entity_selector_diff.passed))
+                        total_entities=len(calculation_result.entity_selector_diff.passed))
                     ocean.metrics.inc_metric(
                             name=MetricType.OBJECT_COUNT_NAME,
                             labels=[ocean.metrics.current_resource_kind(), MetricPhase.LOAD, MetricPhase.LoadResult.SKIPPED],
-                            value=len(objects_diff[0].entity_selector_diff.passed) - len(changed_entities)
+                            value=len(calculation_result.entity_selector_diff.passed) - len(changed_entities)
                         )
                     upserted_entities = await self.entities_state_applier.upsert(
                         changed_entities, user_agent_type
@@ -268,17 +331,19 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
                     )
 
                 else:
-                    logger.info("Entities in batch didn't changed since last sync, skipping", total_entities=len(objects_diff[0].entity_selector_diff.passed))
+                    logger.info("Entities in batch didn't changed since last sync, skipping", total_entities=len(calculation_result.entity_selector_diff.passed))
                     ocean.metrics.inc_metric(
                             name=MetricType.OBJECT_COUNT_NAME,
                             labels=[ocean.metrics.current_resource_kind(), MetricPhase.LOAD, MetricPhase.LoadResult.SKIPPED],
-                            value=len(objects_diff[0].entity_selector_diff.passed)
+                            value=len(calculation_result.entity_selector_diff.passed)
                         )
-                modified_objects = [ocean.port_client._reduce_entity(entity) for entity in objects_diff[0].entity_selector_diff.passed]
+                if entity_fingerprints is not None:
+                    entity_fingerprints.update_from_sync(entities_to_compare, changed_entities, upserted_entities)
+                modified_objects = [ocean.port_client._reduce_entity(entity) for entity in calculation_result.entity_selector_diff.passed]
             except Exception as e:
                 logger.warning(f"Failed to resolve batch entities with Port, falling back to upserting all entities: {str(e)}")
                 modified_objects = await self.entities_state_applier.upsert(
-                    objects_diff[0].entity_selector_diff.passed, user_agent_type
+                    calculation_result.entity_selector_diff.passed, user_agent_type
                     )
                 ocean.metrics.set_metric(
                         name=MetricType.OBJECT_COUNT_NAME,
@@ -287,16 +352,23 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
                     )
         else:
            modified_objects = await self.entities_state_applier.upsert(
-                    objects_diff[0].entity_selector_diff.passed, user_agent_type
+                    calculation_result.entity_selector_diff.passed, user_agent_type
                     )
 
         return CalculationResult(
-            number_of_transformed_entities=len(objects_diff[0].entity_selector_diff.passed),
-            entity_selector_diff=objects_diff[0].entity_selector_diff._replace(passed=modified_objects),
-            errors=objects_diff[0].errors,
-            misonfigured_entity_keys=objects_diff[0].misonfigured_entity_keys
+            number_of_transformed_entities=len(calculation_result.entity_selector_diff.passed),
+            entity_selector_diff=calculation_result.entity_selector_diff._replace(passed=modified_objects),
+            errors=calculation_result.errors,
+            misonfigured_entity_keys=calculation_result.misonfigured_entity_keys
         )
 
+    @staticmethod
+    def _get_entity_fingerprints() -> EntityFingerprintStore | None:
+        try:
+            return resource.resource.entity_fingerprints
+        except ResourceContextNotFoundError:
+            return None
+
     async def _unregister_resource_raw(
         self,
         resource: ResourceConfig,
@@ -318,6 +390,25 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
         logger.info("Finished unregistering change")
         return entities_selector_diff.passed, errors
 
+    def _stream_resync_generators(
+        self, async_generators: list[ASYNC_GENERATOR_RESYNC_TYPE]
+    ) -> AsyncGenerator[tuple[RAW_RESULT | None, Exception | None], None]:
+        """Stream the batches of the resync generators of a kind, up to max_concurrent_resync_generators at a time.
+
+        A generator that fails doesn't stop the other generators of the kind, its error is streamed once it stopped.
+        """
+        return stream_async_iterators_isolated(
+            async_generators, ocean.config.max_concurrent_resync_generators
+        )
+
+    @staticmethod
+    def _handle_resync_generator_error(error: Exception, errors: list[Exception]) -> None:
+        try:
+            raise error
+        except* OceanAbortException as abort_error:
+            ocean.metrics.sync_state = SyncState.FAILED
+            errors.append(abort_error)
+
     @TimeMetric(MetricPhase.RESYNC)
     async def _register_in_batches(
         self, resource_config: ResourceConfig, user_agent_type: UserAgentType
@@ -351,9 +442,26 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
 
         number_of_raw_results = 0
         number_of_transformed_entities = 0
-        for generator in async_generators:
-            try:
-                async for items in generator:
+        if ocean.config.resync_pipeline.enabled:
+            (
+                pipeline_passed_entities,
+                pipeline_errors,
+                number_of_raw_results,
+                number_of_transformed_entities,
+            ) = await self._register_generators_in_pipeline(
+                resource_config,
+                async_generators,
+                user_agent_type,
+                max(0, send_raw_data_examples_amount - len(passed_entities)),
+            )
+            passed_entities.extend(pipeline_passed_entities)
+            errors.extend(pipeline_errors)
+        else:
+            async with aclosing(self._stream_resync_generators(async_generators)) as generators_results:
+                async for items, generator_error in generators_results:
+                    if generator_error is not None:
+                        self._handle_resync_generator_error(generator_error, errors)
+                        continue
                     number_of_raw_results += len(items)
                     if send_raw_data_examples_amount > 0:
                         send_raw_data_examples_amount = max(
@@ -369,9 +477,6 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
                     passed_entities.extend(calculation_result.entity_selector_diff.passed)
                     errors.extend(calculation_result.errors)
                     number_of_transformed_entities += calculation_result.number_of_transformed_entities
-            except* OceanAbortException as error:
-                ocean.metrics.sync_state = SyncState.FAILED
-                errors.append(error)
 
         logger.info(
             f"Finished registering kind: {resource_config.kind}-{resource.resource.index} ,{len(passed_entities)} entities out of {number_of_raw_results} raw results"
@@ -404,6 +509,99 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
 
         return passed_entities, errors
 
+    async def _register_generators_in_pipeline(
+        self,
+        resource_config: ResourceConfig,
+        async_generators: list[ASYNC_GENERATOR_RESYNC_TYPE],
+        user_agent_type: UserAgentType,
+        send_raw_data_examples_amount: int = 0,
+    ) -> tuple[list[Entity], list[Exception], int, int]:
+        """Register the batches of the resync generators in a pipeline of extract, transform and load stages.
+
+        The stages are connected by bounded queues, so fetching the next batch from the third party overlaps with
+        transforming and loading the previous batches, while a slow stage applies backpressure on the stages before it.
+
+        Returns:
+            tuple[list[Entity], list[Exception], int, int]: The passed entities, the errors, the number of raw results
+            and the number of transformed entities.
+        """
+        pipeline_settings = ocean.config.resync_pipeline
+        transform_queue: StageQueue[RAW_RESULT | None] = StageQueue(
+            MetricPhase.EXTRACT, MetricPhase.TRANSFORM, pipeline_settings.queue_max_size
+        )
+        load_queue: StageQueue[CalculationResult | None] = StageQueue(
+            MetricPhase.TRANSFORM, MetricPhase.LOAD, pipeline_settings.queue_max_size
+        )
+
+        passed_entities: list[Entity] = []
+        errors: list[Exception] = []
+        number_of_raw_results = 0
+        number_of_transformed_entities = 0
+
+        async def extract() -> None:
+            nonlocal number_of_raw_results
+            async with aclosing(self._stream_resync_generators(async_generators)) as generators_results:
+                async for items, generator_error in generators_results:
+                    if generator_error is not None:
+                        self._handle_resync_generator_error(generator_error, errors)
+                        continue
+                    number_of_raw_results += len(items)
+                    await transform_queue.put(items)
+            for _ in range(pipeline_settings.transform_concurrency):
+                await transform_queue.put(None)
+
+        async def transform() -> None:
+            nonlocal send_raw_data_examples_amount
+            while (items := await transform_queue.get()) is not None:
+                calculation_result = await self._transform_resource_raw(
+                    resource_config,
+                    items,
+                    send_raw_data_examples_amount=send_raw_data_examples_amount,
+                )
+                send_raw_data_examples_amount = max(
+                    0,
+                    send_raw_data_examples_amount
+                    - len(calculation_result.entity_selector_diff.passed),
+                )
+                await load_queue.put(calculation_result)
+
+        async def load() -> None:
+            nonlocal number_of_transformed_entities
+            while (calculation_result := await load_queue.get()) is not None:
+                load_result = await self._load_resource_calculation_result(
+                    resource_config, calculation_result, user_agent_type
+                )
+                passed_entities.extend(load_result.entity_selector_diff.passed)
+                errors.extend(load_result.errors)
+                number_of_transformed_entities += load_result.number_of_transformed_entities
+
+        async def transform_stage() -> None:
+            await asyncio.gather(
+                *(transform() for _ in range(pipeline_settings.transform_concurrency))
+            )
+            for _ in range(pipeline_settings.load_concurrency):
+                await load_queue.put(None)
+
+        stages = [
+            asyncio.create_task(extract()),
+            asyncio.create_task(transform_stage()),
+            *(
+                asyncio.create_task(load())
+                for _ in range(pipeline_settings.load_concurrency)
+            ),
+        ]
+        try:
+            done, _ = await asyncio.wait(stages, return_when=asyncio.FIRST_EXCEPTION)
+            for stage in done:
+                # Raise the first failure, after which the rest of the stages are cancelled as they can't make progress
+                stage.result()
+        finally:
+            for stage in stages:
+                stage.cancel()
+            await asyncio.gather(*stages, return_exceptions=True)
+
+        return passed_entities, errors, number_of_raw_results, number_of_transformed_entities
+
     async def register_raw(
         self,
         kind: str,
@@ -457,9 +655,7 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
 
         registered_entities, entities_to_delete = zip_and_sum(diffs)
 
-        registered_entities_attributes = {
-            (entity.identifier, entity.blueprint) for entity in registered_entities
-        }
+        registered_entities_attributes = get_entities_keys(registered_entities)
 
         filtered_entities_to_delete: list[Entity] = (
             await ocean.port_client.search_batch_entities(
@@ -468,8 +664,7 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
                     entity
                     for entity in entities_to_delete
                     if not entity.is_using_search_identifier
-                    and (entity.identifier, entity.blueprint)
-                    not in registered_entities_attributes
+                    and get_entity_key(entity) not in registered_entities_attributes
                 ],
             )
         )
@@ -586,23 +781,92 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
                 user_agent_type,
             )
 
+    async def _upsert_failed_entities_wave(self, wave: list[Entity], wave_label: str, user_agent_type: UserAgentType) -> None:
+        """Upsert a wave of failed entities concurrently, in batches per blueprint, and report the wave metrics"""
+        start = time.monotonic()
+        entities_by_blueprint: dict[str, list[Entity]] = defaultdict(list)
+        for entity in wave:
+            entities_by_blueprint[entity.blueprint].append(entity)
+
+        port_client = self.entities_state_applier.context.port_client
+        results = await asyncio.gather(
+            *(
+                port_client.upsert_entities_in_batches(entities, event.port_app_config.get_port_request_options(), user_agent_type, should_raise=False)
+                for entities in entities_by_blueprint.values()
+            ),
+            return_exceptions=True,
+        )
+
+        loaded = 0
+        failed = 0
+        for entities, result in zip(entities_by_blueprint.values(), results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                logger.warning(f"Failed to upsert {len(entities)} failed entities of blueprint {entities[0].blueprint}: {result}")
+                failed += len(entities)
+                continue
+            upserted = sum(1 for is_upserted, _ in result if is_upserted)
+            loaded += upserted
+            failed += len(result) - upserted
+
+        duration = time.monotonic() - start
+        kind = ocean.metrics.current_resource_kind()
+        ocean.metrics.set_metric(name=MetricType.RETRY_WAVE_DURATION_NAME, labels=[kind, MetricPhase.LOAD, wave_label], value=duration)
+        ocean.metrics.inc_metric(name=MetricType.RETRY_WAVE_OBJECT_COUNT_NAME, labels=[kind, MetricPhase.LOAD, wave_label, MetricPhase.LoadResult.LOADED], value=loaded)
+        ocean.metrics.inc_metric(name=MetricType.RETRY_WAVE_OBJECT_COUNT_NAME, labels=[kind, MetricPhase.LOAD, wave_label, MetricPhase.LoadResult.FAILED], value=failed)
+        logger.info(
+            f"Upserted wave {wave_label} of failed entities in {duration:.2f}s ({loaded} loaded, {failed} failed)",
+            wave=wave_label, wave_size=len(wave), loaded_entities=loaded, failed_entities=failed, duration=duration,
+        )
+
     async def sort_and_upsert_failed_entities(self,user_agent_type: UserAgentType)->None:
+        """Retry the entities that failed to upsert, in waves ordered by their dependencies.
+
+        The entities of a wave only depend on entities of earlier waves, so each wave is upserted concurrently once
+        the previous wave is done.
+        """
         try:
             if not event.entity_topological_sorter.should_execute():
                 return None
             logger.info(f"Executings topological sort of {event.entity_topological_sorter.get_entities_count()} entities failed to upsert.",failed_toupsert_entities_count=event.entity_topological_sorter.get_entities_count())
 
-            for entity in event.entity_topological_sorter.get_entities():
-                await self.entities_state_applier.context.port_client.upsert_entity(entity,event.port_app_config.get_port_request_options(),user_agent_type,should_raise=False)
+            waves = event.entity_topological_sorter.get_entities_waves()
+            logger.info(f"Upserting the failed entities in {len(waves)} waves", waves_count=len(waves))
+            for wave_index, wave in enumerate(waves):
+                wave_label = str(wave_index) if wave_index < MAX_LABELED_RETRY_WAVE else f"{MAX_LABELED_RETRY_WAVE}+"
+                await self._upsert_failed_entities_wave(wave, wave_label, user_agent_type)
 
         except OceanAbortException as ocean_abort:
             logger.info(f"Failed topological sort of failed to upsert entites - trying to upsert unordered {event.entity_topological_sorter.get_entities_count()} entities.",failed_topological_sort_entities_count=event.entity_topological_sorter.get_entities_count() )
             if isinstance(ocean_abort.__cause__,CycleError):
-                for entity in event.entity_topological_sorter.get_entities(False):
-                    await self.entities_state_applier.context.port_client.upsert_entity(entity,event.port_app_config.get_port_request_options(),user_agent_type,should_raise=False)
+                await self._upsert_failed_entities_wave(list(event.entity_topological_sorter.get_entities(False)), "unordered", user_agent_type)
+
+    @staticmethod
+    def _send_entities_in_chunks(ipc: PipeIPC, tag: str, entities: list[Entity]) -> None:
+        for start in range(0, len(entities), SUBPROCESS_ENTITIES_CHUNK_SIZE):
+            ipc.send(tag, [pack_entity(entity) for entity in entities[start:start + SUBPROCESS_ENTITIES_CHUNK_SIZE]])
+
+    async def _process_resource_and_send_results(self,
+        ipc: PipeIPC,
+        resource: ResourceConfig,
+        index: int,
+        user_agent_type: UserAgentType,
+    ) -> None:
+        topological_entities = event.entity_topological_sorter.entities
+        # The process may have inherited or registered entities to retry before, only the new ones are sent back
+        registered_before = len(topological_entities)
+        passed_entities, errors = await self._process_resource(
+            resource, index, user_agent_type
+        )
+        # The results are streamed to the parent in chunks, so neither process holds them in a single pickle
+        self._send_entities_in_chunks(ipc, SUBPROCESS_PASSED_ENTITIES, passed_entities)
+        self._send_entities_in_chunks(ipc, SUBPROCESS_TOPOLOGICAL_ENTITIES, topological_entities[registered_before:])
+        ipc.send(SUBPROCESS_ERRORS, errors)
+        ipc.send(SUBPROCESS_COMPLETED, None)
 
     def process_resource_in_subprocess(self,
-        file_ipc_map: dict[str, FileIPC],
+        ipc: PipeIPC,
         resource: ResourceConfig,
         index: int,
         user_agent_type: UserAgentType,
@@ -610,32 +874,58 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
         logger.info(f"process started successfully for {resource.kind} with index {index}")
 
         clear_http_client_context()
-        async def process_resource_task() -> None:
-            result = await self._process_resource(
-                resource, index, user_agent_type
-            )
-            file_ipc_map["process_resource"].save(result)
-            file_ipc_map["topological_entities"].save(
-                event.entity_topological_sorter.entities
-            )
-
-        asyncio.run(process_resource_task())
+        asyncio.run(self._process_resource_and_send_results(ipc, resource, index, user_agent_type))
         logger.info(f"Process finished for {resource.kind} with index {index}")
 
+    async def _receive_subprocess_results(self, messages: AsyncIterator[tuple[str, Any]], resource: ResourceConfig, index: int, watchdog: SubprocessMemoryWatchdog) -> tuple[list[Entity], list[Exception]]:
+        passed_entities: list[Entity] = []
+        errors: list[Exception] = []
+        completed = False
+        async with aclosing(messages):
+            async for tag, value in messages:
+                if tag == SUBPROCESS_PASSED_ENTITIES:
+                    passed_entities.extend(unpack_entity(packed) for packed in value)
+                elif tag == SUBPROCESS_TOPOLOGICAL_ENTITIES:
+                    event.entity_topological_sorter.entities.extend(unpack_entity(packed) for packed in value)
+                elif tag == SUBPROCESS_ERRORS:
+                    errors.extend(value)
+                elif tag == SUBPROCESS_COMPLETED:
+                    completed = True
+
+        if not completed:
+            if watchdog.limit_exceeded:
+                return [], [IntegrationSubProcessMemoryLimitExceededException(
+                    f"Subprocess for {resource.kind} with index {index} was killed after exceeding the memory limit of {watchdog.settings.max_rss_mb}MB"
+                )]
+            return [], [IntegrationSubProcessFailedException(f"Subprocess failed for {resource.kind} with index {index}")]
+        return passed_entities, errors
+
     async def process_resource(self, resource: ResourceConfig, index: int, user_agent_type: UserAgentType) -> tuple[list[Entity], list[Exception]]:
+        start = time.monotonic()
+        try:
+            return await self._process_resource_in_execution_mode(resource, index, user_agent_type)
+        finally:
+            self._resources_durations[f"{resource.kind}-{index}"] = time.monotonic() - start
+
+    async def _process_resource_in_execution_mode(self, resource: ResourceConfig, index: int, user_agent_type: UserAgentType) -> tuple[list[Entity], list[Exception]]:
             if ocean.app.process_execution_mode == ProcessExecutionMode.multi_process:
+                watchdog = SubprocessMemoryWatchdog(f"{resource.kind}-{index}", ocean.config.resource_memory)
+                if self._worker_pool is not None:
+                    return await self._receive_subprocess_results(
+                        self._worker_pool.submit(resource, index, user_agent_type, watchdog=watchdog), resource, index, watchdog
+                    )
+
                 id = uuid.uuid4()
                 logger.info(f"Starting subprocess with id {id}")
-                file_ipc_map = {
-                    "process_resource": FileIPC(id, "process_resource",([],[IntegrationSubProcessFailedException(f"Subprocess failed for {resource.kind} with index {index}")])),
-                    "topological_entities": FileIPC(id, "topological_entities",[]),
-                }
-                process = ProcessWrapper(target=self.process_resource_in_subprocess, args=(file_ipc_map,resource,index,user_agent_type))
+                ipc = PipeIPC()
+                process = ProcessWrapper(target=self.process_resource_in_subprocess, args=(ipc,resource,index,user_agent_type))
                 process.start()
+                # Only the subprocess holds the sending end, so the results end when it exits
+                ipc.close_sender()
+                async with watchdog.watch(process):
+                    results = await self._receive_subprocess_results(ipc.receive(), resource, index, watchdog)
                 await process.join_async()
-
-                event.entity_topological_sorter.entities.extend(file_ipc_map["topological_entities"].load())
-                return file_ipc_map["process_resource"].load()
+                return results
 
             else:
                 return await self._process_resource(resource,index,user_agent_type)
@@ -643,8 +933,15 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
     async def _process_resource(self,resource: ResourceConfig, index: int, user_agent_type: UserAgentType)-> tuple[list[Entity], list[Exception]]:
         # create resource context per resource kind, so resync method could have access to the resource
         # config as we might have multiple resources in the same event
-        async with resource_context(resource,index):
+        async with resource_context(resource,index) as current_resource:
             resource_kind_id = f"{resource.kind}-{index}"
+            if ocean.config.entity_fingerprints.enabled:
+                current_resource.entity_fingerprints = EntityFingerprintStore.load_for_resource(
+                    ocean.config.entity_fingerprints.directory,
+                    resource,
+                    index,
+                    ocean.config.entity_fingerprints.ttl_seconds,
+                )
             ocean.metrics.sync_state = SyncState.SYNCING
 
             task = asyncio.create_task(
@@ -652,6 +949,8 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
             )
             event.on_abort(lambda: task.cancel())
             kind_results: tuple[list[Entity], list[Exception]] = await task
+            if current_resource.entity_fingerprints is not None:
+                current_resource.entity_fingerprints.save()
 
             if ocean.metrics.sync_state != SyncState.FAILED:
                 ocean.metrics.sync_state = SyncState.COMPLETED
@@ -663,6 +962,81 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
 
             return kind_results
 
+    async def _get_blueprints_relations_targets(self, resources: list[ResourceConfig]) -> dict[str, set[str]]:
+        blueprints = {
+            blueprint
+            for blueprint in (get_resource_static_blueprint(resource) for resource in resources)
+            if blueprint is not None
+        }
+        fetched_blueprints, errors = await gather_and_split_errors_from_results(
+            ocean.port_client.get_blueprint(blueprint, should_log=False) for blueprint in blueprints
+        )
+        if errors:
+            logger.warning(
+                f"Failed to fetch {len(errors)} blueprints, resources of these blueprints will be processed without relations ordering"
+            )
+        return {
+            blueprint.identifier: {relation.target for relation in blueprint.relations.values()}
+            for blueprint in fetched_blueprints
+        }
+
+    def _create_worker_pool(self) -> ProcessWorkerPool | None:
+        settings = ocean.config.resync_workers
+        if not settings.enabled or ocean.app.process_execution_mode != ProcessExecutionMode.multi_process:
+            return None
+        pool = ProcessWorkerPool(
+            self._process_resource_and_send_results,
+            ocean.config.max_concurrent_resources,
+            settings.max_tasks_per_worker,
+            settings.max_worker_memory_mb * 1024 * 1024,
+        )
+        pool.start()
+        return pool
+
+    async def _process_resources(
+        self, resources: list[ResourceConfig], user_agent_type: UserAgentType
+    ) -> list[tuple[list[Entity], list[Exception]]]:
+        # The workers are forked once the resync started, so they inherit its event context
+        self._worker_pool = self._create_worker_pool()
+        try:
+            if ocean.config.max_concurrent_resources > 1:
+                return await self._process_resources_concurrently(resources, user_agent_type)
+
+            creation_results = []
+            for index,resource in enumerate(resources):
+                logger.info(f"Starting processing resource {resource.kind} with index {index}")
+                creation_results.append(await self.process_resource(resource,index,user_agent_type))
+            return creation_results
+        finally:
+            if self._worker_pool is not None:
+                worker_pool, self._worker_pool = self._worker_pool, None
+                await worker_pool.shutdown()
+
+    async def _process_resources_concurrently(
+        self, resources: list[ResourceConfig], user_agent_type: UserAgentType
+    ) -> list[tuple[list[Entity], list[Exception]]]:
+        """Process the resources concurrently, bounded by the max_concurrent_resources configuration.
+
+        Resources are ordered by the relations between their blueprints, so related kinds are still processed
+        before the kinds relating to them. Among the resources that are ready, the ones that took the longest in the
+        previous resyncs start first.
+        """
+        max_concurrent_resources = ocean.config.max_concurrent_resources
+        logger.info(f"Processing {len(resources)} resources with up to {max_concurrent_resources} concurrent resources")
+        scheduler = ResourcesScheduler(
+            resources,
+            max_concurrent_resources,
+            await self._get_blueprints_relations_targets(resources),
+            {
+                index: self._resources_durations[f"{resource.kind}-{index}"]
+                for index, resource in enumerate(resources)
+                if f"{resource.kind}-{index}" in self._resources_durations
+            },
+        )
+        return await scheduler.run(
+            lambda resource, index: self.process_resource(resource, index, user_agent_type)
+        )
+
     @TimeMetricWithResourceKind(MetricPhase.RESYNC)
     async def resync_reconciliation(
         self,
@@ -720,12 +1094,26 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
         logger.info(
             f"Running resync diff calculation, number of entities created during sync: {len(generated_entities)}"
         )
-        entities_at_port = await ocean.port_client.search_entities(
-            user_agent_type
+        # Only the keys of the entities at Port are needed for the diff, they are streamed a blueprint at a time
+        # instead of loading all the entities of the integration at once
+        blueprints = sorted(
+            {
+                blueprint
+                for blueprint in (get_resource_static_blueprint(resource) for resource in app_config.resources)
+                if blueprint is not None
+            }
         )
+        entities_at_port_keys: set[EntityKey] = set()
+        async for keys in ocean.port_client.search_entities_keys(user_agent_type, blueprints):
+            entities_at_port_keys.update(keys)
+        if ocean.config.entity_fingerprints.enabled:
+            EntityFingerprintStore.retain_existing(
+                ocean.config.entity_fingerprints.directory,
+                entities_at_port_keys
+            )
 
-        await self.entities_state_applier.delete_diff(
-            {"before": entities_at_port, "after": generated_entities},
+        await self.entities_state_applier.delete_diff_by_keys(
+            entities_at_port_keys, generated_entities,
             user_agent_type, app_config.get_entity_deletion_threshold()
         )
 
@@ -803,9 +1191,7 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
 
             multiprocessing.set_start_method('fork', True)
             try:
-                for index,resource in enumerate(app_config.resources):
-                    logger.info(f"Starting processing resource {resource.kind} with index {index}")
-                    creation_results.append(await self.process_resource(resource,index,user_agent_type))
+                creation_results.extend(await self._process_resources(app_config.resources, user_agent_type))
             except asyncio.CancelledError as e:
                 logger.warning("Resync aborted successfully, skipping delete phase. This leads to an incomplete state")
                 raise
@@ -91,14 +91,23 @@ class ProcessWrapper(multiprocessing.Process):
         super().__init__(*args, **kwargs)
 
     async def join_async(self) -> None:
-        while self.exitcode is None:
-            await asyncio.sleep(2)
+        # The sentinel becomes readable once the process exits, so the exit is awaited without polling
+        loop = asyncio.get_running_loop()
+        exited = loop.create_future()
+        loop.add_reader(
+            self.sentinel, lambda: exited.done() or exited.set_result(None)
+        )
+        try:
+            await exited
+        finally:
+            loop.remove_reader(self.sentinel)
+        # The sentinel is readable slightly before the process can be reaped, which doesn't block for long
+        super().join()
         if self.exitcode != 0:
             logger.error(f"Process {self.pid} failed with exit code {self.exitcode}")
         else:
             logger.info(f"Process {self.pid} finished with exit code {self.exitcode}")
         ocean.metrics.cleanup_prometheus_metrics(self.pid)
-        return super().join()
 
 def clear_http_client_context() -> None:
     try:
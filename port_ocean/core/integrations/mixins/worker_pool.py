@@ -0,0 +1,187 @@
+import asyncio
+from contextlib import aclosing, nullcontext
+from typing import Any, AsyncContextManager, AsyncIterator, Awaitable, Callable
+
+from loguru import logger
+
+from port_ocean.core.integrations.mixins.memory_watchdog import (
+    SubprocessMemoryWatchdog,
+)
+from port_ocean.core.integrations.mixins.utils import (
+    ProcessWrapper,
+    clear_http_client_context,
+)
+from port_ocean.utils.ipc import PipeIPC
+from port_ocean.utils.memory import get_rss_bytes
+
+WORKER_TASK = "task"
+WORKER_STOP = "stop"
+# Sent by a worker after each task, with whether the worker is going to exit to be replaced
+WORKER_TASK_DONE = "task_done"
+WORKER_STOP_TIMEOUT_SECONDS = 10
+
+WorkerHandler = Callable[..., Awaitable[None]]
+
+
+def run_worker(
+    handler: WorkerHandler,
+    tasks: PipeIPC,
+    results: PipeIPC,
+    max_tasks: int,
+    max_memory_bytes: int,
+) -> None:
+    """The main function of a worker process, runs the tasks it receives one after the other in a single event loop"""
+    tasks.close_sender()
+    results.close_receiver()
+    clear_http_client_context()
+
+    async def run_tasks() -> None:
+        completed_tasks = 0
+        async with aclosing(tasks.receive()) as messages:
+            async for tag, args in messages:
+                if tag == WORKER_STOP:
+                    return
+                await handler(results, *args)
+                completed_tasks += 1
+                rss = get_rss_bytes()
+                recycle = completed_tasks >= max_tasks or (
+                    max_memory_bytes > 0 and rss is not None and rss > max_memory_bytes
+                )
+                results.send(WORKER_TASK_DONE, recycle)
+                if recycle:
+                    return
+
+    asyncio.run(run_tasks())
+
+
+class _Worker:
+    def __init__(self, process: ProcessWrapper, tasks: PipeIPC, results: PipeIPC):
+        self.process = process
+        self.tasks = tasks
+        self.results = results
+
+
+class ProcessWorkerPool:
+    """Runs tasks in a pool of long-lived forked worker processes.
+
+    The workers are forked once and run one task at a time, so the state they set up (HTTP clients, the Port
+    token and the caches) is reused by the following tasks instead of being set up again in a new process per task.
+    A worker is replaced after `max_tasks_per_worker` tasks, or after a task that left it using more than
+    `max_worker_memory_bytes`, which also bounds the total memory of the pool.
+
+    A task is a call of `handler(results, *args)` in a worker. The handler streams its results with
+    `results.send(tag, value)`, and the messages are yielded by `submit` in the parent.
+
+    Args:
+        handler: The coroutine function the workers run for each task, inherited by the forked workers.
+        workers: The maximum number of worker processes.
+        max_tasks_per_worker: The number of tasks after which a worker is replaced.
+        max_worker_memory_bytes: The memory after which a worker is replaced, 0 disables the check.
+    """
+
+    def __init__(
+        self,
+        handler: WorkerHandler,
+        workers: int,
+        max_tasks_per_worker: int,
+        max_worker_memory_bytes: int = 0,
+    ) -> None:
+        self.handler = handler
+        self.workers = max(1, workers)
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.max_worker_memory_bytes = max_worker_memory_bytes
+        self._semaphore = asyncio.Semaphore(self.workers)
+        self._idle_workers: list[_Worker] = []
+
+    def start(self) -> None:
+        """Fork all the workers ahead of the first task"""
+        while len(self._idle_workers) < self.workers:
+            self._idle_workers.append(self._start_worker())
+
+    def _start_worker(self) -> _Worker:
+        tasks = PipeIPC()
+        results = PipeIPC()
+        process = ProcessWrapper(
+            target=run_worker,
+            args=(
+                self.handler,
+                tasks,
+                results,
+                self.max_tasks_per_worker,
+                self.max_worker_memory_bytes,
+            ),
+        )
+        process.start()
+        tasks.close_receiver()
+        results.close_sender()
+        logger.info(f"Started resync worker process {process.pid}")
+        return _Worker(process, tasks, results)
+
+    def _get_worker(self) -> _Worker:
+        while self._idle_workers:
+            worker = self._idle_workers.pop()
+            if worker.process.is_alive():
+                return worker
+            logger.warning(
+                f"Resync worker process {worker.process.pid} exited while idle"
+            )
+            worker.tasks.close_sender()
+        return self._start_worker()
+
+    async def submit(
+        self, *args: Any, watchdog: SubprocessMemoryWatchdog | None = None
+    ) -> AsyncIterator[tuple[str, Any]]:
+        """
+        Run a task in the next available worker and yield the messages it sends.
+        The messages end early if the worker exits in the middle of the task, e.g. when the watchdog killed it.
+        """
+        async with self._semaphore:
+            worker = self._get_worker()
+            finished = False
+            reusable = False
+            # The memory the worker holds from its earlier tasks isn't counted for this one
+            watching: AsyncContextManager[None] = (
+                watchdog.watch(worker.process, get_rss_bytes(worker.process.pid) or 0)
+                if watchdog
+                else nullcontext()
+            )
+            try:
+                worker.tasks.send(WORKER_TASK, args)
+                async with watching, aclosing(worker.results.receive()) as messages:
+                    async for tag, value in messages:
+                        if tag == WORKER_TASK_DONE:
+                            finished = True
+                            reusable = not value
+                            break
+                        yield tag, value
+            finally:
+                if reusable:
+                    self._idle_workers.append(worker)
+                else:
+                    await self._stop_worker(worker, terminate=not finished)
+
+    async def _stop_worker(self, worker: _Worker, terminate: bool = False) -> None:
+        # A worker that didn't finish its task (e.g. the resync was aborted) is terminated
+        if terminate and worker.process.is_alive():
+            worker.process.terminate()
+        try:
+            await asyncio.wait_for(
+                worker.process.join_async(), WORKER_STOP_TIMEOUT_SECONDS
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Resync worker process {worker.process.pid} didn't stop, killing it"
+            )
+            worker.process.kill()
+            await worker.process.join_async()
+        worker.tasks.close_sender()
+        worker.results.close_receiver()
+
+    async def shutdown(self) -> None:
+        idle_workers, self._idle_workers = self._idle_workers, []
+        for worker in idle_workers:
+            try:
+                worker.tasks.send(WORKER_STOP, None)
+            except OSError:
+                pass
+        await asyncio.gather(*(self._stop_worker(worker) for worker in idle_workers))
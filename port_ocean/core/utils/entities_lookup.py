@@ -0,0 +1,119 @@
+import asyncio
+from typing import Any, Callable, Coroutine
+
+from port_ocean.core.models import Entity
+
+MAX_LOOKUP_BATCH_SIZE = 50
+# The total length of the identifiers searched in a single request, keeps the search query small for long identifiers
+MAX_LOOKUP_BATCH_IDENTIFIERS_LENGTH = 8 * 1024
+
+LookupKey = tuple[str, tuple[str, ...]]
+
+
+def split_entities_to_lookup_batches(
+    entities: list[Entity],
+    max_batch_size: int = MAX_LOOKUP_BATCH_SIZE,
+    max_identifiers_length: int = MAX_LOOKUP_BATCH_IDENTIFIERS_LENGTH,
+) -> list[list[Entity]]:
+    """Split the entities into batches bounded by both the number of entities and the length of their identifiers"""
+    batches: list[list[Entity]] = []
+    current_batch: list[Entity] = []
+    current_length = 0
+    for entity in entities:
+        identifier_length = len(str(entity.identifier))
+        if current_batch and (
+            len(current_batch) >= max_batch_size
+            or current_length + identifier_length > max_identifiers_length
+        ):
+            batches.append(current_batch)
+            current_batch = []
+            current_length = 0
+        current_batch.append(entity)
+        current_length += identifier_length
+    if current_batch:
+        batches.append(current_batch)
+    return batches
+
+
+class PortEntitiesLookup:
+    """Looks up the existing Port entities of a list of entities.
+
+    The lookup is split into batches that are searched concurrently. Identifiers that are already being looked up
+    by another in-flight lookup with the same key (e.g. another batch of the same blueprint that is loaded at the
+    same time) aren't searched again, the lookup waits for the in-flight result instead.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: dict[LookupKey, dict[str, asyncio.Future[Entity | None]]] = {}
+
+    async def _search_batches(
+        self,
+        entities: list[Entity],
+        search_batch: Callable[[list[Entity]], Coroutine[Any, Any, list[Entity]]],
+    ) -> list[Entity]:
+        tasks = [
+            asyncio.create_task(search_batch(batch))
+            for batch in split_entities_to_lookup_batches(entities)
+        ]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        return [entity for result in results for entity in result]
+
+    async def fetch(
+        self,
+        entities: list[Entity],
+        key: LookupKey,
+        search_batch: Callable[[list[Entity]], Coroutine[Any, Any, list[Entity]]],
+    ) -> list[Entity]:
+        """
+        Fetch the Port entities matching the identifiers of the given entities.
+
+        :param entities: The entities to look up, all of the same blueprint
+        :param key: The lookup key, lookups are only coalesced with in-flight lookups of the same key
+        :param search_batch: Searches Port for a single batch of entities
+        :return: The entities found in Port
+        """
+        in_flight = self._in_flight.setdefault(key, {})
+        awaited: list[asyncio.Future[Entity | None]] = []
+        owned: dict[str, asyncio.Future[Entity | None]] = {}
+        to_search: list[Entity] = []
+        loop = asyncio.get_running_loop()
+        for entity in entities:
+            identifier = entity.identifier
+            if identifier in owned:
+                continue
+            if identifier in in_flight:
+                awaited.append(in_flight[identifier])
+                continue
+            owned[identifier] = in_flight[identifier] = loop.create_future()
+            to_search.append(entity)
+
+        try:
+            found = (
+                await self._search_batches(to_search, search_batch) if to_search else []
+            )
+            found_by_identifier = {entity.identifier: entity for entity in found}
+            for identifier, future in owned.items():
+                future.set_result(found_by_identifier.get(identifier))
+        except BaseException as exc:
+            for future in owned.values():
+                if not future.done():
+                    future.set_exception(exc)
+                    # Mark the exception as retrieved in case no other lookup waits on it
+                    future.exception()
+            raise
+        finally:
+            for identifier, future in owned.items():
+                if in_flight.get(identifier) is future:
+                    del in_flight[identifier]
+            if not in_flight:
+                self._in_flight.pop(key, None)
+
+        coalesced: list[Entity | None] = (
+            list(await asyncio.gather(*awaited)) if awaited else []
+        )
+        return found + [entity for entity in coalesced if entity is not None]
@@ -0,0 +1,217 @@
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from port_ocean.core.handlers.port_app_config.models import ResourceConfig
+from port_ocean.core.models import Entity
+from port_ocean.core.utils.entity_keys import EntityKey, get_entity_key
+from port_ocean.core.utils.entity_serialization import dumps
+from port_ocean.utils.misc import get_time
+
+
+def _hash(value: Any) -> str:
+    return hashlib.blake2b(
+        dumps(value, sort_keys=True, default=str), digest_size=16
+    ).hexdigest()
+
+
+def get_entity_fingerprint(entity: Entity) -> str:
+    """
+    Fingerprint the entity fields that are compared with Port to decide whether the entity changed.
+    """
+    return _hash([entity.title, entity.team, entity.properties, entity.relations])
+
+
+def is_fingerprintable(entity: Entity) -> bool:
+    return not (entity.is_using_search_identifier or entity.is_using_search_relation)
+
+
+class EntityFingerprintStore:
+    """Fingerprints of the entities that are known to be up to date in Port, keyed by (blueprint, identifier).
+
+    The store is kept in a file per resource between resyncs, so entities whose fingerprint didn't change since they
+    were last upserted or compared with Port can skip both the Port search and the upsert.
+    The stored fingerprints are dropped when the resource mapping changes, and each fingerprint expires after
+    `ttl_seconds` so entities are compared with Port again periodically.
+
+    Args:
+        path: The file the fingerprints are kept in.
+        mapping_fingerprint: The fingerprint of the resource mapping the entities were calculated with.
+        ttl_seconds: The time after which a fingerprint is no longer trusted.
+    """
+
+    def __init__(self, path: Path, mapping_fingerprint: str, ttl_seconds: float):
+        self.path = path
+        self.mapping_fingerprint = mapping_fingerprint
+        self.ttl_seconds = ttl_seconds
+        self._fingerprints: dict[EntityKey, tuple[str, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    @staticmethod
+    def get_resource_path(directory: str, index: int) -> Path:
+        return Path(directory) / f"resource-{index}.pkl"
+
+    @classmethod
+    def load_for_resource(
+        cls,
+        directory: str,
+        resource: ResourceConfig,
+        index: int,
+        ttl_seconds: float,
+    ) -> "EntityFingerprintStore":
+        store = cls(
+            cls.get_resource_path(directory, index),
+            _hash(resource.dict(by_alias=True)),
+            ttl_seconds,
+        )
+        store.load()
+        return store
+
+    @staticmethod
+    def _read(path: Path) -> dict[str, Any] | None:
+        if not path.exists():
+            return None
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except (pickle.PickleError, EOFError, OSError) as e:
+            logger.warning(f"Failed to read entity fingerprints file {path}: {e}")
+            return None
+
+    @staticmethod
+    def _write(path: Path, content: dict[str, Any]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = path.with_suffix(".tmp")
+        with open(temporary_path, "wb") as f:
+            pickle.dump(content, f)
+        os.replace(temporary_path, path)
+
+    def load(self) -> None:
+        content = self._read(self.path)
+        if content is None:
+            self._fingerprints = {}
+        elif content.get("mapping_fingerprint") != self.mapping_fingerprint:
+            logger.info(
+                "Resource mapping changed since the last resync, dropping its entity fingerprints"
+            )
+            self._fingerprints = {}
+        else:
+            self._fingerprints = content["fingerprints"]
+
+    def save(self) -> None:
+        try:
+            self._write(
+                self.path,
+                {
+                    "mapping_fingerprint": self.mapping_fingerprint,
+                    "fingerprints": self._fingerprints,
+                },
+            )
+        except (pickle.PickleError, OSError) as e:
+            logger.warning(f"Failed to save entity fingerprints to {self.path}: {e}")
+
+    def split_unchanged(
+        self, entities: list[Entity]
+    ) -> tuple[list[Entity], list[Entity]]:
+        """
+        Split the entities by their stored fingerprints.
+
+        :return: The entities that might have changed and the entities that are known to be up to date in Port
+        """
+        expiration_time = get_time() - self.ttl_seconds
+        changed: list[Entity] = []
+        unchanged: list[Entity] = []
+        for entity in entities:
+            stored = (
+                self._fingerprints.get(get_entity_key(entity))
+                if is_fingerprintable(entity)
+                else None
+            )
+            if (
+                stored is not None
+                and stored[1] > expiration_time
+                and stored[0] == get_entity_fingerprint(entity)
+            ):
+                unchanged.append(entity)
+            else:
+                changed.append(entity)
+        return changed, unchanged
+
+    def update(self, entities: list[Entity]) -> None:
+        """Store the fingerprints of entities that are known to be up to date in Port"""
+        now = get_time()
+        for entity in entities:
+            if is_fingerprintable(entity):
+                self._fingerprints[get_entity_key(entity)] = (
+                    get_entity_fingerprint(entity),
+                    now,
+                )
+
+    def discard(self, entities: list[Entity]) -> None:
+        for entity in entities:
+            if is_fingerprintable(entity):
+                self._fingerprints.pop(get_entity_key(entity), None)
+
+    def update_from_sync(
+        self,
+        compared_entities: list[Entity],
+        changed_entities: list[Entity],
+        upserted_entities: list[Entity],
+    ) -> None:
+        """
+        Update the fingerprints after a batch was compared with Port and its changed entities were upserted.
+        Entities that were equal in Port or were upserted are up to date, while entities that failed to upsert
+        (e.g. a conflict reported by Port) are dropped so they are compared again on the next resync.
+        """
+        upserted_keys = {
+            get_entity_key(entity)
+            for entity in upserted_entities
+            if is_fingerprintable(entity)
+        }
+        failed_keys = {
+            get_entity_key(entity)
+            for entity in changed_entities
+            if is_fingerprintable(entity)
+        } - upserted_keys
+
+        up_to_date_entities: list[Entity] = []
+        failed_entities: list[Entity] = []
+        for entity in compared_entities:
+            if not is_fingerprintable(entity):
+                continue
+            if get_entity_key(entity) in failed_keys:
+                failed_entities.append(entity)
+            else:
+                up_to_date_entities.append(entity)
+        self.update(up_to_date_entities)
+        self.discard(failed_entities)
+
+    @classmethod
+    def retain_existing(cls, directory: str, existing_keys: set[EntityKey]) -> None:
+        """Drop the fingerprints of entities that no longer exist in Port from all the resources stores"""
+        for path in Path(directory).glob("resource-*.pkl"):
+            content = cls._read(path)
+            if content is None:
+                continue
+            fingerprints = content["fingerprints"]
+            content["fingerprints"] = {
+                key: value
+                for key, value in fingerprints.items()
+                if key in existing_keys
+            }
+            if len(content["fingerprints"]) != len(fingerprints):
+                logger.info(
+                    f"Dropping {len(fingerprints) - len(content['fingerprints'])} fingerprints of entities that "
+                    f"are missing in Port",
+                    path=str(path),
+                )
+                try:
+                    cls._write(path, content)
+                except (pickle.PickleError, OSError) as e:
+                    logger.warning(f"Failed to save entity fingerprints to {path}: {e}")
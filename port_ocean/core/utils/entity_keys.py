@@ -0,0 +1,51 @@
+import sys
+from typing import Any, Hashable, Iterable, NamedTuple
+
+from port_ocean.core.models import Entity
+from port_ocean.core.utils.entity_serialization import dumps
+
+
+class EntityKey(NamedTuple):
+    """The (blueprint, identifier) key of an entity.
+
+    Keys are plain tuples without a per-instance `__dict__`, so the key sets built during reconciliation stay small
+    even with hundreds of thousands of entities, and they compare equal to `(blueprint, identifier)` tuples.
+    """
+
+    blueprint: str
+    identifier: Any
+
+    def to_entity(self) -> Entity:
+        return Entity(identifier=self.identifier, blueprint=self.blueprint)
+
+
+def make_entity_key(blueprint: Any, identifier: Any) -> EntityKey:
+    # Only the blueprints are interned, there are few of them and they repeat in every key. Identifiers are unique
+    # per entity and interned strings may outlive the resync, so they keep referencing the entity's own string.
+    # A mapping may also produce a blueprint that isn't a string, which is kept as is
+    if isinstance(blueprint, str):
+        blueprint = sys.intern(blueprint)
+    return EntityKey(blueprint, identifier)
+
+
+def get_entity_key(entity: Entity) -> EntityKey:
+    return make_entity_key(entity.blueprint, entity.identifier)
+
+
+def get_comparable_entity_key(entity: Entity) -> Hashable:
+    """
+    The key of an entity that may still use a search identifier, which isn't hashable.
+    The search identifier is serialized, so entities using the same search get the same key.
+    """
+    if entity.is_using_search_identifier:
+        return (entity.blueprint, dumps(entity.identifier, sort_keys=True))
+    return get_entity_key(entity)
+
+
+def index_entities_by_key(entities: Iterable[Entity]) -> dict[EntityKey, Entity]:
+    """Index the entities by their key, the last entity wins when the same key appears more than once"""
+    return {get_entity_key(entity): entity for entity in entities}
+
+
+def get_entities_keys(entities: Iterable[Entity]) -> set[EntityKey]:
+    return {get_entity_key(entity) for entity in entities}
@@ -0,0 +1,36 @@
+import json
+from typing import Any, Callable
+
+from port_ocean.core.models import Entity
+
+
+def dumps(
+    value: Any,
+    sort_keys: bool = False,
+    default: Callable[[Any], Any] | None = None,
+) -> bytes:
+    """Serialize a value to compact JSON bytes"""
+    return json.dumps(
+        value, sort_keys=sort_keys, default=default, separators=(",", ":")
+    ).encode()
+
+
+def serialize_entity(entity: Entity) -> bytes:
+    """
+    Serialize the entity as it is sent to Port.
+    Nothing is cached on the entity, a caller that needs the bytes more than once keeps them for the scope of its call.
+    """
+    return dumps(entity.dict(exclude_unset=True, by_alias=True))
+
+
+def pack_entity(entity: Entity) -> dict[str, Any]:
+    """
+    Pack the entity into a plain dict of its set fields to be sent to another process.
+    It pickles to a fraction of the size of the entity, which also carries the pydantic state.
+    """
+    return {name: entity.__dict__[name] for name in entity.__fields_set__}
+
+
+def unpack_entity(packed: dict[str, Any]) -> Entity:
+    # The entity was validated before it was packed
+    return Entity.construct(**packed)
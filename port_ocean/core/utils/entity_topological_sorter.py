@@ -1,15 +1,16 @@
+from collections import defaultdict
 from typing import Any, Generator
 from port_ocean.context import event
 from port_ocean.core.models import Entity
+from port_ocean.core.utils.entity_keys import EntityKey, get_entity_key
 
 from loguru import logger
 
 from graphlib import TopologicalSorter, CycleError
-from typing import Set
 
 from port_ocean.exceptions.core import OceanAbortException
 
-Node = tuple[str, str]
+Node = EntityKey
 
 
 class EntityTopologicalSorter:
@@ -43,48 +44,80 @@ class EntityTopologicalSorter:
         for entity in sorted_and_mapped:
             yield entity
 
+    def get_entities_waves(self) -> list[list[Entity]]:
+        """Get the registered entities in dependency waves, the entities of each wave depend only on earlier waves"""
+        return EntityTopologicalSorter.order_by_entities_dependencies_in_waves(
+            self.entities
+        )
+
     @staticmethod
     def node(entity: Entity) -> Node:
-        return entity.identifier, entity.blueprint
+        return get_entity_key(entity)
 
     @staticmethod
-    def order_by_entities_dependencies(entities: list[Entity]) -> list[Entity]:
-        nodes: dict[Node, Set[Node]] = {}
-        entities_map = {}
+    def _build_dependencies_graph(
+        entities: list[Entity],
+    ) -> tuple[dict[Node, set[Node]], dict[Node, Entity]]:
+        """
+        Build the dependencies graph of the entities in linear time.
+        Relations only hold the target identifier, so every registered entity with that identifier is a dependency.
+        """
+        entities_map: dict[Node, Entity] = {}
+        nodes_by_identifier: dict[Any, list[Node]] = defaultdict(list)
         for entity in entities:
-            nodes[EntityTopologicalSorter.node(entity)] = set()
-            entities_map[EntityTopologicalSorter.node(entity)] = entity
+            entity_node = EntityTopologicalSorter.node(entity)
+            if entity_node not in entities_map:
+                nodes_by_identifier[entity.identifier].append(entity_node)
+            entities_map[entity_node] = entity
 
+        nodes: dict[Node, set[Node]] = {}
         for entity in entities:
-            relation_target_ids: list[str] = sum(
-                [
+            entity_node = EntityTopologicalSorter.node(entity)
+            dependencies = nodes.setdefault(entity_node, set())
+            for identifiers in entity.relations.values():
+                if identifiers is None:
+                    continue
+                for target in (
                     identifiers if isinstance(identifiers, list) else [identifiers]
-                    for identifiers in entity.relations.values()
-                    if identifiers is not None
-                ],
-                [],
-            )
-            related_entities = [
-                related
-                for related in entities
-                if related.identifier in relation_target_ids
-            ]
-
-            for related_entity in related_entities:
-                if (
-                    entity.blueprint is not related_entity.blueprint
-                    or entity.identifier is not related_entity.identifier
                 ):
-                    nodes[EntityTopologicalSorter.node(entity)].add(
-                        EntityTopologicalSorter.node(related_entity)
-                    )
+                    # Search relations are resolved by Port and can't be matched to a registered entity
+                    if isinstance(target, dict):
+                        continue
+                    for related_node in nodes_by_identifier.get(target, []):
+                        if related_node != entity_node:
+                            dependencies.add(related_node)
+        return nodes, entities_map
 
+    @staticmethod
+    def order_by_entities_dependencies_in_waves(
+        entities: list[Entity],
+    ) -> list[list[Entity]]:
+        nodes, entities_map = EntityTopologicalSorter._build_dependencies_graph(
+            entities
+        )
         sort_op = TopologicalSorter(nodes)
         try:
-            return [entities_map[item] for item in sort_op.static_order()]
+            sort_op.prepare()
         except CycleError as ex:
             raise OceanAbortException(
                 "Cannot order entities due to cyclic dependencies. \n"
                 "If you do want to have cyclic dependencies, please make sure to set the keys"
                 " 'createMissingRelatedEntities' and 'deleteDependentEntities' in the integration config in Port."
             ) from ex
+
+        waves: list[list[Entity]] = []
+        while sort_op.is_active():
+            ready = sort_op.get_ready()
+            waves.append([entities_map[item] for item in ready])
+            sort_op.done(*ready)
+        return waves
+
+    @staticmethod
+    def order_by_entities_dependencies(entities: list[Entity]) -> list[Entity]:
+        return [
+            entity
+            for wave in EntityTopologicalSorter.order_by_entities_dependencies_in_waves(
+                entities
+            )
+            for entity in wave
+        ]
@@ -0,0 +1,156 @@
+import asyncio
+import heapq
+import json
+import math
+from graphlib import CycleError, TopologicalSorter
+from typing import Any, Callable, Coroutine, TypeVar
+
+from loguru import logger
+
+from port_ocean.core.handlers.port_app_config.models import ResourceConfig
+
+T = TypeVar("T")
+
+
+def get_resource_static_blueprint(resource: ResourceConfig) -> str | None:
+    """
+    Resolve the blueprint of a resource mapping when it is a static JQ string literal (e.g. '"service"').
+    Blueprints that are calculated from the raw data can't be resolved before the resync, in which case None is returned.
+    """
+    try:
+        blueprint = json.loads(resource.port.entity.mappings.blueprint)
+    except ValueError:
+        return None
+    return blueprint if isinstance(blueprint, str) else None
+
+
+class ResourcesScheduler:
+    """Schedules the processing of the port app config resources concurrently.
+
+    Resources are started in their mapping order, or by their expected duration when it is known, while respecting the
+    following dependencies:
+    - A resource is processed after all the resources that are mapped to blueprints its blueprint relates to,
+      so related entities are already in Port when the resource entities are upserted.
+    - Resources that are mapped to the same blueprint keep their relative order, so the latest mapping wins as it
+      does in a sequential resync.
+
+    If the blueprint relations form a cycle, only the same blueprint ordering is kept.
+
+    Among the resources that are ready, the ones expected to take the longest start first (longest processing time
+    first), so a long resource doesn't start last and delay the end of the resync. Resources without a known duration
+    are started first, in their mapping order.
+
+    Args:
+        resources: The resources of the port app config.
+        max_concurrent_resources: The maximum number of resources processed at the same time.
+        blueprints_relations_targets: A mapping between a blueprint and the blueprints its relations target.
+        resources_durations: The expected processing duration of the resources, keyed by the resource index.
+    """
+
+    def __init__(
+        self,
+        resources: list[ResourceConfig],
+        max_concurrent_resources: int,
+        blueprints_relations_targets: dict[str, set[str]] | None = None,
+        resources_durations: dict[int, float] | None = None,
+    ) -> None:
+        self.resources = resources
+        self.max_concurrent_resources = max(1, max_concurrent_resources)
+        self.blueprints_relations_targets = blueprints_relations_targets or {}
+        self.resources_durations = resources_durations or {}
+
+    def _get_priority(self, index: int) -> tuple[float, int]:
+        return -self.resources_durations.get(index, math.inf), index
+
+    def _same_blueprint_dependencies(
+        self, blueprints: list[str | None]
+    ) -> dict[int, set[int]]:
+        dependencies: dict[int, set[int]] = {
+            index: set() for index in range(len(self.resources))
+        }
+        last_index_by_blueprint: dict[str, int] = {}
+        for index, blueprint in enumerate(blueprints):
+            if blueprint is None:
+                continue
+            if blueprint in last_index_by_blueprint:
+                dependencies[index].add(last_index_by_blueprint[blueprint])
+            last_index_by_blueprint[blueprint] = index
+        return dependencies
+
+    def build_dependencies(self) -> dict[int, set[int]]:
+        """Build the resources dependency graph, keyed by the resource index."""
+        blueprints = [
+            get_resource_static_blueprint(resource) for resource in self.resources
+        ]
+        dependencies = self._same_blueprint_dependencies(blueprints)
+
+        indexes_by_blueprint: dict[str, list[int]] = {}
+        for index, blueprint in enumerate(blueprints):
+            if blueprint is not None:
+                indexes_by_blueprint.setdefault(blueprint, []).append(index)
+
+        relations_dependencies = {
+            index: set(resource_dependencies)
+            for index, resource_dependencies in dependencies.items()
+        }
+        for index, blueprint in enumerate(blueprints):
+            if blueprint is None:
+                continue
+            for target in self.blueprints_relations_targets.get(blueprint, set()):
+                if target == blueprint:
+                    continue
+                relations_dependencies[index].update(
+                    indexes_by_blueprint.get(target, [])
+                )
+
+        try:
+            TopologicalSorter(relations_dependencies).prepare()
+        except CycleError as error:
+            logger.warning(
+                "Resources blueprints relations are cyclic, processing resources without relations ordering",
+                cycle=error.args[1] if len(error.args) > 1 else None,
+            )
+            return dependencies
+        return relations_dependencies
+
+    async def run(
+        self, process: Callable[[ResourceConfig, int], Coroutine[Any, Any, T]]
+    ) -> list[T]:
+        """
+        Process all the resources, running up to `max_concurrent_resources` at the same time.
+
+        :param process: An async function that processes a single resource given the resource and its index
+        :return: The processing results ordered by the resource index
+        """
+        sorter = TopologicalSorter(self.build_dependencies())
+        sorter.prepare()
+
+        results: dict[int, T] = {}
+        ready: list[tuple[float, int]] = []
+        running: dict[asyncio.Task[T], int] = {}
+        try:
+            while sorter.is_active():
+                for index in sorter.get_ready():
+                    heapq.heappush(ready, self._get_priority(index))
+
+                while ready and len(running) < self.max_concurrent_resources:
+                    _, index = heapq.heappop(ready)
+                    logger.info(
+                        f"Starting processing resource {self.resources[index].kind} with index {index}"
+                    )
+                    task = asyncio.create_task(process(self.resources[index], index))
+                    running[task] = index
+
+                done, _ = await asyncio.wait(
+                    running.keys(), return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    index = running.pop(task)
+                    results[index] = task.result()
+                    sorter.done(index)
+        finally:
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+
+        return [results[index] for index in sorted(results)]
@@ -1,6 +1,4 @@
 import asyncio
-import hashlib
-import json
 from typing import Iterable, Any, TypeVar, Callable, Awaitable
 
 from loguru import logger
@@ -11,6 +9,8 @@ from port_ocean.clients.port.client import PortClient
 from port_ocean.core.models import Entity, Runtime
 from port_ocean.core.models import EntityPortDiff
 from port_ocean.core.ocean_types import RAW_RESULT
+from port_ocean.core.utils.entity_keys import get_entity_key, index_entities_by_key
+from port_ocean.core.utils.entity_serialization import dumps
 from port_ocean.exceptions.core import (
     RawObjectValidationException,
     IntegrationRuntimeException,
@@ -80,21 +80,12 @@ async def gather_and_split_errors_from_results(
 
 
 def get_port_diff(before: Iterable[Entity], after: Iterable[Entity]) -> EntityPortDiff:
-    before_dict = {}
-    after_dict = {}
+    before_dict = index_entities_by_key(before)
+    after_dict = index_entities_by_key(after)
     created = []
     modified = []
     deleted = []
 
-    # Create dictionaries for before and after lists
-    for entity in before:
-        key = (entity.identifier, entity.blueprint)
-        before_dict[key] = entity
-
-    for entity in after:
-        key = (entity.identifier, entity.blueprint)
-        after_dict[key] = entity
-
     # Find created, modified, and deleted objects
     for key, obj in after_dict.items():
         if key not in before_dict:
@@ -122,7 +113,7 @@ def are_entities_fields_equal(
     first_entity_field: dict[str, Any], second_entity_field: dict[str, Any]
 ) -> bool:
     """
-    Compare two entity fields by serializing them to JSON and comparing their SHA-256 hashes.
+    Compare two entity fields by serializing them to canonical JSON and comparing the serialized bytes.
     Removes keys with None values before comparison if the corresponding key doesn't exist in the other dict.
 
     Args:
@@ -132,17 +123,15 @@ def are_entities_fields_equal(
     Returns:
         bool: True if the entity fields have identical content
     """
-    first_entity_field_copy = first_entity_field.copy()
-
-    for key in list(first_entity_field.keys()):
-        if first_entity_field[key] is None and key not in second_entity_field:
-            del first_entity_field_copy[key]
-
-    first_props = json.dumps(first_entity_field_copy, sort_keys=True)
-    second_props = json.dumps(second_entity_field, sort_keys=True)
-    first_hash = hashlib.sha256(first_props.encode()).hexdigest()
-    second_hash = hashlib.sha256(second_props.encode()).hexdigest()
-    return first_hash == second_hash
+    first_entity_field_copy = {
+        key: value
+        for key, value in first_entity_field.items()
+        if value is not None or key in second_entity_field
+    }
+
+    return dumps(first_entity_field_copy, sort_keys=True) == dumps(
+        second_entity_field, sort_keys=True
+    )
 
 
 def are_entities_different(first_entity: Entity, second_entity: Entity) -> bool:
@@ -170,24 +159,17 @@ def resolve_entities_diff(
     Returns:
         list[Entity]: Filtered list of source entities, excluding matches found in target
     """
-    target_entities_dict = {}
-    source_entities_dict = {}
+    target_entities_dict = index_entities_by_key(target_entities)
     changed_entities = []
 
-    for entity in target_entities:
-        key = (entity.identifier, entity.blueprint)
-        target_entities_dict[key] = entity
-
     for entity in source_entities:
         if entity.is_using_search_identifier or entity.is_using_search_relation:
             return source_entities
-        key = (entity.identifier, entity.blueprint)
-        source_entities_dict[key] = entity
 
-        entity_at_target = target_entities_dict.get(key, None)
+        entity_at_target = target_entities_dict.get(get_entity_key(entity), None)
         if entity_at_target is None:
             changed_entities.append(entity)
-        elif are_entities_different(entity, target_entities_dict[key]):
+        elif are_entities_different(entity, entity_at_target):
             changed_entities.append(entity)
 
     return changed_entities
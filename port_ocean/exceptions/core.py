@@ -41,3 +41,13 @@ class IntegrationRuntimeException(BaseOceanException):
 
 class IntegrationSubProcessFailedException(BaseOceanException):
     pass
+
+
+class IntegrationSubProcessMemoryLimitExceededException(
+    IntegrationSubProcessFailedException
+):
+    pass
+
+
+class QueueFullException(BaseOceanException):
+    pass
@@ -42,6 +42,10 @@ class MetricPhase:
     class DeletionResult:
         DELETED = "deleted"
 
+    class CacheResult:
+        HIT = "hit"
+        MISS = "miss"
+
 
 class MetricType:
     # Define metric names as constants
@@ -49,6 +53,18 @@ class MetricType:
     OBJECT_COUNT_NAME = "object_count"
     SUCCESS_NAME = "success"
     RATE_LIMIT_WAIT_NAME = "rate_limit_wait_seconds"
+    QUEUE_SIZE_NAME = "queue_size"
+    QUEUE_WAIT_NAME = "queue_wait_seconds"
+    JQ_COMPILED_CACHE_NAME = "jq_compiled_cache"
+    RETRY_WAVE_DURATION_NAME = "retry_wave_duration_seconds"
+    RETRY_WAVE_OBJECT_COUNT_NAME = "retry_wave_object_count"
+    PORT_CONCURRENCY_LIMIT_NAME = "port_concurrency_limit"
+    PORT_CONCURRENCY_WAIT_NAME = "port_concurrency_wait_seconds"
+    SUBPROCESS_RSS_NAME = "subprocess_rss_bytes"
+    SUBPROCESS_PEAK_RSS_NAME = "subprocess_peak_rss_bytes"
+    PORT_APP_CONFIG_FETCH_DURATION_NAME = "port_app_config_fetch_duration_seconds"
+    LIVE_EVENTS_QUEUE_DEPTH_NAME = "live_events_queue_depth"
+    LIVE_EVENTS_QUEUE_LAG_NAME = "live_events_queue_lag_seconds"
 
 
 class SyncState:
@@ -85,6 +101,66 @@ _metrics_registry: Dict[str, Tuple[str, str, List[str]]] = {
         "rate_limit_wait description",
         ["kind", "phase", "endpoint"],
     ),
+    MetricType.QUEUE_SIZE_NAME: (
+        MetricType.QUEUE_SIZE_NAME,
+        "queue_size description",
+        ["kind", "phase"],
+    ),
+    MetricType.QUEUE_WAIT_NAME: (
+        MetricType.QUEUE_WAIT_NAME,
+        "queue_wait description",
+        ["kind", "phase"],
+    ),
+    MetricType.JQ_COMPILED_CACHE_NAME: (
+        MetricType.JQ_COMPILED_CACHE_NAME,
+        "jq_compiled_cache description",
+        ["kind", "phase", "cache_result"],
+    ),
+    MetricType.RETRY_WAVE_DURATION_NAME: (
+        MetricType.RETRY_WAVE_DURATION_NAME,
+        "retry_wave_duration description",
+        ["kind", "phase", "wave"],
+    ),
+    MetricType.RETRY_WAVE_OBJECT_COUNT_NAME: (
+        MetricType.RETRY_WAVE_OBJECT_COUNT_NAME,
+        "retry_wave_object_count description",
+        ["kind", "phase", "wave", "object_count_type"],
+    ),
+    MetricType.PORT_CONCURRENCY_LIMIT_NAME: (
+        MetricType.PORT_CONCURRENCY_LIMIT_NAME,
+        "port_concurrency_limit description",
+        ["kind", "phase"],
+    ),
+    MetricType.PORT_CONCURRENCY_WAIT_NAME: (
+        MetricType.PORT_CONCURRENCY_WAIT_NAME,
+        "port_concurrency_wait description",
+        ["kind", "phase"],
+    ),
+    MetricType.SUBPROCESS_RSS_NAME: (
+        MetricType.SUBPROCESS_RSS_NAME,
+        "subprocess_rss description",
+        ["kind", "phase"],
+    ),
+    MetricType.SUBPROCESS_PEAK_RSS_NAME: (
+        MetricType.SUBPROCESS_PEAK_RSS_NAME,
+        "subprocess_peak_rss description",
+        ["kind", "phase"],
+    ),
+    MetricType.PORT_APP_CONFIG_FETCH_DURATION_NAME: (
+        MetricType.PORT_APP_CONFIG_FETCH_DURATION_NAME,
+        "port_app_config_fetch_duration description",
+        ["kind"],
+    ),
+    MetricType.LIVE_EVENTS_QUEUE_DEPTH_NAME: (
+        MetricType.LIVE_EVENTS_QUEUE_DEPTH_NAME,
+        "live_events_queue_depth description",
+        ["webhook_path"],
+    ),
+    MetricType.LIVE_EVENTS_QUEUE_LAG_NAME: (
+        MetricType.LIVE_EVENTS_QUEUE_LAG_NAME,
+        "live_events_queue_lag description",
+        ["webhook_path"],
+    ),
 }
 
 
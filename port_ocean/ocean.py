@@ -69,6 +69,7 @@ class Ocean:
             integration_identifier=self.config.integration.identifier,
             integration_type=self.config.integration.type,
             integration_version=__integration_version__,
+            concurrency_settings=self.config.port_concurrency,
         )
         self.cache_provider: CacheProvider = self._get_caching_provider()
         self.process_execution_mode: ProcessExecutionMode = (
@@ -87,6 +88,10 @@ class Ocean:
             signal_handler,
             max_event_processing_seconds=self.config.max_event_processing_seconds,
             max_wait_seconds_before_shutdown=self.config.max_wait_seconds_before_shutdown,
+            event_workers_count=self.config.event_workers_count,
+            port_app_config_max_age_seconds=self.config.live_events_port_app_config_max_age_seconds,
+            events_batch=self.config.live_events_batch,
+            events_queue=self.config.live_events_queue,
         )
 
         self.integration = (
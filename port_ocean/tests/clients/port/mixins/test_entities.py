@@ -1,11 +1,15 @@
+import json
 from typing import Any, List, Generator
 from unittest.mock import MagicMock, patch, AsyncMock
 
 import pytest
 
 from port_ocean.clients.port.mixins.entities import EntityClientMixin
+from port_ocean.clients.port.types import UserAgentType
+from port_ocean.config.settings import PortConcurrencySettings
 from port_ocean.core.models import Entity
-from httpx import ReadTimeout
+from port_ocean.core.utils.entity_serialization import serialize_entity
+from httpx import HTTPStatusError, ReadTimeout, Request, Response
 
 # Mock the ocean context at module level
 pytestmark = pytest.mark.usefixtures("mock_ocean")
@@ -172,3 +176,309 @@ async def test_batch_upsert_entities_read_timeout_should_raise_true(
             await entity_client.upsert_entities_in_batches(
                 entities=all_entities, request_options=MagicMock(), should_raise=True
             )
+
+
+async def test_search_entities_keys_pages_by_blueprint() -> None:
+    entity_client = EntityClientMixin(auth=AsyncMock(), client=MagicMock())
+    pages = {
+        "service": [{"blueprint": "service", "identifier": "a"}],
+        "team": [{"blueprint": "team", "identifier": "b"}],
+        None: [{"blueprint": "unmapped", "identifier": "c"}],
+    }
+    queries: list[dict[str, Any]] = []
+
+    async def search_raw_entities(
+        user_agent_type: UserAgentType, query: dict[str, Any], *args: Any
+    ) -> list[dict[str, Any]]:
+        queries.append(query)
+        rule = query["rules"][0]
+        return pages[rule["value"] if rule["operator"] == "=" else None]
+
+    with patch.object(
+        entity_client, "_search_raw_entities", side_effect=search_raw_entities
+    ):
+        result = [
+            page
+            async for page in entity_client.search_entities_keys(
+                UserAgentType.exporter, ["service", "team"]
+            )
+        ]
+
+    assert result == [[("service", "a")], [("team", "b")], [("unmapped", "c")]]
+    assert queries[-1]["rules"] == [
+        {"property": "$blueprint", "operator": "notIn", "value": ["service", "team"]}
+    ]
+
+
+async def test_search_entities_keys_without_blueprints_searches_once() -> None:
+    entity_client = EntityClientMixin(auth=AsyncMock(), client=MagicMock())
+
+    with patch.object(
+        entity_client,
+        "_search_raw_entities",
+        new_callable=AsyncMock,
+        return_value=[{"blueprint": "service", "identifier": "a"}],
+    ) as mock_search_raw_entities:
+        result = [
+            page
+            async for page in entity_client.search_entities_keys(
+                UserAgentType.exporter, []
+            )
+        ]
+
+    assert result == [[("service", "a")]]
+    mock_search_raw_entities.assert_called_once_with(UserAgentType.exporter, None)
+
+
+async def test_search_entities_with_limit_concurrency_records_the_status() -> None:
+    mock_client = MagicMock()
+    mock_client.post = AsyncMock(
+        return_value=Response(
+            429, json={}, request=Request("POST", "http://port/entities/search")
+        )
+    )
+    entity_client = EntityClientMixin(
+        auth=AsyncMock(),
+        client=mock_client,
+        concurrency_settings=PortConcurrencySettings(enabled=True, initial_limit=40),
+    )
+
+    with pytest.raises(HTTPStatusError):
+        await entity_client.search_entities(
+            UserAgentType.exporter,
+            query={"combinator": "and", "rules": []},
+            limit_concurrency=True,
+        )
+
+    assert entity_client.concurrency_limiter.limit == 20
+
+
+async def test_batch_delete_entities_groups_by_blueprint_and_chunks(
+    entity_client: EntityClientMixin, mock_ocean: MagicMock
+) -> None:
+    mock_ocean.config.upsert_entities_batch_max_length = 2
+    entities = [Entity(identifier=f"s{i}", blueprint="service") for i in range(3)] + [
+        Entity(identifier="t0", blueprint="team")
+    ]
+
+    async def delete_entities_bulk(
+        blueprint: str, batch: list[Entity], *args: Any, **kwargs: Any
+    ) -> list[tuple[bool, Entity]]:
+        return [(entity.identifier != "s1", entity) for entity in batch]
+
+    with patch.object(
+        entity_client, "delete_entities_bulk", side_effect=delete_entities_bulk
+    ) as mock_delete_entities_bulk:
+        results = await entity_client.batch_delete_entities(
+            entities, MagicMock(), should_raise=False
+        )
+
+    assert [
+        (call[0][0], [entity.identifier for entity in call[0][1]])
+        for call in mock_delete_entities_bulk.call_args_list
+    ] == [("service", ["s0", "s1"]), ("service", ["s2"]), ("team", ["t0"])]
+    assert [(is_deleted, entity.identifier) for is_deleted, entity in results] == [
+        (True, "s0"),
+        (False, "s1"),
+        (True, "s2"),
+        (True, "t0"),
+    ]
+
+
+async def test_batch_delete_entities_falls_back_to_individual_deletes(
+    entity_client: EntityClientMixin,
+) -> None:
+    error = HTTPStatusError(
+        "HTTP 405",
+        request=Request("DELETE", "http://port"),
+        response=Response(405),
+    )
+
+    with (
+        patch.object(
+            entity_client, "delete_entities_bulk", AsyncMock(return_value=error)
+        ),
+        patch.object(entity_client, "delete_entity", AsyncMock()) as mock_delete,
+    ):
+        results = await entity_client.batch_delete_entities(
+            all_entities, MagicMock(), should_raise=False
+        )
+
+    assert mock_delete.call_count == len(all_entities)
+    assert all(is_deleted for is_deleted, _ in results)
+
+
+async def test_delete_entities_bulk_parses_failed_entities() -> None:
+    entity_client = EntityClientMixin(auth=AsyncMock(), client=MagicMock())
+    entity_client.client.request = AsyncMock(  # type: ignore[method-assign]
+        return_value=Response(
+            200,
+            json={"ok": True, "failedEntities": [{"identifier": "b"}]},
+            request=Request("DELETE", "http://port"),
+        )
+    )
+    entities = [
+        Entity(identifier="a", blueprint="service"),
+        Entity(identifier="b", blueprint="service"),
+    ]
+
+    results = await entity_client.delete_entities_bulk(
+        "service", entities, {"delete_dependent_entities": True}  # type: ignore[typeddict-item]
+    )
+
+    assert results == [(True, entities[0]), (False, entities[1])]
+    assert entity_client.client.request.call_args[1]["json"] == {"entities": ["a", "b"]}
+
+
+async def test_batch_delete_entities_falls_back_when_raising() -> None:
+    entity_client = EntityClientMixin(auth=AsyncMock(), client=MagicMock())
+    entity_client.client.request = AsyncMock(  # type: ignore[method-assign]
+        return_value=Response(404, request=Request("DELETE", "http://port"))
+    )
+
+    with patch.object(entity_client, "delete_entity", AsyncMock()) as mock_delete:
+        results = await entity_client.batch_delete_entities(
+            all_entities, {"delete_dependent_entities": True}  # type: ignore[typeddict-item]
+        )
+
+    assert mock_delete.call_count == len(all_entities)
+    assert all(is_deleted for is_deleted, _ in results)
+
+
+async def test_batch_delete_entities_should_raise_failed_batch_not_raised() -> None:
+    entity_client = EntityClientMixin(auth=AsyncMock(), client=MagicMock())
+    entity_client.client.request = AsyncMock(  # type: ignore[method-assign]
+        return_value=Response(500, request=Request("DELETE", "http://port"))
+    )
+
+    with patch.object(entity_client, "delete_entity", AsyncMock()) as mock_delete:
+        results = await entity_client.batch_delete_entities(
+            all_entities, {"delete_dependent_entities": True}, should_raise=True  # type: ignore[typeddict-item]
+        )
+
+    mock_delete.assert_not_called()
+    assert sorted(entity.identifier for _, entity in results) == ["a", "b", "c"]
+    assert not any(is_deleted for is_deleted, _ in results)
+
+
+async def test_delete_entities_bulk_unknown_response_not_deleted() -> None:
+    entity_client = EntityClientMixin(auth=AsyncMock(), client=MagicMock())
+    entity_client.client.request = AsyncMock(  # type: ignore[method-assign]
+        return_value=Response(
+            200, json={"deleted": 2}, request=Request("DELETE", "http://port")
+        )
+    )
+    entities = [
+        Entity(identifier="a", blueprint="service"),
+        Entity(identifier="b", blueprint="service"),
+    ]
+
+    results = await entity_client.delete_entities_bulk(
+        "service", entities, {"delete_dependent_entities": True}  # type: ignore[typeddict-item]
+    )
+
+    assert results == [(False, entities[0]), (False, entities[1])]
+
+
+async def test_upsert_entities_in_batches_splits_too_large_bulks_in_halves() -> None:
+    entity_client = EntityClientMixin(auth=AsyncMock(), client=MagicMock())
+    entities = [Entity(identifier=f"e{i}", blueprint="service") for i in range(8)]
+    bulk_lengths: list[int] = []
+
+    async def upsert_entities_bulk(
+        blueprint: str, bulk: list[Entity], *args: Any, **kwargs: Any
+    ) -> list[tuple[bool | None, Entity]] | HTTPStatusError:
+        bulk_lengths.append(len(bulk))
+        assert kwargs["serialized_entities"] == [
+            serialize_entity(entity) for entity in bulk
+        ]
+        if len(bulk) > 2:
+            return HTTPStatusError(
+                "HTTP 413",
+                request=Request("POST", "http://port"),
+                response=Response(413),
+            )
+        return [(True, entity) for entity in bulk]
+
+    with patch.object(
+        entity_client, "upsert_entities_bulk", side_effect=upsert_entities_bulk
+    ):
+        results = await entity_client.upsert_entities_in_batches(
+            entities, MagicMock(), should_raise=False
+        )
+
+    assert bulk_lengths == [8, 4, 4, 2, 2, 2, 2]
+    assert [entity.identifier for _, entity in results] == [
+        entity.identifier for entity in entities
+    ]
+    assert all(is_upserted for is_upserted, _ in results)
+
+
+async def test_upsert_entities_in_batches_uses_exact_sizes_and_bulk_length(
+    mock_ocean: MagicMock,
+) -> None:
+    entity_client = EntityClientMixin(auth=AsyncMock(), client=MagicMock())
+    entities = [Entity(identifier=f"e{i}", blueprint="service") for i in range(10)]
+    entity_size = len(serialize_entity(entities[0]))
+    # Leave room for exactly 3 entities in the size limit
+    mock_ocean.config.upsert_entities_batch_max_size_in_bytes = len(
+        b'{"entities":[]}'
+    ) + 3 * (entity_size + 1)
+
+    with patch.object(
+        entity_client,
+        "upsert_entities_bulk",
+        side_effect=lambda blueprint, bulk, *args, **kwargs: [
+            (True, entity) for entity in bulk
+        ],
+    ) as mock_upsert_entities_bulk:
+        await entity_client.upsert_entities_in_batches(
+            entities, MagicMock(), should_raise=False
+        )
+        assert [
+            len(call[0][1]) for call in mock_upsert_entities_bulk.call_args_list
+        ] == [3, 3, 3, 1]
+
+        entity_client._get_bulk_sizer("service").length = 2
+        mock_upsert_entities_bulk.reset_mock()
+        await entity_client.upsert_entities_in_batches(
+            entities[:4], MagicMock(), should_raise=False
+        )
+        assert [
+            len(call[0][1]) for call in mock_upsert_entities_bulk.call_args_list
+        ] == [2, 2]
+
+
+async def test_upsert_entities_bulk_sends_serialized_entities(
+    mock_ocean: MagicMock,
+) -> None:
+    mock_ocean.metrics = MagicMock()
+    entity_client = EntityClientMixin(auth=AsyncMock(), client=MagicMock())
+    entity_client.auth.headers = AsyncMock(return_value={"Authorization": "test"})  # type: ignore[method-assign]
+    entities = [Entity(identifier="a", blueprint="service", properties={"x": 1})]
+    entity_client.client.post = AsyncMock(  # type: ignore[method-assign]
+        return_value=Response(
+            200,
+            json={"entities": [{"identifier": "a", "index": 0, "created": True}]},
+            request=Request("POST", "http://port"),
+        )
+    )
+
+    results = await entity_client.upsert_entities_bulk(
+        "service",
+        entities,
+        {  # type: ignore[typeddict-item]
+            "validation_only": False,
+            "merge": True,
+            "create_missing_related_entities": True,
+        },
+    )
+
+    call_kwargs = entity_client.client.post.call_args[1]
+    assert json.loads(call_kwargs["content"]) == {
+        "entities": [
+            {"identifier": "a", "blueprint": "service", "properties": {"x": 1}}
+        ]
+    }
+    assert call_kwargs["headers"]["Content-Type"] == "application/json"
+    assert isinstance(results, list) and results[0][0] is True
@@ -0,0 +1,53 @@
+import time
+
+from port_ocean.clients.port.bulk_sizer import (
+    BULK_TARGET_LATENCY_SECONDS,
+    AdaptiveBulkSizer,
+)
+
+
+def test_bulk_sizer_halves_on_slow_bulks_and_recovers() -> None:
+    bulk_sizer = AdaptiveBulkSizer(max_length=20, max_size_in_bytes=1024)
+
+    bulk_sizer.record_success(20, BULK_TARGET_LATENCY_SECONDS + 1, time.monotonic())
+    assert bulk_sizer.length == 10
+
+    bulk_sizer.record_success(10, 0.1, time.monotonic())
+    bulk_sizer.record_success(4, 0.1, time.monotonic())
+    assert bulk_sizer.length == 12
+
+    for _ in range(10):
+        bulk_sizer.record_success(bulk_sizer.length, 0.1, time.monotonic())
+    assert bulk_sizer.length == 20
+
+
+def test_bulk_sizer_decreases_once_for_concurrent_slow_bulks() -> None:
+    bulk_sizer = AdaptiveBulkSizer(max_length=20, max_size_in_bytes=1024)
+    started_at = time.monotonic()
+
+    for _ in range(5):
+        bulk_sizer.record_success(20, BULK_TARGET_LATENCY_SECONDS + 1, started_at)
+    bulk_sizer.record_error(20, 100, 503, started_at)
+    assert bulk_sizer.length == 10
+
+    bulk_sizer.record_error(10, 100, 503, time.monotonic())
+    assert bulk_sizer.length == 5
+
+
+def test_bulk_sizer_limits_size_on_too_large_bulks() -> None:
+    bulk_sizer = AdaptiveBulkSizer(max_length=20, max_size_in_bytes=1024)
+
+    bulk_sizer.record_error(8, 600, 413, time.monotonic())
+
+    assert bulk_sizer.length == 4
+    assert bulk_sizer.max_size_in_bytes == 300
+
+
+def test_bulk_sizer_decreases_on_overload_only() -> None:
+    bulk_sizer = AdaptiveBulkSizer(max_length=20, max_size_in_bytes=1024)
+
+    bulk_sizer.record_error(20, 100, 422, time.monotonic())
+    assert bulk_sizer.length == 20
+
+    bulk_sizer.record_error(20, 100, 503, time.monotonic())
+    assert bulk_sizer.length == 10
@@ -0,0 +1,114 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from port_ocean.clients.port.concurrency_limiter import AdaptiveConcurrencyLimiter
+from port_ocean.config.settings import PortConcurrencySettings
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limiter_caps_concurrent_requests() -> None:
+    limiter = AdaptiveConcurrencyLimiter(PortConcurrencySettings(initial_limit=3))
+    concurrent = 0
+    max_concurrent = 0
+
+    async def request() -> None:
+        nonlocal concurrent, max_concurrent
+        async with limiter.acquire() as slot:
+            concurrent += 1
+            max_concurrent = max(max_concurrent, concurrent)
+            await asyncio.sleep(0.01)
+            concurrent -= 1
+            slot.record_response(httpx.Response(200))
+
+    await asyncio.gather(*(request() for _ in range(10)))
+
+    assert max_concurrent == 3
+    assert limiter.limit == 3
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limiter_releases_slot_of_cancelled_waiter() -> None:
+    limiter = AdaptiveConcurrencyLimiter(PortConcurrencySettings(initial_limit=1))
+    release = asyncio.Event()
+
+    async def hold() -> None:
+        async with limiter.acquire():
+            await release.wait()
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    release.set()
+    await holder
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert limiter.in_flight == 0
+    async with limiter.acquire():
+        assert limiter.in_flight == 1
+
+
+def test_concurrency_limiter_grows_while_latency_is_flat() -> None:
+    limiter = AdaptiveConcurrencyLimiter(
+        PortConcurrencySettings(enabled=True, initial_limit=4, max_limit=6)
+    )
+    limiter._in_flight = 2
+    for _ in range(20):
+        limiter._adapt(time.monotonic(), 0.1, 200, None)
+    # The limit isn't in use, so it doesn't grow
+    assert limiter.limit == 4
+
+    limiter._in_flight = 5
+    for _ in range(20):
+        limiter._adapt(time.monotonic(), 0.1, 200, None)
+    assert limiter.limit == 6
+
+
+def test_concurrency_limiter_shrinks_on_latency_and_overload() -> None:
+    limiter = AdaptiveConcurrencyLimiter(
+        PortConcurrencySettings(enabled=True, initial_limit=40)
+    )
+    limiter._adapt(time.monotonic(), 0.1, 200, None)
+
+    limiter._adapt(time.monotonic(), 1.0, 200, None)
+    assert limiter.limit == 39
+
+    # Requests that were in flight together are answered with a burst of 429s, the limit is only halved once
+    start = time.monotonic()
+    for _ in range(5):
+        limiter._adapt(start, 0.1, 429, None)
+    assert limiter.limit == 19
+
+    limiter._adapt(time.monotonic(), 0.1, 503, None)
+    assert limiter.limit == 9
+
+    limiter._adapt(time.monotonic(), 0.1, None, httpx.ReadTimeout("timeout"))
+    assert limiter.limit == 4
+
+
+def test_concurrency_limiter_ignores_the_latency_of_unmeasured_slots() -> None:
+    limiter = AdaptiveConcurrencyLimiter(
+        PortConcurrencySettings(enabled=True, initial_limit=40)
+    )
+    limiter._adapt(time.monotonic(), 0.1, 200, None)
+
+    limiter._adapt(time.monotonic(), 5.0, 200, None, measure_latency=False)
+    assert limiter.limit == 40
+    assert limiter._baseline_latency == 0.1
+
+    limiter._adapt(time.monotonic(), 5.0, 429, None, measure_latency=False)
+    assert limiter.limit == 20
+
+
+def test_concurrency_limiter_is_fixed_when_not_enabled() -> None:
+    limiter = AdaptiveConcurrencyLimiter(PortConcurrencySettings(initial_limit=50))
+
+    limiter._release(time.monotonic(), 429, None)
+
+    assert limiter.limit == 50
@@ -1,3 +1,4 @@
+import json
 from contextlib import asynccontextmanager
 from typing import Any, AsyncGenerator
 from unittest.mock import MagicMock, AsyncMock, patch
@@ -6,7 +7,15 @@ import pytest
 from httpx import Response
 
 from port_ocean.clients.port.client import PortClient
-from port_ocean.config.settings import IntegrationSettings, MetricsSettings
+from port_ocean.config.settings import (
+    EntityFingerprintsSettings,
+    IntegrationSettings,
+    MetricsSettings,
+    PortConcurrencySettings,
+    ResourceMemorySettings,
+    ResyncPipelineSettings,
+    ResyncWorkersSettings,
+)
 from port_ocean.context.event import EventContext
 from port_ocean.context.ocean import PortOceanContext, ocean
 from port_ocean.core.handlers.entities_state_applier.port.applier import (
@@ -24,6 +33,7 @@ from port_ocean.core.handlers.port_app_config.models import (
     Selector,
 )
 from port_ocean.core.models import Entity, ProcessExecutionMode
+from port_ocean.core.utils.entity_keys import EntityKey
 from port_ocean.helpers.metric.metric import Metrics
 from port_ocean.ocean import Ocean
 from port_ocean.cache.memory import InMemoryCacheProvider
@@ -38,7 +48,11 @@ def mock_http_client() -> MagicMock:
         if "/bulk" in url:
             success_entities = []
             failed_entities = []
-            entities_body = kwargs.get("json", {})
+            entities_body = (
+                json.loads(kwargs["content"])
+                if "content" in kwargs
+                else kwargs.get("json", {})
+            )
             entities = entities_body.get("entities", [])
             for index, entity in enumerate(entities):
                 if entity.get("properties", {}).get("mock_is_to_fail", False):
@@ -70,7 +84,11 @@ def mock_http_client() -> MagicMock:
                 json={"entities": success_entities, "errors": failed_entities},
             )
         else:
-            entity = kwargs.get("json", {})
+            entity = (
+                json.loads(kwargs["content"])
+                if "content" in kwargs
+                else kwargs.get("json", {})
+            )
             if entity.get("properties", {}).get("mock_is_to_fail", False):
                 return Response(
                     404, headers=MagicMock(), json={"ok": False, "error": "not_found"}
@@ -93,6 +111,14 @@ def mock_http_client() -> MagicMock:
     return mock_http_client
 
 
+async def mock_search_entities_keys(
+    *args: Any, **kwargs: Any
+) -> AsyncGenerator[list[EntityKey], None]:
+    pages: list[list[EntityKey]] = []
+    for page in pages:
+        yield page
+
+
 @pytest.fixture
 def mock_port_client(mock_http_client: MagicMock) -> PortClient:
     mock_port_client = PortClient(
@@ -107,6 +133,7 @@ def mock_port_client(mock_http_client: MagicMock) -> PortClient:
     )
 
     mock_port_client.search_entities = AsyncMock(return_value=[])  # type: ignore
+    mock_port_client.search_entities_keys = MagicMock(side_effect=mock_search_entities_keys)  # type: ignore
     mock_port_client.client = mock_http_client
     return mock_port_client
 
@@ -120,6 +147,17 @@ def mock_ocean(mock_port_client: PortClient) -> Ocean:
         ocean_mock.config = MagicMock()
         ocean_mock.config.port = MagicMock()
         ocean_mock.config.port.port_app_config_cache_ttl = 60
+        ocean_mock.config.max_concurrent_resources = 1
+        ocean_mock.config.max_concurrent_resync_generators = 1
+        ocean_mock.config.jq_batch_evaluation = False
+        ocean_mock.config.jq_transform_workers = 0
+        ocean_mock.config.upsert_entities_batch_max_length = 20
+        ocean_mock.config.upsert_entities_batch_max_size_in_bytes = 1024 * 1024
+        ocean_mock.config.resync_pipeline = ResyncPipelineSettings()
+        ocean_mock.config.entity_fingerprints = EntityFingerprintsSettings()
+        ocean_mock.config.port_concurrency = PortConcurrencySettings()
+        ocean_mock.config.resync_workers = ResyncWorkersSettings()
+        ocean_mock.config.resource_memory = ResourceMemorySettings()
         ocean_mock.port_client = mock_port_client
         ocean_mock.process_execution_mode = ProcessExecutionMode.single_process
         ocean_mock.cache_provider = InMemoryCacheProvider()
@@ -5,6 +5,7 @@ from port_ocean.core.handlers.entities_state_applier.port.applier import (
 )
 from port_ocean.core.models import Entity
 from port_ocean.core.ocean_types import EntityDiff
+from port_ocean.core.utils.entity_keys import EntityKey
 from port_ocean.clients.port.types import UserAgentType
 from port_ocean.ocean import Ocean
 from port_ocean.context.ocean import PortOceanContext
@@ -52,6 +53,54 @@ async def test_delete_diff_below_threshold(mock_context: PortOceanContext) -> No
     assert mock_safe_delete.call_args[0][0][0].identifier == "3"
 
 
+@pytest.mark.asyncio
+async def test_delete_diff_by_keys_below_threshold(
+    mock_context: PortOceanContext,
+) -> None:
+    applier = HttpEntitiesStateApplier(mock_context)
+    generated_entities = [
+        Entity(identifier="1", blueprint="test"),
+        Entity(identifier="2", blueprint="test"),
+    ]
+
+    with patch.object(applier, "_safe_delete") as mock_safe_delete:
+        await applier.delete_diff_by_keys(
+            {
+                EntityKey("test", "1"),
+                EntityKey("test", "2"),
+                EntityKey("test", "3"),
+                EntityKey("other", "1"),
+            },
+            generated_entities,
+            UserAgentType.exporter,
+            entity_deletion_threshold=0.9,
+        )
+
+    mock_safe_delete.assert_called_once()
+    assert sorted(
+        (entity.blueprint, entity.identifier)
+        for entity in mock_safe_delete.call_args[0][0]
+    ) == [("other", "1"), ("test", "3")]
+    assert mock_safe_delete.call_args[0][1] == generated_entities
+
+
+@pytest.mark.asyncio
+async def test_delete_diff_by_keys_above_threshold_not_deleted(
+    mock_context: PortOceanContext,
+) -> None:
+    applier = HttpEntitiesStateApplier(mock_context)
+
+    with patch.object(applier, "_safe_delete") as mock_safe_delete:
+        await applier.delete_diff_by_keys(
+            {EntityKey("test", "1"), EntityKey("test", "2")},
+            [Entity(identifier="3", blueprint="test")],
+            UserAgentType.exporter,
+            entity_deletion_threshold=0.5,
+        )
+
+    mock_safe_delete.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_delete_diff_above_default_threshold(
     mock_context: PortOceanContext,
@@ -228,3 +277,32 @@ async def test_using_create_entity_helper(
 
         mock_upsert.assert_called_once()
         assert len(result) == 1
+
+
+@pytest.mark.asyncio
+async def test_delete_without_dependents_deletes_in_dependency_waves(
+    mock_ocean: Ocean,
+    mock_context: PortOceanContext,
+    mock_port_app_config: PortAppConfig,
+) -> None:
+    applier = HttpEntitiesStateApplier(mock_context)
+    entities = [
+        Entity(identifier="c", blueprint="test", relations={"rel": "b"}),
+        Entity(identifier="b", blueprint="test", relations={"rel": "a"}),
+        Entity(identifier="a", blueprint="test"),
+        Entity(identifier="d", blueprint="test"),
+    ]
+
+    async with event_context(EventType.RESYNC, trigger_type="machine") as event:
+        event.port_app_config = mock_port_app_config
+        event.port_app_config.delete_dependent_entities = False
+
+        mock_batch_delete = AsyncMock(return_value=[])
+        setattr(mock_ocean.port_client, "batch_delete_entities", mock_batch_delete)
+
+        await applier.delete(entities, UserAgentType.exporter)
+
+    assert [
+        sorted(entity.identifier for entity in call[0][0])
+        for call in mock_batch_delete.call_args_list
+    ] == [["a", "d"], ["b"], ["c"]]
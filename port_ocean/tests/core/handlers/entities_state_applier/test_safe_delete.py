@@ -0,0 +1,99 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from port_ocean.clients.port.types import UserAgentType
+from port_ocean.context.event import EventType, event_context
+from port_ocean.context.ocean import PortOceanContext
+from port_ocean.core.handlers.entities_state_applier.port.applier import (
+    HttpEntitiesStateApplier,
+)
+from port_ocean.core.handlers.entities_state_applier.port.safe_delete import (
+    SafeDeleteReason,
+    plan_safe_delete,
+)
+from port_ocean.core.handlers.port_app_config.models import PortAppConfig
+from port_ocean.core.models import Entity
+
+
+def test_plan_safe_delete_reasons() -> None:
+    kept = Entity(identifier="kept", blueprint="service")
+    related = Entity(identifier="related", blueprint="team")
+    deleted = Entity(identifier="deleted", blueprint="service")
+
+    plan = plan_safe_delete(
+        [kept, related, deleted],
+        [kept, Entity(identifier={"rules": []}, blueprint="service")],
+        [related],
+        create_missing_related_entities=True,
+    )
+
+    assert plan.to_delete == [(deleted, SafeDeleteReason.NOT_KEPT)]
+    assert plan.skipped == [
+        (kept, SafeDeleteReason.KEPT),
+        (related, SafeDeleteReason.PROTECTED_RELATION),
+    ]
+
+
+def test_plan_safe_delete_deletes_related_when_not_creating_missing() -> None:
+    related = Entity(identifier="related", blueprint="team")
+
+    plan = plan_safe_delete(
+        [related], [], [related], create_missing_related_entities=False
+    )
+
+    assert plan.entities_to_delete == [related]
+    assert plan.to_delete[0][1] == SafeDeleteReason.RELATED_TO_KEPT
+
+
+def test_plan_safe_delete_large_diff() -> None:
+    entities_to_delete = [
+        Entity(identifier=f"entity_{i}", blueprint="service") for i in range(100_000)
+    ]
+    entities_to_protect = entities_to_delete[::2]
+    related_entities = [
+        Entity(identifier=f"entity_{i}", blueprint="team") for i in range(100_000)
+    ]
+
+    plan = plan_safe_delete(
+        entities_to_delete,
+        entities_to_protect,
+        related_entities,
+        create_missing_related_entities=True,
+    )
+
+    assert len(plan.to_delete) == 50_000
+    assert len(plan.skipped) == 50_000
+
+
+@pytest.mark.asyncio
+async def test_safe_delete_deletes_only_planned_entities(
+    mock_context: PortOceanContext,
+    mock_port_app_config: PortAppConfig,
+) -> None:
+    applier = HttpEntitiesStateApplier(mock_context)
+    kept = Entity(identifier="kept", blueprint="service")
+    related = Entity(identifier="related", blueprint="team")
+    deleted = Entity(identifier="deleted", blueprint="service")
+
+    async with event_context(EventType.RESYNC, trigger_type="machine") as event:
+        event.port_app_config = mock_port_app_config
+        event.port_app_config.create_missing_related_entities = True
+
+        with (
+            patch(
+                "port_ocean.core.handlers.entities_state_applier.port.applier.get_related_entities",
+                AsyncMock(return_value=[related]),
+            ),
+            patch.object(applier, "delete", AsyncMock()) as mock_delete,
+        ):
+            plan = await applier.plan_safe_delete([kept, related, deleted], [kept])
+            mock_delete.assert_not_called()
+
+            await applier._safe_delete(
+                [kept, related, deleted], [kept], UserAgentType.exporter
+            )
+
+    assert plan.entities_to_delete == [deleted]
+    mock_delete.assert_called_once()
+    assert mock_delete.call_args[0][0] == [deleted]
@@ -0,0 +1,47 @@
+import pytest
+
+from port_ocean.core.handlers.entity_processor.jq_compiled_cache import (
+    CompiledJQCache,
+)
+
+
+def test_get_caches_by_pattern() -> None:
+    cache = CompiledJQCache()
+
+    compiled = cache.get("  .foo\n", True)
+    assert compiled.input_value({"foo": "bar"}).first() == "bar"
+
+    assert cache.get("  .foo\n", True) is compiled
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_get_keys_by_environment_variables_access() -> None:
+    cache = CompiledJQCache()
+
+    with_env = cache.get("env | length > 0", True)
+    without_env = cache.get("env | length > 0", False)
+
+    assert cache.misses == 2
+    assert with_env.input_value(None).first() is True
+    assert without_env.input_value(None).first() is False
+
+
+def test_get_evicts_least_recently_used() -> None:
+    cache = CompiledJQCache(max_size=2)
+    cache.get(".a", True)
+    cache.get(".b", True)
+    cache.get(".a", True)
+    cache.get(".c", True)
+
+    assert len(cache) == 2
+    cache.get(".a", True)
+    assert cache.misses == 3
+    cache.get(".b", True)
+    assert cache.misses == 4
+
+
+def test_get_raises_on_invalid_pattern() -> None:
+    cache = CompiledJQCache()
+    with pytest.raises(ValueError):
+        cache.get(".foo.", True)
+    assert len(cache) == 0
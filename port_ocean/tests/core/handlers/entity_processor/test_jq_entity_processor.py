@@ -1,13 +1,17 @@
 from typing import Any
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, MagicMock, Mock
 from loguru import logger
 import pytest
 from io import StringIO
 
 from port_ocean.context.ocean import PortOceanContext
+from port_ocean.core.handlers.entity_processor.jq_compiled_cache import (
+    compiled_jq_cache,
+)
 from port_ocean.core.handlers.entity_processor.jq_entity_processor import (
     JQEntityProcessor,
 )
+from port_ocean.core.handlers.port_app_config.models import PortAppConfig
 from port_ocean.core.ocean_types import CalculationResult
 from port_ocean.exceptions.core import EntityProcessorException
 
@@ -18,6 +22,8 @@ class TestJQEntityProcessor:
     @pytest.fixture
     def mocked_processor(self, monkeypatch: Any) -> JQEntityProcessor:
         mock_context = AsyncMock()
+        mock_context.config.jq_transform_workers = 0
+        mock_context.metrics = MagicMock()
         monkeypatch.setattr(PortOceanContext, "app", mock_context)
         return JQEntityProcessor(mock_context)
 
@@ -82,6 +88,29 @@ class TestJQEntityProcessor:
         assert result.entity_selector_diff.passed[0].properties.get("foo") == "bar"
         assert not result.errors
 
+    async def test_parse_items_reports_compiled_cache_lookups_once(
+        self, mocked_processor: JQEntityProcessor
+    ) -> None:
+        mapping = Mock()
+        mapping.port.entity.mappings.dict.return_value = {
+            "identifier": ".foo",
+            "blueprint": ".foo",
+        }
+        mapping.port.items_to_parse = None
+        mapping.selector.query = "true"
+        mocked_processor.context.config.jq_batch_evaluation = False
+        compiled_jq_cache.clear()
+
+        await mocked_processor._parse_items(
+            mapping, [{"foo": str(i)} for i in range(50)]
+        )
+
+        inc_metric: MagicMock = mocked_processor.context.metrics.inc_metric  # type: ignore
+        assert inc_metric.call_count == 2
+        assert sum(call.kwargs["value"] for call in inc_metric.call_args_list) == (
+            compiled_jq_cache.hits + compiled_jq_cache.misses
+        )
+
     async def test_in_operator(self, mocked_processor: JQEntityProcessor) -> None:
         data = {
             "key": "GetPort_SelfService",
@@ -348,3 +377,146 @@ class TestJQEntityProcessor:
             "{'blueprint': '.bar', 'identifier': '.foo'} (null, missing, or misconfigured)"
             in logs_captured
         )
+
+    @pytest.mark.parametrize("items_to_parse", [None, ".items"])
+    async def test_parse_items_batch_evaluation_matches_per_field(
+        self,
+        mocked_processor: JQEntityProcessor,
+        monkeypatch: Any,
+        items_to_parse: str | None,
+    ) -> None:
+        mapping = Mock()
+        mapping.port.entity.mappings.dict.return_value = {
+            "identifier": ".id # comment",
+            "blueprint": '"service"',
+            "title": ".name | ascii_upcase",
+            "properties": {"url": ".url", "missing": ".missing.value"},
+            "relations": {
+                "team": {
+                    "combinator": '"and"',
+                    "rules": [
+                        {"property": '"name"', "operator": '"="', "value": ".team"}
+                    ],
+                }
+            },
+        }
+        mapping.port.items_to_parse = items_to_parse
+        mapping.selector.query = '.id != "skipped"'
+        raw_results: list[dict[str, Any]] = [
+            {"id": "a", "name": "a", "url": "https://a", "team": "x", "items": [1, 2]},
+            {"id": "skipped", "name": "b", "team": "y", "items": [3]},
+            {"id": "c", "name": 1, "team": "z", "items": "not-a-list"},
+        ]
+
+        monkeypatch.setattr(
+            mocked_processor.context.config, "jq_batch_evaluation", False
+        )
+        per_field_result = await mocked_processor._parse_items(
+            mapping, raw_results, parse_all=True
+        )
+        monkeypatch.setattr(
+            mocked_processor.context.config, "jq_batch_evaluation", True
+        )
+        monkeypatch.setattr(
+            mocked_processor, "_search", AsyncMock(side_effect=AssertionError)
+        )
+        batch_result = await mocked_processor._parse_items(
+            mapping, raw_results, parse_all=True
+        )
+
+        assert (
+            batch_result.entity_selector_diff == per_field_result.entity_selector_diff
+        )
+        assert (
+            batch_result.misonfigured_entity_keys
+            == per_field_result.misonfigured_entity_keys
+        )
+        assert not batch_result.errors
+        assert len(batch_result.entity_selector_diff.passed) == 2
+        assert len(batch_result.entity_selector_diff.failed) == 1
+
+    async def test_calculate_entities_batch_reports_non_boolean_selector(
+        self, mocked_processor: JQEntityProcessor
+    ) -> None:
+        raw_results: list[dict[str, Any]] = [
+            {"foo": "bar", "valid": True},
+            {"foo": "baz", "valid": "yes"},
+        ]
+        entities, errors = await mocked_processor._calculate_entities_batch(
+            raw_results, {"identifier": ".foo", "blueprint": ".foo"}, None, ".valid"
+        )
+        assert [entity.entity for entity in entities] == [
+            {"identifier": "bar", "blueprint": "bar"}
+        ]
+        assert len(errors) == 1
+        assert isinstance(errors[0], EntityProcessorException)
+
+    async def test_calculate_entities_batch_falls_back_on_invalid_program(
+        self, mocked_processor: JQEntityProcessor
+    ) -> None:
+        entities, errors = await mocked_processor._calculate_entities_batch(
+            [{"foo": "bar"}], {"identifier": ".foo", "blueprint": ".foo."}, None, "true"
+        )
+        assert len(entities) == 1
+        assert entities[0].entity == {"identifier": "bar", "blueprint": None}
+        assert entities[0].misconfigurations == {"blueprint": ".foo."}
+        assert not errors
+
+    async def test_parse_items_with_transform_workers(
+        self, mocked_processor: JQEntityProcessor, monkeypatch: Any
+    ) -> None:
+        monkeypatch.setattr(mocked_processor.context.config, "jq_transform_workers", 2)
+        mapping = Mock()
+        mapping.port.entity.mappings.dict.return_value = {
+            "identifier": ".foo",
+            "blueprint": '"service"',
+            "properties": {"index": ".index"},
+        }
+        mapping.port.items_to_parse = None
+        mapping.selector.query = ".index % 2 == 0"
+        raw_results = [
+            {"foo": f"entity-{index}", "index": index} for index in range(300)
+        ]
+        try:
+            result = await mocked_processor._parse_items(mapping, raw_results)
+        finally:
+            mocked_processor._get_process_pool(2).shutdown()
+
+        assert [
+            entity.properties["index"] for entity in result.entity_selector_diff.passed
+        ] == list(range(0, 300, 2))
+        assert len(result.entity_selector_diff.failed) == 0
+        assert not result.errors
+
+    async def test_warm_up_compiles_mapping_programs(
+        self, mocked_processor: JQEntityProcessor
+    ) -> None:
+        port_app_config = PortAppConfig.parse_obj(
+            {
+                "resources": [
+                    {
+                        "kind": "repository",
+                        "selector": {"query": ".warm_up_selector"},
+                        "port": {
+                            "itemsToParse": ".warm_up_items",
+                            "entity": {
+                                "mappings": {
+                                    "identifier": ".warm_up_identifier",
+                                    "blueprint": '"service"',
+                                    "properties": {"url": ".warm_up_url"},
+                                }
+                            },
+                        },
+                    }
+                ]
+            }
+        )
+        compiled_jq_cache.clear()
+
+        mocked_processor.warm_up(port_app_config)
+        # Selector, items to parse, 3 mapping fields, the batch items program and a batch program per parse_all value
+        assert compiled_jq_cache.misses == 8
+        assert len(compiled_jq_cache) == 8
+
+        mocked_processor._compile(".warm_up_url")
+        assert compiled_jq_cache.hits == 1
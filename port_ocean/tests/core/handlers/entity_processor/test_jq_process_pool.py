@@ -0,0 +1,40 @@
+import pytest
+
+from port_ocean.core.handlers.entity_processor.jq_process_pool import (
+    MIN_CHUNK_SIZE,
+    JQProcessPool,
+)
+
+
+@pytest.mark.asyncio
+async def test_evaluate_splits_batch_between_workers() -> None:
+    pool = JQProcessPool(2)
+    data = [{"id": index} for index in range(MIN_CHUNK_SIZE * 3)]
+    try:
+        assert len(pool._split_to_chunks(data)) == 2
+        result = await pool.evaluate("map(.id * 2)", data, True)
+    finally:
+        pool.shutdown()
+
+    assert result == [index * 2 for index in range(MIN_CHUNK_SIZE * 3)]
+
+
+@pytest.mark.asyncio
+async def test_evaluate_hides_environment_variables_when_not_allowed() -> None:
+    pool = JQProcessPool(1)
+    try:
+        result = await pool.evaluate("map(env | length)", [1], False)
+    finally:
+        pool.shutdown()
+
+    assert result == [0]
+
+
+@pytest.mark.asyncio
+async def test_evaluate_raises_on_invalid_program() -> None:
+    pool = JQProcessPool(1)
+    try:
+        with pytest.raises(ValueError):
+            await pool.evaluate("map(.id.)", [{"id": 1}], True)
+    finally:
+        pool.shutdown()
@@ -1,3 +1,5 @@
+import json
+import time
 from typing import Any
 from httpx import Response
 import pytest
@@ -301,7 +303,11 @@ def mock_http_client() -> MagicMock:
     mock_upserted_entities = []
 
     async def post(url: str, *args: Any, **kwargs: Any) -> Response:
-        entity = kwargs.get("json", {})
+        entity = (
+            json.loads(kwargs["content"])
+            if "content" in kwargs
+            else kwargs.get("json", {})
+        )
         if entity.get("properties", {}).get("mock_is_to_fail", {}):
             return Response(
                 404, headers=MagicMock(), json={"ok": False, "error": "not_found"}
@@ -402,3 +408,182 @@ async def test_sync_raw_results_one_raw_result_entity_upserted(
         [entity], UserAgentType.exporter
     )
     mock_live_events_mixin.entities_state_applier.delete.assert_not_called()
+
+
+def _event_raw_results(
+    resource: ResourceConfig,
+    updated: list[dict[str, Any]] | None = None,
+    deleted: list[dict[str, Any]] | None = None,
+) -> list[WebhookEventRawResults]:
+    raw_results = WebhookEventRawResults(
+        updated_raw_results=updated or [], deleted_raw_results=deleted or []
+    )
+    raw_results.resource = resource
+    return [raw_results]
+
+
+async def _parse_items_by_name(
+    resource: ResourceConfig, raw_items: list[dict[str, Any]], **kwargs: Any
+) -> CalculationResult:
+    return CalculationResult(
+        entity_selector_diff=EntitySelectorDiff(
+            passed=[
+                Entity(
+                    identifier=item["name"], blueprint="service", title=item["title"]
+                )
+                for item in raw_items
+            ],
+            failed=[],
+        ),
+        errors=[],
+        misonfigured_entity_keys={},
+    )
+
+
+@pytest.mark.asyncio
+async def test_sync_events_raw_results_coalesces_updates_last_write_wins(
+    mock_live_events_mixin: LiveEventsMixin,
+    mock_repository_resource_config: ResourceConfig,
+) -> None:
+    mock_live_events_mixin.entity_processor.parse_items = AsyncMock(side_effect=_parse_items_by_name)  # type: ignore
+    mock_live_events_mixin.entities_state_applier.upsert = AsyncMock()  # type: ignore
+    mock_live_events_mixin._delete_entities = AsyncMock()  # type: ignore
+
+    await mock_live_events_mixin.sync_events_raw_results(
+        [
+            _event_raw_results(
+                mock_repository_resource_config,
+                updated=[{"name": "repo-one", "title": "first"}],
+            ),
+            _event_raw_results(
+                mock_repository_resource_config,
+                updated=[
+                    {"name": "repo-two", "title": "second"},
+                    {"name": "repo-one", "title": "third"},
+                ],
+            ),
+        ]
+    )
+
+    mock_live_events_mixin.entity_processor.parse_items.assert_called_once()
+    upserted_entities = (
+        mock_live_events_mixin.entities_state_applier.upsert.call_args.args[0]
+    )
+    assert [(e.identifier, e.title) for e in upserted_entities] == [
+        ("repo-one", "third"),
+        ("repo-two", "second"),
+    ]
+    mock_live_events_mixin._delete_entities.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_sync_events_raw_results_applies_conflicting_events_in_order(
+    mock_live_events_mixin: LiveEventsMixin,
+    mock_repository_resource_config: ResourceConfig,
+) -> None:
+    mock_live_events_mixin.entity_processor.parse_items = AsyncMock(side_effect=_parse_items_by_name)  # type: ignore
+    mock_live_events_mixin.entities_state_applier.upsert = AsyncMock()  # type: ignore
+    mock_live_events_mixin._delete_entities = AsyncMock()  # type: ignore
+    repo_one = {"name": "repo-one", "title": "repo-one"}
+    repo_two = {"name": "repo-two", "title": "repo-two"}
+
+    await mock_live_events_mixin.sync_events_raw_results(
+        [
+            _event_raw_results(mock_repository_resource_config, updated=[repo_one]),
+            _event_raw_results(mock_repository_resource_config, deleted=[repo_one]),
+            _event_raw_results(mock_repository_resource_config, deleted=[repo_two]),
+            _event_raw_results(mock_repository_resource_config, updated=[repo_two]),
+        ]
+    )
+
+    upserted_entities = (
+        mock_live_events_mixin.entities_state_applier.upsert.call_args.args[0]
+    )
+    deleted_entities = mock_live_events_mixin._delete_entities.call_args.args[0]
+    assert [e.identifier for e in upserted_entities] == ["repo-two"]
+    assert [e.identifier for e in deleted_entities] == ["repo-one"]
+
+
+@pytest.mark.asyncio
+async def test_delete_entities_searches_the_existing_entities_once(
+    mock_live_events_mixin: LiveEventsMixin,
+    mock_ocean: Ocean,
+) -> None:
+    entities = [
+        Entity(identifier="repo-one", blueprint="service"),
+        Entity(identifier="repo-two", blueprint="service"),
+    ]
+    mock_ocean.port_client.search_entities = AsyncMock(return_value=[entities[1]])  # type: ignore
+    mock_live_events_mixin.entities_state_applier.delete = AsyncMock()  # type: ignore
+
+    with patch("port_ocean.core.integrations.mixins.live_events.ocean") as ocean:
+        ocean.port_client = mock_ocean.port_client
+        await mock_live_events_mixin._delete_entities(entities)
+
+    mock_ocean.port_client.search_entities.assert_called_once()
+    mock_live_events_mixin.entities_state_applier.delete.assert_called_once_with(
+        [entities[1]], UserAgentType.exporter
+    )
+
+
+@pytest.mark.asyncio
+async def test_parse_raw_event_results_to_entities_benchmark(
+    mock_live_events_mixin: LiveEventsMixin,
+) -> None:
+    # Half of the entities that didn't pass the selector are upserted by another raw item of the event
+    passed = [
+        Entity(identifier=f"repo-{i}", blueprint="service") for i in range(20_000)
+    ]
+    failed = [
+        Entity(identifier=f"repo-{i}", blueprint="service")
+        for i in range(10_000, 30_000)
+    ]
+    mock_live_events_mixin.entity_processor.parse_items = AsyncMock(  # type: ignore
+        return_value=CalculationResult(
+            entity_selector_diff=EntitySelectorDiff(passed=passed, failed=failed),
+            errors=[],
+            misonfigured_entity_keys={},
+        )
+    )
+
+    start = time.monotonic()
+    entities_to_upsert, entities_to_remove = (
+        await mock_live_events_mixin._parse_raw_event_results_to_entities(
+            [one_webhook_event_raw_results_for_creation]
+        )
+    )
+    duration = time.monotonic() - start
+
+    assert entities_to_upsert == passed
+    assert entities_to_remove == failed[10_000:]
+    assert duration < 5, f"Parsing 40k entities took {duration:.2f}s"
+
+
+@pytest.mark.asyncio
+async def test_parse_raw_event_results_to_entities_search_identifier_upserted_not_removed(
+    mock_live_events_mixin: LiveEventsMixin,
+) -> None:
+    search_identifier = {
+        "combinator": "and",
+        "rules": [{"property": "url", "operator": "=", "value": "repo-one"}],
+    }
+    upserted = Entity(identifier=search_identifier, blueprint="service")
+    not_passed = Entity(identifier=dict(search_identifier), blueprint="service")
+    mock_live_events_mixin.entity_processor.parse_items = AsyncMock(  # type: ignore
+        return_value=CalculationResult(
+            entity_selector_diff=EntitySelectorDiff(
+                passed=[upserted], failed=[not_passed]
+            ),
+            errors=[],
+            misonfigured_entity_keys={},
+        )
+    )
+
+    entities_to_upsert, entities_to_remove = (
+        await mock_live_events_mixin._parse_raw_event_results_to_entities(
+            [one_webhook_event_raw_results_for_creation]
+        )
+    )
+
+    assert entities_to_upsert == [upserted]
+    assert entities_to_remove == []
@@ -0,0 +1,76 @@
+from unittest.mock import MagicMock, patch
+
+from port_ocean.config.settings import ResourceMemorySettings
+from port_ocean.core.integrations.mixins import memory_watchdog
+from port_ocean.core.integrations.mixins.memory_watchdog import (
+    SubprocessMemoryWatchdog,
+)
+
+MB = 1024 * 1024
+
+
+def test_memory_watchdog_warns_and_then_kills_past_the_limit() -> None:
+    watchdog = SubprocessMemoryWatchdog(
+        "service-0", ResourceMemorySettings(max_rss_mb=100, warn_ratio=0.8)
+    )
+    process = MagicMock(pid=1)
+    mock_ocean = MagicMock(initialized=True)
+
+    with (
+        patch.object(memory_watchdog, "ocean", mock_ocean),
+        patch.object(memory_watchdog, "logger") as mock_logger,
+        patch.object(
+            memory_watchdog,
+            "get_rss_bytes",
+            side_effect=[50 * MB, 90 * MB, 95 * MB, 110 * MB],
+        ),
+    ):
+        for _ in range(3):
+            watchdog.sample(process)
+        assert mock_logger.warning.call_count == 1
+        process.kill.assert_not_called()
+
+        watchdog.sample(process)
+
+    process.kill.assert_called_once()
+    assert watchdog.limit_exceeded
+    assert watchdog.peak_rss_bytes == 110 * MB
+    mock_ocean.metrics.set_metric.assert_any_call(
+        "subprocess_peak_rss_bytes", ["service-0", "resync"], 110 * MB
+    )
+
+
+def test_memory_watchdog_only_reports_without_a_limit() -> None:
+    watchdog = SubprocessMemoryWatchdog("service-0", ResourceMemorySettings())
+    process = MagicMock(pid=1)
+
+    with patch.object(
+        memory_watchdog, "get_rss_bytes", side_effect=[10 * MB, 5 * MB, None]
+    ):
+        for _ in range(3):
+            watchdog.sample(process)
+
+    process.kill.assert_not_called()
+    assert not watchdog.limit_exceeded
+    assert watchdog.peak_rss_bytes == 10 * MB
+
+
+def test_memory_watchdog_counts_the_memory_added_since_the_baseline() -> None:
+    watchdog = SubprocessMemoryWatchdog(
+        "service-0", ResourceMemorySettings(max_rss_mb=100)
+    )
+    watchdog._baseline_rss_bytes = 400 * MB
+    process = MagicMock(pid=1)
+
+    with patch.object(
+        memory_watchdog, "get_rss_bytes", side_effect=[390 * MB, 480 * MB, 510 * MB]
+    ):
+        for _ in range(2):
+            watchdog.sample(process)
+        process.kill.assert_not_called()
+        assert watchdog.peak_rss_bytes == 80 * MB
+
+        watchdog.sample(process)
+
+    process.kill.assert_called_once()
+    assert watchdog.peak_rss_bytes == 110 * MB
@@ -1,6 +1,9 @@
+import asyncio
+import json
 from graphlib import CycleError
 from typing import Any, AsyncGenerator
 
+from port_ocean.core.utils.entity_fingerprints import EntityFingerprintStore
 from port_ocean.core.utils.entity_topological_sorter import EntityTopologicalSorter
 from port_ocean.exceptions.core import OceanAbortException
 import pytest
@@ -19,7 +22,9 @@ from port_ocean.core.handlers.entity_processor.jq_entity_processor import (
     JQEntityProcessor,
 )
 from port_ocean.core.models import Entity
+from port_ocean.config.settings import ResyncPipelineSettings
 from port_ocean.context.event import event_context, EventType
+from port_ocean.context.resource import resource_context
 from port_ocean.clients.port.types import UserAgentType
 from dataclasses import dataclass
 from typing import List, Optional
@@ -118,7 +123,7 @@ async def test_sync_raw_mixin_self_dependency(
     mock_sync_raw_mixin.entity_processor.parse_items = AsyncMock(return_value=calc_result_mock)  # type: ignore
 
     mock_order_by_entities_dependencies = MagicMock(
-        side_effect=EntityTopologicalSorter.order_by_entities_dependencies
+        side_effect=EntityTopologicalSorter.order_by_entities_dependencies_in_waves
     )
     async with event_context(EventType.RESYNC, trigger_type="machine") as event:
         app_config = (
@@ -128,14 +133,14 @@ async def test_sync_raw_mixin_self_dependency(
         )
         event.port_app_config = app_config
         event.entity_topological_sorter.register_entity = MagicMock(side_effect=event.entity_topological_sorter.register_entity)  # type: ignore
-        event.entity_topological_sorter.get_entities = MagicMock(side_effect=event.entity_topological_sorter.get_entities)  # type: ignore
+        event.entity_topological_sorter.get_entities_waves = MagicMock(side_effect=event.entity_topological_sorter.get_entities_waves)  # type: ignore
 
         with patch(
             "port_ocean.core.integrations.mixins.sync_raw.event_context",
             lambda *args, **kwargs: no_op_event_context(event),
         ):
             with patch(
-                "port_ocean.core.utils.entity_topological_sorter.EntityTopologicalSorter.order_by_entities_dependencies",
+                "port_ocean.core.utils.entity_topological_sorter.EntityTopologicalSorter.order_by_entities_dependencies_in_waves",
                 mock_order_by_entities_dependencies,
             ):
 
@@ -147,7 +152,9 @@ async def test_sync_raw_mixin_self_dependency(
                     len(event.entity_topological_sorter.entities) == 1
                 ), "Expected one failed entity callback due to retry logic"
                 assert event.entity_topological_sorter.register_entity.call_count == 1
-                assert event.entity_topological_sorter.get_entities.call_count == 1
+                assert (
+                    event.entity_topological_sorter.get_entities_waves.call_count == 1
+                )
 
                 assert mock_order_by_entities_dependencies.call_count == 1
                 assert [
@@ -238,7 +245,7 @@ async def test_sync_raw_mixin_circular_dependency(
     mock_sync_raw_mixin.entity_processor.parse_items = AsyncMock(return_value=calc_result_mock)  # type: ignore
 
     mock_order_by_entities_dependencies = MagicMock(
-        side_effect=EntityTopologicalSorter.order_by_entities_dependencies
+        side_effect=EntityTopologicalSorter.order_by_entities_dependencies_in_waves
     )
     async with event_context(EventType.RESYNC, trigger_type="machine") as event:
         app_config = (
@@ -256,23 +263,24 @@ async def test_sync_raw_mixin_circular_dependency(
 
         event.entity_topological_sorter.register_entity = MagicMock(side_effect=mock_register_entity)  # type: ignore
         raiesed_error_handle_failed = []
-        org_get_entities = event.entity_topological_sorter.get_entities
+        org_get_entities_waves = event.entity_topological_sorter.get_entities_waves
 
         def handle_failed_wrapper(*args: Any, **kwargs: Any) -> Any:
             try:
-                return list(org_get_entities(*args, **kwargs))
+                return org_get_entities_waves(*args, **kwargs)
             except Exception as e:
                 raiesed_error_handle_failed.append(e)
                 raise e
 
-        event.entity_topological_sorter.get_entities = MagicMock(side_effect=lambda *args, **kwargs: handle_failed_wrapper(*args, **kwargs))  # type: ignore
+        event.entity_topological_sorter.get_entities_waves = MagicMock(side_effect=lambda *args, **kwargs: handle_failed_wrapper(*args, **kwargs))  # type: ignore
+        event.entity_topological_sorter.get_entities = MagicMock(side_effect=event.entity_topological_sorter.get_entities)  # type: ignore
 
         with patch(
             "port_ocean.core.integrations.mixins.sync_raw.event_context",
             lambda *args, **kwargs: no_op_event_context(event),
         ):
             with patch(
-                "port_ocean.core.utils.entity_topological_sorter.EntityTopologicalSorter.order_by_entities_dependencies",
+                "port_ocean.core.utils.entity_topological_sorter.EntityTopologicalSorter.order_by_entities_dependencies_in_waves",
                 mock_order_by_entities_dependencies,
             ):
 
@@ -284,19 +292,23 @@ async def test_sync_raw_mixin_circular_dependency(
                     len(event.entity_topological_sorter.entities) == 2
                 ), "Expected one failed entity callback due to retry logic"
                 assert event.entity_topological_sorter.register_entity.call_count == 2
-                assert event.entity_topological_sorter.get_entities.call_count == 2
+                assert (
+                    event.entity_topological_sorter.get_entities_waves.call_count == 1
+                )
                 assert [
                     call[0]
                     for call in event.entity_topological_sorter.get_entities.call_args_list
-                ] == [(), (False,)]
+                ] == [(False,)]
                 assert len(raiesed_error_handle_failed) == 1
                 assert isinstance(raiesed_error_handle_failed[0], OceanAbortException)
                 assert isinstance(raiesed_error_handle_failed[0].__cause__, CycleError)
-                assert (
-                    len(mock_ocean.port_client.client.post.call_args_list)  # type: ignore
-                    - len(entities)
-                    == 1
-                )
+                # The unordered retry upserts both entities in a single bulk request
+                post_calls = mock_ocean.port_client.client.post.call_args_list  # type: ignore
+                assert len(post_calls) == 2
+                assert [
+                    entity.get("identifier")
+                    for entity in json.loads(post_calls[1][1]["content"])["entities"]
+                ] == [entity.identifier for entity in entities]
 
                 # Add assertions for actual metrics
                 metrics = mock_ocean.metrics.generate_metrics()
@@ -382,7 +394,7 @@ async def test_sync_raw_mixin_dependency(
     mock_sync_raw_mixin.entity_processor.parse_items = AsyncMock(return_value=calc_result_mock)  # type: ignore
 
     mock_order_by_entities_dependencies = MagicMock(
-        side_effect=EntityTopologicalSorter.order_by_entities_dependencies
+        side_effect=EntityTopologicalSorter.order_by_entities_dependencies_in_waves
     )
     async with event_context(EventType.RESYNC, trigger_type="machine") as event:
         app_config = (
@@ -400,23 +412,25 @@ async def test_sync_raw_mixin_dependency(
 
         event.entity_topological_sorter.register_entity = MagicMock(side_effect=mock_register_entity)  # type: ignore
         raiesed_error_handle_failed = []
-        org_event_get_entities = event.entity_topological_sorter.get_entities
+        org_event_get_entities_waves = (
+            event.entity_topological_sorter.get_entities_waves
+        )
 
-        def get_entities_wrapper(*args: Any, **kwargs: Any) -> Any:
+        def get_entities_waves_wrapper(*args: Any, **kwargs: Any) -> Any:
             try:
-                return org_event_get_entities(*args, **kwargs)
+                return org_event_get_entities_waves(*args, **kwargs)
             except Exception as e:
                 raiesed_error_handle_failed.append(e)
                 raise e
 
-        event.entity_topological_sorter.get_entities = MagicMock(side_effect=lambda *args, **kwargs: get_entities_wrapper(*args, **kwargs))  # type: ignore
+        event.entity_topological_sorter.get_entities_waves = MagicMock(side_effect=lambda *args, **kwargs: get_entities_waves_wrapper(*args, **kwargs))  # type: ignore
 
         with patch(
             "port_ocean.core.integrations.mixins.sync_raw.event_context",
             lambda *args, **kwargs: no_op_event_context(event),
         ):
             with patch(
-                "port_ocean.core.utils.entity_topological_sorter.EntityTopologicalSorter.order_by_entities_dependencies",
+                "port_ocean.core.utils.entity_topological_sorter.EntityTopologicalSorter.order_by_entities_dependencies_in_waves",
                 mock_order_by_entities_dependencies,
             ):
 
@@ -428,22 +442,33 @@ async def test_sync_raw_mixin_dependency(
                 assert (
                     len(event.entity_topological_sorter.entities) == 5
                 ), "Expected one failed entity callback due to retry logic"
-                assert event.entity_topological_sorter.get_entities.call_count == 1
+                assert (
+                    event.entity_topological_sorter.get_entities_waves.call_count == 1
+                )
                 assert len(raiesed_error_handle_failed) == 0
-                assert mock_ocean.port_client.client.post.call_count == 6  # type: ignore
+                # One bulk request for the resync and one per dependency wave of the retry
+                assert mock_ocean.port_client.client.post.call_count == 4  # type: ignore
                 assert mock_order_by_entities_dependencies.call_count == 1
 
                 result_bulk = mock_ocean.port_client.client.post.call_args_list[0]  # type: ignore
-                result_non_bulk = mock_ocean.port_client.client.post.call_args_list[1:6]  # type: ignore
+                result_waves = mock_ocean.port_client.client.post.call_args_list[1:4]  # type: ignore
 
                 assert "-".join(
                     [
                         entity.get("identifier")
-                        for entity in result_bulk[1].get("json").get("entities")
+                        for entity in json.loads(result_bulk[1]["content"])["entities"]
                     ]
                 ) == "-".join([entity.identifier for entity in entities])
+                assert [
+                    len(json.loads(call[1]["content"])["entities"])
+                    for call in result_waves
+                ] == [1, 2, 2]
                 assert "-".join(
-                    [call[1].get("json").get("identifier") for call in result_non_bulk]
+                    [
+                        entity.get("identifier")
+                        for call in result_waves
+                        for entity in json.loads(call[1]["content"])["entities"]
+                    ]
                 ) in (
                     "entity_3-entity_4-entity_1-entity_2-entity_5",
                     "entity_3-entity_4-entity_1-entity_5-entity_2",
@@ -496,6 +521,12 @@ async def test_sync_raw_mixin_dependency(
                             ]["object_count"]
                             == 5
                         )
+                        assert [
+                            metric["metrics"]["phase"]["load"]["wave"][wave][
+                                "object_count_type"
+                            ]["loaded"]["retry_wave_object_count"]
+                            for wave in ("0", "1", "2")
+                        ] == [1, 2, 2]
 
 
 @pytest.mark.asyncio
@@ -1081,3 +1112,171 @@ async def test_on_resync_start_hook_error_prevents_resync(
     assert (
         not resync_complete_called
     ), "on_resync_complete hook should not have been called after error"
+
+
+@pytest.mark.asyncio
+async def test_register_in_batches_pipeline_registers_all_batches(
+    mock_sync_raw_mixin_with_jq_processor: SyncRawMixin,
+    mock_port_app_config: PortAppConfig,
+    mock_ocean: Ocean,
+) -> None:
+    mock_ocean.config.resync_pipeline = ResyncPipelineSettings(
+        enabled=True, queue_max_size=1, transform_concurrency=2, load_concurrency=2
+    )
+    mock_ocean.config.send_raw_data_examples = False
+
+    async def raw_results_generator() -> AsyncGenerator[list[dict[str, Any]], None]:
+        for batch in range(5):
+            yield [
+                {"id": f"entity_{batch}_{i}", "name": "name", "web_url": "url"}
+                for i in range(3)
+            ]
+
+    async def failing_generator() -> AsyncGenerator[list[dict[str, Any]], None]:
+        yield [{"id": "entity_failing", "name": "name", "web_url": "url"}]
+        raise OceanAbortException("Failed to fetch")
+
+    mock_sync_raw_mixin_with_jq_processor._get_resource_raw_results = AsyncMock(return_value=([raw_results_generator(), failing_generator()], []))  # type: ignore
+    mock_sync_raw_mixin_with_jq_processor.entities_state_applier.upsert = AsyncMock(side_effect=lambda entities, _: entities)  # type: ignore
+
+    async with event_context(EventType.HTTP_REQUEST, trigger_type="machine") as event:
+        event.port_app_config = mock_port_app_config
+        async with resource_context(mock_port_app_config.resources[0], 0):
+            passed_entities, errors = (
+                await mock_sync_raw_mixin_with_jq_processor._register_in_batches(
+                    mock_port_app_config.resources[0], UserAgentType.exporter
+                )
+            )
+
+    assert len(passed_entities) == 16
+    assert {entity.identifier for entity in passed_entities} == {
+        f"entity_{batch}_{i}" for batch in range(5) for i in range(3)
+    } | {"entity_failing"}
+    assert len(errors) == 1
+    assert (
+        mock_sync_raw_mixin_with_jq_processor.entities_state_applier.upsert.call_count
+        == 6
+    )
+
+
+@pytest.mark.asyncio
+async def test_register_in_batches_pipeline_raises_on_stage_failure(
+    mock_sync_raw_mixin: SyncRawMixin,
+    mock_port_app_config: PortAppConfig,
+    mock_ocean: Ocean,
+) -> None:
+    mock_ocean.config.resync_pipeline = ResyncPipelineSettings(
+        enabled=True, queue_max_size=1
+    )
+    mock_ocean.config.send_raw_data_examples = False
+
+    async def endless_generator() -> AsyncGenerator[list[dict[str, Any]], None]:
+        while True:
+            yield [{"id": "entity"}]
+
+    mock_sync_raw_mixin._get_resource_raw_results = AsyncMock(return_value=([endless_generator()], []))  # type: ignore
+    mock_sync_raw_mixin._calculate_raw = AsyncMock(side_effect=Exception("Transform failed"))  # type: ignore
+
+    async with event_context(EventType.RESYNC, trigger_type="machine") as event:
+        event.port_app_config = mock_port_app_config
+        async with resource_context(mock_port_app_config.resources[0], 0):
+            with pytest.raises(Exception, match="Transform failed"):
+                await mock_sync_raw_mixin._register_in_batches(
+                    mock_port_app_config.resources[0], UserAgentType.exporter
+                )
+
+
+@pytest.mark.asyncio
+async def test_register_in_batches_iterates_the_resync_generators_concurrently(
+    mock_sync_raw_mixin_with_jq_processor: SyncRawMixin,
+    mock_port_app_config: PortAppConfig,
+    mock_ocean: Ocean,
+) -> None:
+    mock_ocean.config.max_concurrent_resync_generators = 3
+    mock_ocean.config.send_raw_data_examples = False
+    second_generator_started = asyncio.Event()
+
+    async def first_generator() -> AsyncGenerator[list[dict[str, Any]], None]:
+        # Only completes if the second generator runs while this one is still running
+        await second_generator_started.wait()
+        yield [{"id": "entity_first", "name": "name", "web_url": "url"}]
+
+    async def second_generator() -> AsyncGenerator[list[dict[str, Any]], None]:
+        second_generator_started.set()
+        yield [{"id": "entity_second", "name": "name", "web_url": "url"}]
+
+    async def failing_generator() -> AsyncGenerator[list[dict[str, Any]], None]:
+        raise OceanAbortException("Failed to fetch")
+        yield []
+
+    mock_sync_raw_mixin_with_jq_processor._get_resource_raw_results = AsyncMock(return_value=([first_generator(), failing_generator(), second_generator()], []))  # type: ignore
+    mock_sync_raw_mixin_with_jq_processor.entities_state_applier.upsert = AsyncMock(side_effect=lambda entities, _: entities)  # type: ignore
+
+    async with event_context(EventType.HTTP_REQUEST, trigger_type="machine") as event:
+        event.port_app_config = mock_port_app_config
+        async with resource_context(mock_port_app_config.resources[0], 0):
+            passed_entities, errors = await asyncio.wait_for(
+                mock_sync_raw_mixin_with_jq_processor._register_in_batches(
+                    mock_port_app_config.resources[0], UserAgentType.exporter
+                ),
+                timeout=5,
+            )
+
+    assert {entity.identifier for entity in passed_entities} == {
+        "entity_first",
+        "entity_second",
+    }
+    assert len(errors) == 1
+
+
+@pytest.mark.asyncio
+async def test_register_resource_raw_with_entity_fingerprints_skips_unchanged_entities(
+    mock_sync_raw_mixin: SyncRawMixin,
+    mock_port_app_config: PortAppConfig,
+    tmp_path: Any,
+) -> None:
+    entity = Entity(identifier="1", blueprint="service", properties={"url": "a"})
+    mock_sync_raw_mixin._calculate_raw = AsyncMock(return_value=[CalculationResult(entity_selector_diff=EntitySelectorDiff(passed=[entity], failed=[]), errors=[], misconfigurations=[], misonfigured_entity_keys=[])])  # type: ignore
+    mock_sync_raw_mixin._map_entities_compared_with_port = AsyncMock(side_effect=lambda entities, *_: entities)  # type: ignore
+    mock_sync_raw_mixin.entities_state_applier.upsert = AsyncMock(return_value=[entity])  # type: ignore
+    resource = mock_port_app_config.resources[0]
+
+    async with event_context(EventType.RESYNC, trigger_type="machine") as event:
+        event.port_app_config = mock_port_app_config
+        async with resource_context(resource, 0) as current_resource:
+            current_resource.entity_fingerprints = (
+                EntityFingerprintStore.load_for_resource(str(tmp_path), resource, 0, 60)
+            )
+            for _ in range(2):
+                result = await mock_sync_raw_mixin._register_resource_raw(
+                    resource, [{"some": "data"}], UserAgentType.exporter
+                )
+                assert len(result.entity_selector_diff.passed) == 1
+
+    assert mock_sync_raw_mixin.entities_state_applier.upsert.call_count == 1
+    assert (
+        mock_sync_raw_mixin._map_entities_compared_with_port.call_args_list[1].args[0]
+        == []
+    )
+
+
+@pytest.mark.asyncio
+async def test_sort_and_upsert_failed_entities_caps_wave_labels(
+    mock_sync_raw_mixin: SyncRawMixin,
+) -> None:
+    waves = [[create_entity(f"entity_{i}", "service", {}, False)] for i in range(12)]
+    mock_sync_raw_mixin._upsert_failed_entities_wave = AsyncMock()  # type: ignore
+
+    async with event_context(EventType.RESYNC, trigger_type="machine") as event:
+        event.entity_topological_sorter = MagicMock()
+        event.entity_topological_sorter.should_execute.return_value = True
+        event.entity_topological_sorter.get_entities_waves.return_value = waves
+
+        await mock_sync_raw_mixin.sort_and_upsert_failed_entities(
+            UserAgentType.exporter
+        )
+
+    assert [
+        call.args[1]
+        for call in mock_sync_raw_mixin._upsert_failed_entities_wave.call_args_list
+    ] == [str(i) for i in range(10)] + ["10+", "10+"]
@@ -0,0 +1,120 @@
+import asyncio
+import os
+from typing import Any, Generator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from port_ocean.config.settings import ResourceMemorySettings
+from port_ocean.core.integrations.mixins.memory_watchdog import (
+    SubprocessMemoryWatchdog,
+)
+from port_ocean.core.integrations.mixins.worker_pool import ProcessWorkerPool
+from port_ocean.utils.ipc import PipeIPC
+
+
+# The memory a worker keeps from its earlier tasks
+leaked: list[bytearray] = []
+
+
+async def handler(results: PipeIPC, value: str) -> None:
+    if value == "crash":
+        os._exit(1)
+    if value == "hang":
+        await asyncio.sleep(30)
+    if value == "grow":
+        allocated = bytearray(64 * 1024 * 1024)
+        await asyncio.sleep(30)
+        del allocated
+    if value == "leak":
+        leaked.append(bytearray(64 * 1024 * 1024))
+    if value == "slow":
+        await asyncio.sleep(0.2)
+    results.send("pid", os.getpid())
+    results.send("value", value)
+
+
+async def run_task(pool: ProcessWorkerPool, value: str) -> dict[str, Any]:
+    return {tag: message async for tag, message in pool.submit(value)}
+
+
+@pytest.fixture(autouse=True)
+def mock_ocean() -> Generator[None, None, None]:
+    with patch("port_ocean.core.integrations.mixins.utils.ocean", MagicMock()):
+        yield
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_reuses_workers_until_they_are_recycled() -> None:
+    pool = ProcessWorkerPool(handler, workers=1, max_tasks_per_worker=2)
+    pool.start()
+    try:
+        first = await run_task(pool, "a")
+        second = await run_task(pool, "b")
+        third = await run_task(pool, "c")
+    finally:
+        await pool.shutdown()
+
+    assert [first["value"], second["value"], third["value"]] == ["a", "b", "c"]
+    assert first["pid"] == second["pid"]
+    assert third["pid"] != first["pid"]
+    assert first["pid"] != os.getpid()
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_replaces_a_worker_that_exited_during_a_task() -> None:
+    pool = ProcessWorkerPool(handler, workers=1, max_tasks_per_worker=10)
+    pool.start()
+    try:
+        crashed = await run_task(pool, "crash")
+        after_crash = await run_task(pool, "a")
+    finally:
+        await pool.shutdown()
+
+    assert crashed == {}
+    assert after_crash["value"] == "a"
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_task_ends_when_the_watchdog_kills_the_worker() -> None:
+    pool = ProcessWorkerPool(handler, workers=1, max_tasks_per_worker=10)
+    watchdog = SubprocessMemoryWatchdog(
+        "service-0",
+        ResourceMemorySettings(max_rss_mb=32, sample_interval_seconds=0.01),
+    )
+    pool.start()
+    try:
+        killed = {
+            tag: message
+            async for tag, message in pool.submit("grow", watchdog=watchdog)
+        }
+        after_kill = await run_task(pool, "a")
+    finally:
+        await pool.shutdown()
+
+    assert killed == {}
+    assert watchdog.limit_exceeded
+    assert watchdog.peak_rss_bytes > 32 * 1024 * 1024
+    assert after_kill["value"] == "a"
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_watchdog_ignores_the_memory_of_earlier_tasks() -> None:
+    pool = ProcessWorkerPool(handler, workers=1, max_tasks_per_worker=10)
+    watchdog = SubprocessMemoryWatchdog(
+        "service-0",
+        ResourceMemorySettings(max_rss_mb=32, sample_interval_seconds=0.01),
+    )
+    pool.start()
+    try:
+        leaking = await run_task(pool, "leak")
+        slow = {
+            tag: message
+            async for tag, message in pool.submit("slow", watchdog=watchdog)
+        }
+    finally:
+        await pool.shutdown()
+
+    assert not watchdog.limit_exceeded
+    assert watchdog.peak_rss_bytes < 32 * 1024 * 1024
+    assert slow["pid"] == leaking["pid"]
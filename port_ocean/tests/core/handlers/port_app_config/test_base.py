@@ -1,7 +1,8 @@
+import asyncio
 import pytest
 from unittest.mock import MagicMock
 from pydantic import ValidationError
-from typing import Any, Dict
+from typing import Any, Dict, cast
 
 from port_ocean.context.ocean import PortOceanContext
 from port_ocean.core.handlers.port_app_config.base import BasePortAppConfig
@@ -277,3 +278,105 @@ async def test_get_port_app_config_fetch_error(
     async with event_context(EventType.RESYNC, trigger_type="machine"):
         with pytest.raises(EmptyPortAppConfigError, match="Port app config is empty"):
             await port_app_config_handler.get_port_app_config()
+
+
+@pytest.mark.asyncio
+async def test_get_port_app_config_warms_up_entity_processor_on_new_config(
+    port_app_config_handler: MockPortAppConfig, mock_context: PortOceanContext
+) -> None:
+    # Arrange
+    valid_config = {
+        "resources": [
+            {
+                "kind": "repository",
+                "selector": {"query": "true"},
+                "port": {
+                    "entity": {
+                        "mappings": {
+                            "identifier": ".name",
+                            "title": ".name",
+                            "blueprint": '"service"',
+                        }
+                    }
+                },
+            }
+        ]
+    }
+    port_app_config_handler.mock_get_port_app_config.return_value = valid_config
+    warm_up = cast(MagicMock, mock_context.integration.entity_processor.warm_up)
+
+    # Act
+    async with event_context(EventType.RESYNC, trigger_type="machine"):
+        result = await port_app_config_handler.get_port_app_config()
+        await port_app_config_handler.get_port_app_config()
+        warm_up.side_effect = Exception("failed to compile")
+        await port_app_config_handler.get_port_app_config(use_cache=False)
+
+    # Assert
+    assert warm_up.call_count == 2
+    warm_up.assert_any_call(result)
+
+
+@pytest.mark.asyncio
+async def test_get_port_app_config_fetches_again_past_max_age(
+    port_app_config_handler: MockPortAppConfig,
+    mock_context: PortOceanContext,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Arrange
+    now = 1000.0
+    monkeypatch.setattr(
+        "port_ocean.core.handlers.port_app_config.base.get_time",
+        lambda seconds_precision=True: now,
+    )
+    port_app_config_handler.mock_get_port_app_config.return_value = {"resources": []}
+
+    # Act
+    async with event_context(EventType.HTTP_REQUEST, trigger_type="machine"):
+        await port_app_config_handler.get_port_app_config(max_age_seconds=10)
+        now += 5
+        await port_app_config_handler.get_port_app_config(max_age_seconds=10)
+        fetches_within_max_age = (
+            port_app_config_handler.mock_get_port_app_config.call_count
+        )
+        now += 5
+        await port_app_config_handler.get_port_app_config(max_age_seconds=10)
+        await port_app_config_handler.get_port_app_config(max_age_seconds=0)
+
+    # Assert
+    assert fetches_within_max_age == 1
+    assert port_app_config_handler.mock_get_port_app_config.call_count == 3
+    cast(MagicMock, mock_context.metrics.set_metric).assert_called_with(
+        name="port_app_config_fetch_duration_seconds",
+        labels=[mock_context.metrics.current_resource_kind()],
+        value=pytest.approx(0, abs=1),
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_port_app_config_concurrent_calls_share_a_fetch(
+    port_app_config_handler: MockPortAppConfig,
+) -> None:
+    # Arrange
+    fetches = 0
+
+    async def get_port_app_config() -> Dict[str, Any]:
+        nonlocal fetches
+        fetches += 1
+        await asyncio.sleep(0.01)
+        return {"resources": []}
+
+    port_app_config_handler._get_port_app_config = get_port_app_config  # type: ignore
+
+    # Act
+    async with event_context(EventType.HTTP_REQUEST, trigger_type="machine"):
+        results = await asyncio.gather(
+            *(
+                port_app_config_handler.get_port_app_config(use_cache=False)
+                for _ in range(5)
+            )
+        )
+
+    # Assert
+    assert fetches == 2
+    assert all(result is results[-1] for result in results[1:])
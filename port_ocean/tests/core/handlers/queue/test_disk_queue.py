@@ -0,0 +1,117 @@
+import asyncio
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from port_ocean.core.handlers.queue.disk_queue import SEGMENT_SUFFIX, DiskQueue
+from port_ocean.exceptions.core import QueueFullException
+
+
+def _open_queue(directory: Path, **kwargs: Any) -> DiskQueue[dict[str, Any]]:
+    return DiskQueue(
+        directory,
+        serialize=lambda item: json.dumps(item).encode(),
+        deserialize=json.loads,
+        **kwargs,
+    )
+
+
+def _segments(directory: Path) -> list[Path]:
+    return sorted(directory.glob(f"*{SEGMENT_SUFFIX}"))
+
+
+class TestDiskQueue:
+    async def test_fifo_order_across_segments(self, tmp_path: Path) -> None:
+        queue = _open_queue(tmp_path, segment_max_bytes=50)
+
+        for i in range(5):
+            await queue.put({"id": i})
+
+        assert len(_segments(tmp_path)) > 1
+        assert [(await queue.get())["id"] for _ in range(5)] == list(range(5))
+
+    async def test_uncommitted_items_replayed_after_reopen(
+        self, tmp_path: Path
+    ) -> None:
+        queue = _open_queue(tmp_path, checkpoint_interval=2)
+        for i in range(5):
+            await queue.put({"id": i})
+        for _ in range(3):
+            await queue.get()
+            await queue.commit()
+        # Got and not committed, so it is replayed as well
+        await queue.get()
+
+        # The third commit wasn't checkpointed yet, so its item is replayed too
+        reopened_queue = _open_queue(tmp_path)
+        assert reopened_queue.depth == 3
+        assert [(await reopened_queue.get())["id"] for _ in range(3)] == [2, 3, 4]
+
+    async def test_partly_written_record_truncated_on_reopen(
+        self, tmp_path: Path
+    ) -> None:
+        queue = _open_queue(tmp_path)
+        await queue.put({"id": 1})
+        with open(_segments(tmp_path)[-1], "ab") as f:
+            f.write(b"\x10\x00\x00")
+
+        reopened_queue = _open_queue(tmp_path)
+        await reopened_queue.put({"id": 2})
+
+        assert reopened_queue.depth == 2
+        assert [(await reopened_queue.get())["id"] for _ in range(2)] == [1, 2]
+
+    async def test_committed_segments_deleted(self, tmp_path: Path) -> None:
+        queue = _open_queue(tmp_path, segment_max_bytes=50)
+        for i in range(5):
+            await queue.put({"id": i})
+
+        for _ in range(5):
+            await queue.get()
+            await queue.commit()
+
+        assert queue.depth == 0
+        assert len(_segments(tmp_path)) == 1
+        await queue.put({"id": 5})
+        assert (await queue.get())["id"] == 5
+
+    async def test_put_raises_when_full(self, tmp_path: Path) -> None:
+        queue = _open_queue(tmp_path, max_size=2)
+        await queue.put({"id": 1})
+        await queue.put({"id": 2})
+
+        with pytest.raises(QueueFullException):
+            await queue.put({"id": 3})
+
+        await queue.get()
+        await queue.commit()
+        await queue.put({"id": 3})
+        assert queue.depth == 2
+
+    async def test_cancelled_get_loses_no_item(self, tmp_path: Path) -> None:
+        queue = _open_queue(tmp_path)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(queue.get(), timeout=0.05)
+        await queue.put({"id": 1})
+
+        assert (await asyncio.wait_for(queue.get(), timeout=1))["id"] == 1
+
+    async def test_teardown_waits_for_commits_and_checkpoints(
+        self, tmp_path: Path
+    ) -> None:
+        queue = _open_queue(tmp_path, checkpoint_interval=100)
+        await queue.put({"id": 1})
+        await queue.put({"id": 2})
+
+        async def process() -> None:
+            await queue.get()
+            await queue.commit()
+            await queue.get()
+            await queue.commit()
+
+        await asyncio.gather(queue.teardown(), process())
+
+        assert _open_queue(tmp_path).depth == 0
@@ -3,6 +3,7 @@ import pytest
 from dataclasses import dataclass
 
 from port_ocean.core.handlers.queue.local_queue import LocalQueue
+from port_ocean.exceptions.core import QueueFullException
 
 
 @dataclass
@@ -88,3 +89,16 @@ class TestLocalQueue:
         await processor
 
         assert processed_count == message_count
+
+    async def test_put_raises_when_full(self) -> None:
+        """Test that uncommitted items count towards the max size"""
+        queue = LocalQueue[MockMessage](max_size=1)
+        await queue.put(MockMessage(id="1", data="first"))
+        await queue.get()
+
+        with pytest.raises(QueueFullException):
+            await queue.put(MockMessage(id="2", data="second"))
+
+        await queue.commit()
+        await queue.put(MockMessage(id="2", data="second"))
+        assert queue.depth == 1
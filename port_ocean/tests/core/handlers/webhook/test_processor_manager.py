@@ -1,3 +1,5 @@
+import json
+from pathlib import Path
 import pytest
 from port_ocean.core.handlers.webhook.processor_manager import (
     LiveEventsProcessorManager,
@@ -39,6 +41,7 @@ from port_ocean.core.integrations.mixins.live_events import LiveEventsMixin
 from port_ocean.core.models import Entity
 from port_ocean.exceptions.webhook_processor import RetryableError
 from port_ocean.core.handlers.queue import LocalQueue
+from port_ocean.config.settings import LiveEventsBatchSettings, LiveEventsQueueSettings
 
 
 class MockProcessor(AbstractWebhookProcessor):
@@ -246,7 +249,11 @@ def mock_http_client() -> MagicMock:
     mock_upserted_entities = []
 
     async def post(url: str, *args: Any, **kwargs: Any) -> Response:
-        entity = kwargs.get("json", {})
+        entity = (
+            json.loads(kwargs["content"])
+            if "content" in kwargs
+            else kwargs.get("json", {})
+        )
         if entity.get("properties", {}).get("mock_is_to_fail", {}):
             return Response(
                 404, headers=MagicMock(), json={"ok": False, "error": "not_found"}
@@ -296,7 +303,10 @@ def mock_ocean(mock_port_client: PortClient) -> Ocean:
         ocean_mock.config = MagicMock()
         ocean_mock.config.port = MagicMock()
         ocean_mock.config.port.port_app_config_cache_ttl = 60
+        ocean_mock.config.jq_batch_evaluation = False
+        ocean_mock.config.jq_transform_workers = 0
         ocean_mock.port_client = mock_port_client
+        ocean_mock.metrics = MagicMock()
         ocean_mock.integration_router = APIRouter()
         ocean_mock.fast_api_app = FastAPI()
         return ocean_mock
@@ -436,6 +446,244 @@ def test_registerProcessor_invalidHandlerRegistration_throwsError(
         processor_manager.register_processor("/test", object)  # type: ignore
 
 
+@pytest.mark.asyncio
+async def test_processQueue_multipleWorkers_sameKeyInOrderOtherKeysInParallel(
+    mock_context: PortOceanContext,
+) -> None:
+    class KeyedProcessor(MockProcessor):
+        async def get_ordering_key(self, event: WebhookEvent) -> str | None:
+            return event.payload["key"]
+
+    manager = LiveEventsProcessorManager(
+        APIRouter(), SignalHandler(), 3, 3, event_workers_count=4
+    )
+    manager.register_processor("/test", KeyedProcessor)
+    mock_context.app.integration = MagicMock()
+    mock_context.app.integration.port_app_config_handler.get_port_app_config = (
+        AsyncMock()
+    )
+    other_key = next(
+        key
+        for key in "bcdefgh"
+        if manager._get_partition_index(key) != manager._get_partition_index("a")
+    )
+
+    started: list[str] = []
+    release_first = asyncio.Event()
+    all_started = asyncio.Event()
+
+    async def extract_matching_processors(
+        webhook_event: WebhookEvent, path: str
+    ) -> list[tuple[ResourceConfig, AbstractWebhookProcessor]]:
+        started.append(webhook_event.payload["id"])
+        if len(started) == 3:
+            all_started.set()
+        if webhook_event.payload["id"] == "first":
+            await release_first.wait()
+        return []
+
+    manager._extract_matching_processors = extract_matching_processors  # type: ignore
+    for event_id, key in [("first", "a"), ("second", "a"), ("other", other_key)]:
+        await manager._event_queues["/test"].put(
+            WebhookEvent(
+                trace_id=event_id, payload={"id": event_id, "key": key}, headers={}
+            )
+        )
+
+    task = asyncio.create_task(manager.process_queue("/test"))
+    try:
+        await asyncio.sleep(0.1)
+        # The event of the other key isn't blocked by the first event, the event of the same key waits for it
+        assert sorted(started) == ["first", "other"]
+
+        release_first.set()
+        await asyncio.wait_for(all_started.wait(), timeout=5)
+        assert started[-1] == "second"
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_processQueue_multipleWorkers_busyWorkerLeavesEventsInPathQueue(
+    mock_context: PortOceanContext,
+) -> None:
+    class KeyedProcessor(MockProcessor):
+        async def get_ordering_key(self, event: WebhookEvent) -> str | None:
+            return "a"
+
+    manager = LiveEventsProcessorManager(
+        APIRouter(), SignalHandler(), 3, 3, event_workers_count=2
+    )
+    manager.register_processor("/test", KeyedProcessor)
+    mock_context.app.integration = MagicMock()
+    mock_context.app.integration.port_app_config_handler.get_port_app_config = (
+        AsyncMock()
+    )
+    release = asyncio.Event()
+
+    async def extract_matching_processors(
+        webhook_event: WebhookEvent, path: str
+    ) -> list[tuple[ResourceConfig, AbstractWebhookProcessor]]:
+        await release.wait()
+        return []
+
+    manager._extract_matching_processors = extract_matching_processors  # type: ignore
+    path_queue = manager._event_queues["/test"]
+    assert isinstance(path_queue, LocalQueue)
+    for event_id in ["first", "second", "third", "fourth"]:
+        await path_queue.put(
+            WebhookEvent(trace_id=event_id, payload={"id": event_id}, headers={})
+        )
+
+    task = asyncio.create_task(manager.process_queue("/test"))
+    try:
+        await asyncio.sleep(0.1)
+        # The worker holds the first event and the next one, the others wait in the queue of the path
+        assert path_queue._queue.qsize() == 1
+
+        release.set()
+        await asyncio.wait_for(path_queue.teardown(), timeout=5)
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_processQueue_eventsBatch_eventsArrivingTogetherExportedOnce(
+    mock_context: PortOceanContext,
+) -> None:
+    manager = LiveEventsProcessorManager(
+        APIRouter(),
+        SignalHandler(),
+        3,
+        3,
+        events_batch=LiveEventsBatchSettings(max_size=3, max_wait_seconds=5),
+    )
+    manager.register_processor("/test", MockProcessor)
+    mock_context.app.integration = MagicMock()
+    get_port_app_config = AsyncMock()
+    mock_context.app.integration.port_app_config_handler.get_port_app_config = (
+        get_port_app_config
+    )
+    exported = asyncio.Event()
+
+    async def process_webhook_event(
+        webhook_event: WebhookEvent,
+        path: str,
+        processors: list[AbstractWebhookProcessor],
+    ) -> list[Any]:
+        if webhook_event.trace_id == "failing":
+            raise ValueError("Failed to process the event")
+        return [webhook_event.trace_id]
+
+    async def sync_events_raw_results(events_raw_results: list[list[Any]]) -> None:
+        exported.set()
+
+    manager._process_webhook_event = process_webhook_event  # type: ignore
+    manager.sync_events_raw_results = AsyncMock(side_effect=sync_events_raw_results)  # type: ignore
+    for trace_id in ["first", "failing", "last"]:
+        await manager._event_queues["/test"].put(
+            WebhookEvent(trace_id=trace_id, payload={}, headers={})
+        )
+
+    task = asyncio.create_task(manager.process_queue("/test"))
+    try:
+        await asyncio.wait_for(exported.wait(), timeout=5)
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    # A failing event of the batch doesn't fail the other events
+    manager.sync_events_raw_results.assert_called_once_with([["first"], ["last"]])
+    get_port_app_config.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_handleWebhook_durableQueueFull_eventRejectedWith429(
+    mock_context: PortOceanContext, tmp_path: Path
+) -> None:
+    router = APIRouter()
+    manager = LiveEventsProcessorManager(
+        router,
+        SignalHandler(),
+        3,
+        3,
+        events_queue=LiveEventsQueueSettings(
+            durable=True, directory=str(tmp_path), max_size=1
+        ),
+    )
+    manager.register_processor("/test", MockProcessor)
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+
+    accepted = client.post("/test", json={"id": "first"})
+    rejected = client.post("/test", json={"id": "second"})
+
+    assert accepted.status_code == 200
+    assert rejected.status_code == 429
+    assert rejected.headers["Retry-After"]
+    # The accepted event is kept on disk and replayed by a queue opened on the same directory
+    replayed_event = await manager._create_queue("/test").get()
+    assert replayed_event.payload == {"id": "first"}
+
+
+@pytest.mark.asyncio
+async def test_processQueue_durableQueueCancelledMidEvent_eventReplayed(
+    mock_context: PortOceanContext, tmp_path: Path
+) -> None:
+    manager = LiveEventsProcessorManager(
+        APIRouter(),
+        SignalHandler(),
+        3,
+        3,
+        events_queue=LiveEventsQueueSettings(durable=True, directory=str(tmp_path)),
+    )
+    manager.register_processor("/test", MockProcessor)
+    mock_context.app.integration = MagicMock()
+    mock_context.app.integration.port_app_config_handler.get_port_app_config = (
+        AsyncMock()
+    )
+    started = asyncio.Event()
+
+    async def extract_matching_processors(
+        webhook_event: WebhookEvent, path: str
+    ) -> list[tuple[ResourceConfig, AbstractWebhookProcessor]]:
+        started.set()
+        await asyncio.sleep(30)
+        return []
+
+    manager._extract_matching_processors = extract_matching_processors  # type: ignore
+    await manager._event_queues["/test"].put(
+        WebhookEvent(trace_id="first", payload={"id": "first"}, headers={})
+    )
+
+    task = asyncio.create_task(manager.process_queue("/test"))
+    await asyncio.wait_for(started.wait(), timeout=5)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    # The teardown on shutdown times out waiting for the event and checkpoints the queue
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(manager._event_queues["/test"].teardown(), timeout=0.1)
+
+    # The event that was being processed wasn't committed, so a reopened queue replays it
+    replayed_event = await manager._create_queue("/test").get()
+    assert replayed_event.payload == {"id": "first"}
+
+
+def test_init_durableQueueWithMultipleWorkers_throwsError(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        LiveEventsProcessorManager(
+            APIRouter(),
+            SignalHandler(),
+            3,
+            3,
+            event_workers_count=2,
+            events_queue=LiveEventsQueueSettings(durable=True, directory=str(tmp_path)),
+        )
+
+
 @pytest.mark.asyncio
 async def test_processWebhookRequest_successfulProcessing(
     processor: MockWebhookHandlerForProcessWebhookRequest,
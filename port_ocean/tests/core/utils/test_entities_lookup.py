@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+
+from port_ocean.core.models import Entity
+from port_ocean.core.utils.entities_lookup import (
+    PortEntitiesLookup,
+    split_entities_to_lookup_batches,
+)
+
+
+def create_entities(count: int, prefix: str = "entity") -> list[Entity]:
+    return [
+        Entity(identifier=f"{prefix}_{index}", blueprint="service")
+        for index in range(count)
+    ]
+
+
+def test_split_entities_to_lookup_batches_by_size_and_identifiers_length() -> None:
+    assert [
+        len(batch) for batch in split_entities_to_lookup_batches(create_entities(120))
+    ] == [50, 50, 20]
+    assert [
+        len(batch)
+        for batch in split_entities_to_lookup_batches(
+            create_entities(10, "x" * 100), max_identifiers_length=350
+        )
+    ] == [3, 3, 3, 1]
+
+
+@pytest.mark.asyncio
+async def test_fetch_searches_batches_concurrently() -> None:
+    lookup = PortEntitiesLookup()
+    running = 0
+    max_running = 0
+
+    async def search_batch(batch: list[Entity]) -> list[Entity]:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return batch[:1]
+
+    found = await lookup.fetch(create_entities(150), ("service", ()), search_batch)
+
+    assert max_running == 3
+    assert [entity.identifier for entity in found] == [
+        "entity_0",
+        "entity_50",
+        "entity_100",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_fetch_coalesces_in_flight_identifiers() -> None:
+    lookup = PortEntitiesLookup()
+    searched: list[str] = []
+
+    async def search_batch(batch: list[Entity]) -> list[Entity]:
+        searched.extend(str(entity.identifier) for entity in batch)
+        await asyncio.sleep(0.01)
+        return batch
+
+    first, second = await asyncio.gather(
+        lookup.fetch(create_entities(3), ("service", ()), search_batch),
+        lookup.fetch(create_entities(4), ("service", ()), search_batch),
+    )
+
+    assert searched == ["entity_0", "entity_1", "entity_2", "entity_3"]
+    assert len(first) == 3
+    assert sorted(str(entity.identifier) for entity in second) == [
+        "entity_0",
+        "entity_1",
+        "entity_2",
+        "entity_3",
+    ]
+    assert not lookup._in_flight
+
+
+@pytest.mark.asyncio
+async def test_fetch_propagates_search_failure_to_coalesced_lookups() -> None:
+    lookup = PortEntitiesLookup()
+
+    async def search_batch(batch: list[Entity]) -> list[Entity]:
+        await asyncio.sleep(0.01)
+        raise ValueError("search failed")
+
+    results = await asyncio.gather(
+        lookup.fetch(create_entities(2), ("service", ()), search_batch),
+        lookup.fetch(create_entities(2), ("service", ()), search_batch),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert not lookup._in_flight
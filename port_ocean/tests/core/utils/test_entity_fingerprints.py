@@ -0,0 +1,122 @@
+from pathlib import Path
+
+from port_ocean.core.handlers.port_app_config.models import (
+    EntityMapping,
+    MappingsConfig,
+    PortResourceConfig,
+    ResourceConfig,
+    Selector,
+)
+from port_ocean.core.models import Entity
+from port_ocean.core.utils.entity_fingerprints import EntityFingerprintStore
+from port_ocean.core.utils.entity_keys import EntityKey
+
+
+def create_resource(identifier: str = ".id") -> ResourceConfig:
+    return ResourceConfig(
+        kind="service",
+        selector=Selector(query="true"),
+        port=PortResourceConfig(
+            entity=MappingsConfig(
+                mappings=EntityMapping(
+                    identifier=identifier,
+                    title=".name",
+                    blueprint='"service"',
+                    properties={"url": ".url"},
+                    relations={},
+                )
+            )
+        ),
+    )
+
+
+def create_entity(identifier: str, url: str = "https://a") -> Entity:
+    return Entity(identifier=identifier, blueprint="service", properties={"url": url})
+
+
+def test_split_unchanged_by_stored_fingerprints(tmp_path: Path) -> None:
+    store = EntityFingerprintStore.load_for_resource(
+        str(tmp_path), create_resource(), 0, 60
+    )
+    store.update([create_entity("a"), create_entity("b")])
+
+    changed, unchanged = store.split_unchanged(
+        [create_entity("a"), create_entity("b", "https://changed"), create_entity("c")]
+    )
+
+    assert [entity.identifier for entity in changed] == ["b", "c"]
+    assert [entity.identifier for entity in unchanged] == ["a"]
+
+
+def test_split_unchanged_ignores_expired_and_search_entities(tmp_path: Path) -> None:
+    store = EntityFingerprintStore.load_for_resource(
+        str(tmp_path), create_resource(), 0, 0
+    )
+    search_entity = Entity(
+        identifier={"combinator": "and", "rules": []}, blueprint="service"
+    )
+    store.update([create_entity("a"), search_entity])
+
+    changed, unchanged = store.split_unchanged([create_entity("a"), search_entity])
+
+    assert len(changed) == 2
+    assert not unchanged
+    assert len(store) == 1
+
+
+def test_fingerprints_persist_until_mapping_changes(tmp_path: Path) -> None:
+    store = EntityFingerprintStore.load_for_resource(
+        str(tmp_path), create_resource(), 0, 60
+    )
+    store.update([create_entity("a")])
+    store.save()
+
+    assert (
+        len(
+            EntityFingerprintStore.load_for_resource(
+                str(tmp_path), create_resource(), 0, 60
+            )
+        )
+        == 1
+    )
+    assert (
+        len(
+            EntityFingerprintStore.load_for_resource(
+                str(tmp_path), create_resource(".name"), 0, 60
+            )
+        )
+        == 0
+    )
+
+
+def test_update_from_sync_discards_entities_that_failed_to_upsert(
+    tmp_path: Path,
+) -> None:
+    store = EntityFingerprintStore.load_for_resource(
+        str(tmp_path), create_resource(), 0, 60
+    )
+    store.update([create_entity("failed")])
+    compared = [
+        create_entity("equal"),
+        create_entity("upserted"),
+        create_entity("failed"),
+    ]
+
+    store.update_from_sync(compared, compared[1:], [create_entity("upserted")])
+
+    _, unchanged = store.split_unchanged(compared)
+    assert [entity.identifier for entity in unchanged] == ["equal", "upserted"]
+
+
+def test_retain_existing_drops_entities_missing_in_port(tmp_path: Path) -> None:
+    store = EntityFingerprintStore.load_for_resource(
+        str(tmp_path), create_resource(), 0, 60
+    )
+    store.update([create_entity("a"), create_entity("deleted")])
+    store.save()
+
+    EntityFingerprintStore.retain_existing(str(tmp_path), {EntityKey("service", "a")})
+
+    store.load()
+    _, unchanged = store.split_unchanged([create_entity("a"), create_entity("deleted")])
+    assert [entity.identifier for entity in unchanged] == ["a"]
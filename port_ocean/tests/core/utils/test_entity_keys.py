@@ -0,0 +1,68 @@
+from port_ocean.core.models import Entity
+from port_ocean.core.utils.entity_keys import (
+    EntityKey,
+    get_comparable_entity_key,
+    get_entities_keys,
+    get_entity_key,
+    index_entities_by_key,
+    make_entity_key,
+)
+
+
+def test_entity_key_is_compact_and_compares_as_tuple() -> None:
+    key = get_entity_key(Entity(identifier="a", blueprint="service"))
+
+    assert key == ("service", "a")
+    assert key == EntityKey(blueprint="service", identifier="a")
+    assert not hasattr(key, "__dict__")
+
+
+def test_make_entity_key_interns_blueprint() -> None:
+    blueprint = "".join(["ser", "vice"])
+
+    assert (
+        make_entity_key(blueprint, "a").blueprint
+        is make_entity_key("service", "b").blueprint
+    )
+
+
+def test_make_entity_key_keeps_non_str_blueprint() -> None:
+    assert make_entity_key(None, "a") == (None, "a")
+    assert make_entity_key(1, "a") == (1, "a")
+    assert get_entity_key(Entity.construct(identifier="a", blueprint=None)) == (
+        None,
+        "a",
+    )
+
+
+def test_entity_key_to_entity() -> None:
+    entity = EntityKey(blueprint="service", identifier="a").to_entity()
+
+    assert (entity.blueprint, entity.identifier) == ("service", "a")
+
+
+def test_index_entities_by_key_keeps_last_entity() -> None:
+    first = Entity(identifier="a", blueprint="service", title="first")
+    second = Entity(identifier="a", blueprint="service", title="second")
+    other = Entity(identifier="a", blueprint="team")
+
+    index = index_entities_by_key([first, other, second])
+
+    assert list(index) == [("service", "a"), ("team", "a")]
+    assert index[EntityKey("service", "a")] is second
+    assert get_entities_keys([first, other, second]) == {
+        ("service", "a"),
+        ("team", "a"),
+    }
+
+
+def test_get_comparable_entity_key_of_search_identifier() -> None:
+    search = {"combinator": "and", "rules": [{"property": "a", "value": 1}]}
+    entity = Entity(identifier=search, blueprint="service")
+    same_search = Entity(identifier={**search}, blueprint="service")
+
+    assert get_comparable_entity_key(entity) == get_comparable_entity_key(same_search)
+    assert get_comparable_entity_key(Entity(identifier="a", blueprint="service")) == (
+        "service",
+        "a",
+    )
@@ -0,0 +1,61 @@
+import json
+import pickle
+
+from port_ocean.core.models import Entity
+from port_ocean.core.utils.entity_fingerprints import get_entity_fingerprint
+from port_ocean.core.utils.entity_serialization import (
+    dumps,
+    pack_entity,
+    serialize_entity,
+    unpack_entity,
+)
+
+
+def test_dumps_is_compact_and_sorts_keys_on_demand() -> None:
+    value = {"b": 1, "a": [1, {"d": None, "c": "x"}]}
+
+    assert json.loads(dumps(value)) == value
+    assert dumps(value, sort_keys=True) == b'{"a":[1,{"c":"x","d":null}],"b":1}'
+
+
+def test_serialize_entity_reflects_in_place_mutations_and_copies() -> None:
+    entity = Entity(identifier="a", blueprint="service", properties={"x": 1})
+
+    assert json.loads(serialize_entity(entity)) == {
+        "identifier": "a",
+        "blueprint": "service",
+        "properties": {"x": 1},
+    }
+
+    entity.properties["x"] = 2
+    assert json.loads(serialize_entity(entity))["properties"] == {"x": 2}
+
+    copied_entity = entity.copy(update={"properties": {"x": 3}})
+    assert json.loads(serialize_entity(copied_entity))["properties"] == {"x": 3}
+    assert json.loads(serialize_entity(entity))["properties"] == {"x": 2}
+
+
+def test_entity_fingerprint_reflects_in_place_mutations_and_copies() -> None:
+    entity = Entity(identifier="a", blueprint="service", title="A", properties={})
+    fingerprint = get_entity_fingerprint(entity)
+
+    assert get_entity_fingerprint(entity.copy()) == fingerprint
+    assert get_entity_fingerprint(entity.copy(update={"title": "B"})) != fingerprint
+
+    entity.properties["x"] = 1
+    assert get_entity_fingerprint(entity) != fingerprint
+
+
+def test_pack_entity_keeps_only_the_set_fields() -> None:
+    entity = Entity(identifier="a", blueprint="service", relations={"team": "b"})
+
+    packed = pack_entity(entity)
+    unpacked = unpack_entity(pickle.loads(pickle.dumps(packed)))
+
+    assert packed == {
+        "identifier": "a",
+        "blueprint": "service",
+        "relations": {"team": "b"},
+    }
+    assert unpacked == entity
+    assert unpacked.dict(exclude_unset=True) == entity.dict(exclude_unset=True)
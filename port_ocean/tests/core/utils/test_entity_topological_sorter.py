@@ -1,3 +1,8 @@
+import time
+from typing import Any
+
+import pytest
+
 from port_ocean.core.models import Entity
 from port_ocean.core.utils.entity_topological_sorter import EntityTopologicalSorter
 from unittest.mock import MagicMock
@@ -7,7 +12,7 @@ from port_ocean.exceptions.core import (
 
 
 def create_entity(
-    identifier: str, buleprint: str, dependencies: dict[str, str] = {}
+    identifier: str, buleprint: str, dependencies: dict[str, Any] = {}
 ) -> Entity:
     entity = MagicMock()
     entity.identifier = identifier
@@ -97,3 +102,55 @@ def test_handle_failed_with_circular_dependencies() -> None:
             e.args[0]
             == "Cannot order entities due to cyclic dependencies. \nIf you do want to have cyclic dependencies, please make sure to set the keys 'createMissingRelatedEntities' and 'deleteDependentEntities' in the integration config in Port."
         )
+
+
+def test_get_entities_waves() -> None:
+    entity_a = create_entity("entity_a", "buleprint_a")
+    entity_b = create_entity("entity_b", "buleprint_a")
+    entity_c = create_entity("entity_c", "buleprint_b", {"dep_name_1": "entity_a"})
+    entity_d = create_entity(
+        "entity_d", "buleprint_b", {"dep_name_1": ["entity_b", "entity_c"]}
+    )
+
+    entity_topological_sort = EntityTopologicalSorter()
+    for entity in [entity_d, entity_c, entity_b, entity_a]:
+        entity_topological_sort.register_entity(entity)
+
+    waves = [
+        sorted(entity.identifier for entity in wave)
+        for wave in entity_topological_sort.get_entities_waves()
+    ]
+    assert waves == [["entity_a", "entity_b"], ["entity_c"], ["entity_d"]]
+
+
+def test_get_entities_waves_with_circular_dependencies() -> None:
+    entity_topological_sort = EntityTopologicalSorter()
+    entity_topological_sort.register_entity(
+        create_entity("entity_a", "buleprint_a", {"dep_name_1": "entity_b"})
+    )
+    entity_topological_sort.register_entity(
+        create_entity("entity_b", "buleprint_a", {"dep_name_1": "entity_a"})
+    )
+
+    with pytest.raises(OceanAbortException):
+        entity_topological_sort.get_entities_waves()
+
+
+def test_order_by_entities_dependencies_benchmark() -> None:
+    # Every entity depends on its parent in a binary tree, so the 100k entities are ordered in 17 waves
+    entities = [
+        Entity(
+            identifier=f"entity_{i}",
+            blueprint=f"blueprint_{i % 10}",
+            relations={"parent": f"entity_{(i - 1) // 2}"} if i else {},
+        )
+        for i in range(100_000)
+    ]
+
+    start = time.monotonic()
+    waves = EntityTopologicalSorter.order_by_entities_dependencies_in_waves(entities)
+    duration = time.monotonic() - start
+
+    assert len(waves) == 17
+    assert sum(len(wave) for wave in waves) == len(entities)
+    assert duration < 30, f"Ordering 100k entities took {duration:.2f}s"
@@ -0,0 +1,145 @@
+import asyncio
+
+import pytest
+
+from port_ocean.core.handlers.port_app_config.models import (
+    EntityMapping,
+    MappingsConfig,
+    PortResourceConfig,
+    ResourceConfig,
+    Selector,
+)
+from port_ocean.core.utils.resources_scheduler import (
+    ResourcesScheduler,
+    get_resource_static_blueprint,
+)
+
+
+def create_resource(kind: str, blueprint: str) -> ResourceConfig:
+    return ResourceConfig(
+        kind=kind,
+        selector=Selector(query="true"),
+        port=PortResourceConfig(
+            entity=MappingsConfig(
+                mappings=EntityMapping(
+                    identifier=".id",
+                    title=".name",
+                    blueprint=blueprint,
+                    properties={},
+                    relations={},
+                )
+            )
+        ),
+    )
+
+
+def test_get_resource_static_blueprint() -> None:
+    assert get_resource_static_blueprint(create_resource("a", '"service"')) == "service"
+    assert get_resource_static_blueprint(create_resource("a", ".blueprint")) is None
+
+
+def test_build_dependencies_by_relations_and_same_blueprint() -> None:
+    resources = [
+        create_resource("service", '"service"'),
+        create_resource("team", '"team"'),
+        create_resource("other-service", '"service"'),
+        create_resource("dynamic", ".blueprint"),
+    ]
+    scheduler = ResourcesScheduler(resources, 5, {"service": {"team", "service"}})
+
+    assert scheduler.build_dependencies() == {
+        0: {1},
+        1: set(),
+        2: {0, 1},
+        3: set(),
+    }
+
+
+def test_build_dependencies_with_cyclic_relations_keeps_same_blueprint_order() -> None:
+    resources = [
+        create_resource("service", '"service"'),
+        create_resource("team", '"team"'),
+        create_resource("other-service", '"service"'),
+    ]
+    scheduler = ResourcesScheduler(
+        resources, 5, {"service": {"team"}, "team": {"service"}}
+    )
+
+    assert scheduler.build_dependencies() == {0: set(), 1: set(), 2: {0}}
+
+
+@pytest.mark.asyncio
+async def test_run_respects_dependencies_and_concurrency_limit() -> None:
+    resources = [
+        create_resource("service", '"service"'),
+        create_resource("team", '"team"'),
+        create_resource("repo", '"repo"'),
+        create_resource("user", '"user"'),
+    ]
+    scheduler = ResourcesScheduler(resources, 2, {"service": {"team"}})
+    running = 0
+    max_running = 0
+    finished: list[str] = []
+
+    async def process(resource: ResourceConfig, index: int) -> str:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        finished.append(resource.kind)
+        return f"{resource.kind}-{index}"
+
+    results = await scheduler.run(process)
+
+    assert results == ["service-0", "team-1", "repo-2", "user-3"]
+    assert max_running == 2
+    assert finished.index("team") < finished.index("service")
+
+
+@pytest.mark.asyncio
+async def test_run_cancels_running_resources_on_failure() -> None:
+    resources = [
+        create_resource("service", '"service"'),
+        create_resource("team", '"team"'),
+    ]
+    scheduler = ResourcesScheduler(resources, 2)
+    cancelled = False
+
+    async def process(resource: ResourceConfig, index: int) -> None:
+        nonlocal cancelled
+        if resource.kind == "service":
+            raise ValueError("failed")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+
+    with pytest.raises(ValueError):
+        await scheduler.run(process)
+    assert cancelled
+
+
+@pytest.mark.asyncio
+async def test_run_starts_longest_ready_resources_first() -> None:
+    resources = [
+        create_resource("service", '"service"'),
+        create_resource("team", '"team"'),
+        create_resource("repo", '"repo"'),
+        create_resource("user", '"user"'),
+    ]
+    scheduler = ResourcesScheduler(
+        resources, 1, {"repo": {"user"}}, {0: 1.0, 1: 5.0, 2: 10.0, 3: 2.0}
+    )
+    started: list[str] = []
+
+    async def process(resource: ResourceConfig, index: int) -> str:
+        started.append(resource.kind)
+        return resource.kind
+
+    results = await scheduler.run(process)
+
+    # repo is the longest but waits for user, which it relates to
+    assert started == ["team", "user", "repo", "service"]
+    assert results == ["service", "team", "repo", "user"]
@@ -1,6 +1,9 @@
 from typing import Any, AsyncGenerator
 import asyncio
-from port_ocean.utils.async_iterators import semaphore_async_iterator
+from port_ocean.utils.async_iterators import (
+    semaphore_async_iterator,
+    stream_async_iterators_isolated,
+)
 import pytest
 
 
@@ -43,3 +46,83 @@ async def test_semaphore_async_iterator() -> None:
         max_concurrent_tasks <= max_concurrency
     ), f"Max concurrent tasks {max_concurrent_tasks} exceeded semaphore limit {max_concurrency}"
     assert concurrent_tasks == 0, "Not all tasks have completed"
+
+
+@pytest.mark.asyncio
+async def test_stream_async_iterators_isolated_interleaves_and_isolates_errors() -> (
+    None
+):
+    running = 0
+    max_running = 0
+
+    async def numbers(start: int) -> AsyncGenerator[int, None]:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        for i in range(start, start + 3):
+            await asyncio.sleep(0.01)
+            yield i
+        running -= 1
+
+    async def failing() -> AsyncGenerator[int, None]:
+        yield -1
+        raise ValueError("failed")
+
+    results = [
+        result
+        async for result in stream_async_iterators_isolated(
+            [numbers(0), failing(), numbers(10), numbers(20)], max_concurrency=2
+        )
+    ]
+
+    items = [item for item, _ in results if item is not None]
+    errors = [error for _, error in results if error is not None]
+    assert sorted(items) == [-1, 0, 1, 2, 10, 11, 12, 20, 21, 22]
+    # The first iterators are interleaved rather than drained one after the other
+    assert items[:2] == [-1, 0] or items[:2] == [0, -1]
+    assert [str(error) for error in errors] == ["failed"]
+    assert max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_stream_async_iterators_isolated_iterates_sequentially() -> None:
+    async def numbers(start: int) -> AsyncGenerator[int, None]:
+        for i in range(start, start + 2):
+            await asyncio.sleep(0)
+            yield i
+
+    async def failing() -> AsyncGenerator[int, None]:
+        raise ValueError("failed")
+        yield 0
+
+    results = [
+        result
+        async for result in stream_async_iterators_isolated(
+            [numbers(0), failing(), numbers(10)], max_concurrency=1
+        )
+    ]
+
+    assert [item for item, _ in results] == [0, 1, None, 10, 11]
+    assert isinstance(results[2][1], ValueError)
+
+
+@pytest.mark.asyncio
+async def test_stream_async_iterators_isolated_stops_the_iterators_when_closed() -> (
+    None
+):
+    cancelled = asyncio.Event()
+
+    async def endless() -> AsyncGenerator[int, None]:
+        try:
+            while True:
+                await asyncio.sleep(0)
+                yield 1
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    stream = stream_async_iterators_isolated([endless(), endless()], max_concurrency=2)
+    assert await anext(stream) == (1, None)
+    await stream.aclose()
+
+    assert cancelled.is_set()
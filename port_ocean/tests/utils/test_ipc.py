@@ -0,0 +1,81 @@
+import multiprocessing
+import time
+from contextlib import aclosing
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from port_ocean.core.integrations.mixins.utils import ProcessWrapper
+from port_ocean.utils.ipc import PipeIPC
+
+
+def send_messages(ipc: PipeIPC, count: int) -> None:
+    for index in range(count):
+        ipc.send("item", index)
+
+
+def send_large_messages(ipc: PipeIPC) -> None:
+    for index in range(3):
+        ipc.send("item", str(index) * 5_000_000)
+
+
+def exit_with_error() -> None:
+    raise SystemExit(3)
+
+
+@pytest.mark.asyncio
+async def test_pipe_ipc_streams_messages_until_the_subprocess_exits() -> None:
+    ipc = PipeIPC()
+    process = multiprocessing.get_context("fork").Process(
+        target=send_messages, args=(ipc, 2000)
+    )
+    process.start()
+    ipc.close_sender()
+
+    messages = [message async for message in ipc.receive()]
+    process.join()
+
+    assert messages == [("item", index) for index in range(2000)]
+
+
+@pytest.mark.asyncio
+async def test_pipe_ipc_receives_large_messages_after_stopping_early() -> None:
+    ipc = PipeIPC()
+    process = multiprocessing.get_context("fork").Process(
+        target=send_large_messages, args=(ipc,)
+    )
+    process.start()
+    ipc.close_sender()
+
+    async with aclosing(ipc.receive()) as received:
+        async for message in received:
+            assert message == ("item", "0" * 5_000_000)
+            break
+    remaining = [message async for message in ipc.receive()]
+    process.join()
+
+    assert remaining == [("item", str(index) * 5_000_000) for index in (1, 2)]
+
+
+@pytest.mark.asyncio
+async def test_pipe_ipc_ends_when_the_subprocess_fails() -> None:
+    ipc = PipeIPC()
+    process = multiprocessing.get_context("fork").Process(target=exit_with_error)
+    process.start()
+    ipc.close_sender()
+
+    assert [message async for message in ipc.receive()] == []
+    process.join()
+    assert process.exitcode == 3
+
+
+@pytest.mark.asyncio
+async def test_process_wrapper_join_async_returns_once_the_process_exits() -> None:
+    process = ProcessWrapper(target=time.sleep, args=(0.1,))
+    with patch("port_ocean.core.integrations.mixins.utils.ocean", MagicMock()):
+        start = time.monotonic()
+        process.start()
+        await process.join_async()
+
+    assert process.exitcode == 0
+    assert time.monotonic() - start < 1
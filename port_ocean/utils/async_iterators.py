@@ -1,3 +1,4 @@
+import asyncio
 import typing
 
 import aiostream
@@ -52,6 +53,69 @@ async def stream_async_iterators_tasks(
             yield batch_items
 
 
+T = typing.TypeVar("T")
+
+_ITERATOR_DONE = object()
+
+
+async def stream_async_iterators_isolated(
+    iterators: typing.Sequence[typing.AsyncIterator[T]],
+    max_concurrency: int,
+) -> typing.AsyncGenerator[tuple[T | None, Exception | None], None]:
+    """
+    Streams the items of async iterators as they are available, like `stream_async_iterators_tasks`, while an iterator
+    that raises doesn't stop the others.
+
+    Up to `max_concurrency` iterators are iterated at the same time, the rest start as the running ones finish. The
+    items wait for the consumer in a queue bounded by `max_concurrency`, so the iterators don't run far ahead of it,
+    and the iterators waiting to queue an item are served in turn, so a fast iterator doesn't starve the slow ones.
+
+    Yields `(item, None)` for the items and `(None, error)` for an iterator that raised, once it stopped.
+    With a `max_concurrency` of 1 the iterators are iterated one after the other in the consuming task.
+
+    :param iterators: The async iterators to stream
+    :param max_concurrency: The maximum number of iterators iterated at the same time
+    :return: A stream of the items and the errors of the iterators
+    """
+    if max_concurrency <= 1 or len(iterators) <= 1:
+        for iterator in iterators:
+            error: Exception | None = None
+            try:
+                async for item in iterator:
+                    yield item, None
+            except Exception as iterator_error:
+                error = iterator_error
+            if error is not None:
+                yield None, error
+        return
+
+    queue: asyncio.Queue[typing.Any] = asyncio.Queue(maxsize=max_concurrency)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def produce(iterator: typing.AsyncIterator[T]) -> None:
+        async with semaphore:
+            try:
+                async for item in iterator:
+                    await queue.put((item, None))
+            except Exception as error:
+                await queue.put((None, error))
+            await queue.put(_ITERATOR_DONE)
+
+    tasks = [asyncio.create_task(produce(iterator)) for iterator in iterators]
+    running = len(tasks)
+    try:
+        while running:
+            message = await queue.get()
+            if message is _ITERATOR_DONE:
+                running -= 1
+                continue
+            yield message
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
 async def semaphore_async_iterator(
     semaphore: "Semaphore",
     function: typing.Callable[[], typing.AsyncIterator[typing.Any]],
@@ -1,30 +1,95 @@
-import pickle
+import asyncio
 import os
-from typing import Any
-
-
-class FileIPC:
-    def __init__(self, process_id: str, name: str, default_return: Any = None):
-        self.process_id = process_id
-        self.name = name
-        self.dir_path = f"/tmp/ocean/processes/p_{self.process_id}"
-        self.file_path = f"{self.dir_path}/{self.name}.pkl"
-        self.default_return = default_return
-        os.makedirs(self.dir_path, exist_ok=True)
-
-    def __del__(self) -> None:
-        self.delete()
-
-    def save(self, object: Any) -> None:
-        with open(self.file_path, "wb") as f:
-            pickle.dump(object, f)
-
-    def load(self) -> Any:
-        if not os.path.exists(self.file_path):
-            return self.default_return
-        with open(self.file_path, "rb") as f:
-            return pickle.load(f)
-
-    def delete(self) -> None:
-        if os.path.exists(self.file_path):
-            os.remove(self.file_path)
+import pickle
+import struct
+from typing import Any, AsyncGenerator
+
+# Each message is the length of its pickle followed by the pickle
+MESSAGE_HEADER = struct.Struct("<Q")
+READ_CHUNK_SIZE = 1024 * 1024
+
+
+class PipeIPC:
+    """Streams messages from one process to another over a pipe.
+
+    The sending process sends `(tag, value)` messages as it produces them and the receiving process receives them
+    while they are still being produced, so a large result is never held in a single pickle on either side.
+    Each process closes its copy of the end it doesn't use once the other process started, so the pipe reaches its
+    end as soon as the sending process exits, whether it finished or crashed.
+    """
+
+    def __init__(self) -> None:
+        receiver, sender = os.pipe()
+        self._receiver = open(receiver, "rb", buffering=0)
+        self._sender = open(sender, "wb")
+        # The bytes that were read from the pipe and weren't received yet, kept when the iteration is stopped early
+        self._buffer = bytearray()
+        self._position = 0
+
+    def send(self, tag: str, value: Any) -> None:
+        payload = pickle.dumps((tag, value), protocol=pickle.HIGHEST_PROTOCOL)
+        self._sender.write(MESSAGE_HEADER.pack(len(payload)))
+        self._sender.write(payload)
+        self._sender.flush()
+
+    def close_sender(self) -> None:
+        self._sender.close()
+
+    def close_receiver(self) -> None:
+        self._receiver.close()
+
+    def _next_message(self) -> tuple[str, Any] | None:
+        """Unpickle the next message from the buffer, if all of its bytes were read"""
+        payload_start = self._position + MESSAGE_HEADER.size
+        if len(self._buffer) < payload_start:
+            return None
+        (length,) = MESSAGE_HEADER.unpack_from(self._buffer, self._position)
+        if len(self._buffer) < payload_start + length:
+            return None
+        with memoryview(self._buffer)[
+            payload_start : payload_start + length
+        ] as payload:
+            message = pickle.loads(payload)
+        self._position = payload_start + length
+        return message
+
+    def _read_chunk(self) -> bytes | None:
+        """Read the bytes available in the pipe without blocking, None when there are none yet and b"" at its end"""
+        chunk = self._receiver.read(READ_CHUNK_SIZE)
+        if chunk:
+            del self._buffer[: self._position]
+            self._position = 0
+            self._buffer += chunk
+        return chunk
+
+    async def receive(self) -> AsyncGenerator[tuple[str, Any], None]:
+        """
+        Receive the messages until the sending end is closed.
+        The receiver stays open when the iteration is stopped early, so the following messages can be received later.
+        """
+        # The pipe is read without blocking when the event loop reports it is readable, rather than from a thread, as
+        # the resource subprocesses are forked and forking a multi-threaded process may deadlock the child.
+        # A chunk is only read once the buffered messages were received, so a slow receiver still holds back the sender
+        loop = asyncio.get_running_loop()
+        file_descriptor = self._receiver.fileno()
+        os.set_blocking(file_descriptor, False)
+        readable = asyncio.Event()
+        loop.add_reader(file_descriptor, readable.set)
+        ended = False
+        try:
+            while True:
+                message = self._next_message()
+                if message is not None:
+                    yield message
+                    continue
+                chunk = self._read_chunk()
+                if chunk is None:
+                    readable.clear()
+                    await readable.wait()
+                elif not chunk:
+                    ended = True
+                    break
+        finally:
+            loop.remove_reader(file_descriptor)
+            if ended:
+                self._receiver.close()
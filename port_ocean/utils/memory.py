@@ -0,0 +1,13 @@
+import os
+
+
+def get_rss_bytes(pid: int | None = None) -> int | None:
+    """
+    Get the resident set size of a process, the current process by default.
+    Returns None when it can't be read, e.g. the process exited or the platform has no /proc.
+    """
+    try:
+        with open(f"/proc/{pid or 'self'}/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
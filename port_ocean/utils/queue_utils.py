@@ -1,9 +1,13 @@
 import asyncio
+import time
 from asyncio import Queue, Task
-from typing import Any, TypeVar, Callable, Coroutine
+from typing import Any, Generic, TypeVar, Callable, Coroutine
 
 from loguru import logger
 
+from port_ocean.context.ocean import ocean
+from port_ocean.helpers.metric.metric import MetricType
+
 T = TypeVar("T")
 
 
@@ -86,3 +90,46 @@ async def process_in_queue(
         raise ExceptionGroup("Error processing tasks", errors)
 
     return processing_results
+
+
+class StageQueue(Generic[T]):
+    """
+    A bounded queue connecting two stages of a pipeline.
+    Once the queue is full the producing stage waits for the consuming stage to catch up (backpressure).
+
+    The queue depth is reported under the consuming stage phase, and the time each stage spends waiting on the
+    queue is reported under the waiting stage phase.
+
+    :param producer_phase: The metric phase of the stage putting items into the queue
+    :param consumer_phase: The metric phase of the stage getting items from the queue
+    :param maxsize: The maximum number of items waiting in the queue
+    """
+
+    def __init__(self, producer_phase: str, consumer_phase: str, maxsize: int) -> None:
+        self.producer_phase = producer_phase
+        self.consumer_phase = consumer_phase
+        self._queue: Queue[T] = Queue(maxsize=maxsize)
+
+    def _report(self, phase: str, waited_seconds: float) -> None:
+        kind = ocean.metrics.current_resource_kind()
+        ocean.metrics.inc_metric(
+            name=MetricType.QUEUE_WAIT_NAME,
+            labels=[kind, phase],
+            value=waited_seconds,
+        )
+        ocean.metrics.set_metric(
+            name=MetricType.QUEUE_SIZE_NAME,
+            labels=[kind, self.consumer_phase],
+            value=self._queue.qsize(),
+        )
+
+    async def put(self, item: T) -> None:
+        start = time.monotonic()
+        await self._queue.put(item)
+        self._report(self.producer_phase, time.monotonic() - start)
+
+    async def get(self) -> T:
+        start = time.monotonic()
+        item = await self._queue.get()
+        self._report(self.consumer_phase, time.monotonic() - start)
+        return item